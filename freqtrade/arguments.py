@@ -10,6 +10,18 @@ import arrow
 from freqtrade import __version__, constants
 
 
+def check_int_positive(value: str) -> int:
+    try:
+        uint = int(value)
+        if uint <= 0:
+            raise ValueError
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"{value} is invalid for this parameter, should be a positive integer value"
+        )
+    return uint
+
+
 class TimeRange(NamedTuple):
     """
     NamedTuple Defining timerange inputs.
@@ -161,6 +173,21 @@ class Arguments(object):
             dest='use_max_market_positions',
             default=True
         )
+        parser.add_argument(
+            '--backtest-engine',
+            help='Select the backtest engine. `vectorized` finds exits with array scans '
+                 'instead of looping every candle '
+                 f'(default: {constants.DEFAULT_BACKTEST_ENGINE}).',
+            choices=constants.BACKTEST_ENGINES,
+            dest='backtest_engine',
+        )
+        parser.add_argument(
+            '--indicator-cache',
+            help='Store the populated indicators on disk and reuse them for identical strategy '
+                 'code and data, also across the strategies of --strategy-list.',
+            action='store_true',
+            dest='indicator_cache',
+        )
         parser.add_argument(
             '-l', '--live',
             help='Use live data.',
@@ -184,6 +211,15 @@ class Arguments(object):
             nargs='+',
             dest='strategy_list',
         )
+        parser.add_argument(
+            '--strategy-workers',
+            help='Number of processes used to backtest the strategies of --strategy-list '
+                 'concurrently (default: 1).',
+            default=None,
+            type=check_int_positive,
+            metavar='INT',
+            dest='strategy_workers',
+        )
         parser.add_argument(
             '--export',
             help='Export backtest results, argument are: trades. '
@@ -263,6 +299,24 @@ class Arguments(object):
             dest='stake_amount',
         )
 
+        parser.add_argument(
+            '--data-load-workers',
+            help='Number of processes used to load the ticker data of the pairs '
+                 'concurrently (default: 1).',
+            default=None,
+            type=check_int_positive,
+            metavar='INT',
+            dest='data_load_workers',
+        )
+
+        parser.add_argument(
+            '--ticker-data-cache',
+            help='Store a binary copy of the ticker data next to the json files and '
+                 'load it instead of parsing the json files on the following runs.',
+            action='store_true',
+            dest='ticker_data_cache',
+        )
+
     @staticmethod
     def hyperopt_options(parser: argparse.ArgumentParser) -> None:
         """
@@ -292,6 +346,14 @@ class Arguments(object):
             dest='use_max_market_positions',
             default=True
         )
+        parser.add_argument(
+            '--backtest-engine',
+            help='Select the backtest engine. `vectorized` finds exits with array scans '
+                 'instead of looping every candle '
+                 f'(default: {constants.DEFAULT_BACKTEST_ENGINE}).',
+            choices=constants.BACKTEST_ENGINES,
+            dest='backtest_engine',
+        )
         parser.add_argument(
             '-e', '--epochs',
             help='Specify number of epochs (default: %(default)d).',
@@ -300,6 +362,61 @@ class Arguments(object):
             type=int,
             metavar='INT',
         )
+        parser.add_argument(
+            '--scheduler',
+            help='Select how epochs are distributed over the CPU cores. `batch` evaluates one '
+                 'point per core and waits for all of them, `async` asks for a new point as soon '
+                 'as a core is free, `distributed` queues the points for hyperopt --worker '
+                 'processes sharing the --trials-file '
+                 f'(default: {constants.DEFAULT_HYPEROPT_SCHEDULER}).',
+            choices=constants.HYPEROPT_SCHEDULERS,
+            dest='hyperopt_scheduler',
+        )
+        parser.add_argument(
+            '--batch-size',
+            help='Number of points asked per CPU core at a time by the batch scheduler. '
+                 'With --spaces roi stoploss, they are evaluated in one pass over the '
+                 'buy signals (default: 1).',
+            default=None,
+            type=check_int_positive,
+            metavar='INT',
+            dest='hyperopt_batch_size',
+        )
+        parser.add_argument(
+            '--halving-rungs',
+            help='Successive halving: backtest the points on growing parts of the timerange '
+                 'in this many rungs, promoting the best third of them to the next rung. '
+                 '1 backtests every point on the whole timerange (default: 1).',
+            default=None,
+            type=check_int_positive,
+            metavar='INT',
+            dest='hyperopt_halving_rungs',
+        )
+        parser.add_argument(
+            '--optimizer-history',
+            help='Keep at most this many evaluated points in the optimizer: the best half '
+                 'and the most recent ones. Limits the time the optimizer needs to refit '
+                 'its model after every evaluation (default: unlimited).',
+            default=None,
+            type=check_int_positive,
+            metavar='INT',
+            dest='hyperopt_optimizer_history',
+        )
+        parser.add_argument(
+            '--trials-file',
+            help='Store the evaluations in this SQLite file. Use a file on a shared disk for '
+                 'distributed hyperopt (default: user_data/hyperopt_results.sqlite).',
+            default=None,
+            metavar='PATH',
+            dest='hyperopt_trials_file',
+        )
+        parser.add_argument(
+            '--worker',
+            help='Evaluate the points queued in --trials-file by a hyperopt using '
+                 '--scheduler distributed, on all CPU cores.',
+            action='store_true',
+            dest='hyperopt_worker',
+        )
         parser.add_argument(
             '-s', '--spaces',
             help='Specify which parameters to hyperopt. Space separate list. \
@@ -252,10 +252,38 @@ class Configuration(object):
             config.update({'refresh_pairs': True})
             logger.info('Parameter -r/--refresh-pairs-cached detected ...')
 
+        # If --data-load-workers is used we add it to the configuration
+        if 'data_load_workers' in self.args and self.args.data_load_workers:
+            config.update({'data_load_workers': self.args.data_load_workers})
+            logger.info('Parameter --data-load-workers detected: %s ...',
+                        self.args.data_load_workers)
+
+        # If --ticker-data-cache is used we add it to the configuration
+        if 'ticker_data_cache' in self.args and self.args.ticker_data_cache:
+            config.update({'ticker_data_cache': True})
+            logger.info('Parameter --ticker-data-cache detected ...')
+
+        # If --backtest-engine is used we add it to the configuration
+        if 'backtest_engine' in self.args and self.args.backtest_engine:
+            config.update({'backtest_engine': self.args.backtest_engine})
+            logger.info('Parameter --backtest-engine detected: %s ...',
+                        self.args.backtest_engine)
+
+        # If --indicator-cache is used we add it to the configuration
+        if 'indicator_cache' in self.args and self.args.indicator_cache:
+            config.update({'indicator_cache': True})
+            logger.info('Parameter --indicator-cache detected ...')
+
         if 'strategy_list' in self.args and self.args.strategy_list:
             config.update({'strategy_list': self.args.strategy_list})
             logger.info('Using strategy list of %s Strategies', len(self.args.strategy_list))
 
+        # If --strategy-workers is used we add it to the configuration
+        if 'strategy_workers' in self.args and self.args.strategy_workers:
+            config.update({'strategy_workers': self.args.strategy_workers})
+            logger.info('Parameter --strategy-workers detected: %s ...',
+                        self.args.strategy_workers)
+
         if 'ticker_interval' in self.args and self.args.ticker_interval:
             config.update({'ticker_interval': self.args.ticker_interval})
             logger.info('Overriding ticker interval with Command line argument')
@@ -314,6 +342,40 @@ class Configuration(object):
             logger.info('Parameter --epochs detected ...')
             logger.info('Will run Hyperopt with for %s epochs ...', config.get('epochs'))
 
+        # If --scheduler is used we add it to the configuration
+        if 'hyperopt_scheduler' in self.args and self.args.hyperopt_scheduler:
+            config.update({'hyperopt_scheduler': self.args.hyperopt_scheduler})
+            logger.info('Parameter --scheduler detected: %s ...', self.args.hyperopt_scheduler)
+
+        # If --batch-size is used we add it to the configuration
+        if 'hyperopt_batch_size' in self.args and self.args.hyperopt_batch_size:
+            config.update({'hyperopt_batch_size': self.args.hyperopt_batch_size})
+            logger.info('Parameter --batch-size detected: %s ...',
+                        self.args.hyperopt_batch_size)
+
+        # If --halving-rungs is used we add it to the configuration
+        if 'hyperopt_halving_rungs' in self.args and self.args.hyperopt_halving_rungs:
+            config.update({'hyperopt_halving_rungs': self.args.hyperopt_halving_rungs})
+            logger.info('Parameter --halving-rungs detected: %s ...',
+                        self.args.hyperopt_halving_rungs)
+
+        # If --optimizer-history is used we add it to the configuration
+        if 'hyperopt_optimizer_history' in self.args and self.args.hyperopt_optimizer_history:
+            config.update({'hyperopt_optimizer_history': self.args.hyperopt_optimizer_history})
+            logger.info('Parameter --optimizer-history detected: %s ...',
+                        self.args.hyperopt_optimizer_history)
+
+        # If --trials-file is used we add it to the configuration
+        if 'hyperopt_trials_file' in self.args and self.args.hyperopt_trials_file:
+            config.update({'hyperopt_trials_file': self.args.hyperopt_trials_file})
+            logger.info('Parameter --trials-file detected: %s ...',
+                        self.args.hyperopt_trials_file)
+
+        # If --worker is used we add it to the configuration
+        if 'hyperopt_worker' in self.args and self.args.hyperopt_worker:
+            config.update({'hyperopt_worker': True})
+            logger.info('Parameter --worker detected ...')
+
         # If --spaces is used we add it to the configuration
         if 'spaces' in self.args and self.args.spaces:
             config.update({'spaces': self.args.spaces})
@@ -6,6 +6,7 @@ bot constants
 DEFAULT_CONFIG = 'config.json'
 DYNAMIC_WHITELIST = 20  # pairs
 PROCESS_THROTTLE_SECS = 5  # sec
+PROCESS_TIMINGS_WINDOW = 100  # iterations
 DEFAULT_TICKER_INTERVAL = 5  # min
 HYPEROPT_EPOCH = 100  # epochs
 RETRY_TIMEOUT = 30  # sec
@@ -20,6 +21,12 @@ REQUIRED_ORDERTYPES = ['buy', 'sell', 'stoploss', 'stoploss_on_exchange']
 ORDERTYPE_POSSIBILITIES = ['limit', 'market']
 ORDERTIF_POSSIBILITIES = ['gtc', 'fok', 'ioc']
 AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList']
+BACKTEST_ENGINES = ['loop', 'vectorized']
+DEFAULT_BACKTEST_ENGINE = 'loop'
+HYPEROPT_SCHEDULERS = ['batch', 'async', 'distributed']
+DEFAULT_HYPEROPT_SCHEDULER = 'batch'
+HYPEROPT_HALVING_ETA = 3  # share of points promoted to the next rung is 1 / eta
+DEFAULT_INDICATOR_CACHE_DIR = 'user_data/indicator_cache'
 DRY_RUN_WALLET = 999.9
 
 TICKER_INTERVALS = [
@@ -51,7 +58,22 @@ CONF_SCHEMA = {
         'fiat_display_currency': {'type': 'string', 'enum': SUPPORTED_FIAT},
         'dry_run': {'type': 'boolean'},
         'dry_run_wallet': {'type': 'number'},
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES},
+        'hyperopt_scheduler': {'type': 'string', 'enum': HYPEROPT_SCHEDULERS},
+        'hyperopt_batch_size': {'type': 'integer', 'minimum': 1},
+        'hyperopt_halving_rungs': {'type': 'integer', 'minimum': 1},
+        'hyperopt_trials_file': {'type': 'string'},
+        'hyperopt_optimizer_history': {'type': 'integer', 'minimum': 1},
+        'hyperopt_worker': {'type': 'boolean'},
+        'indicator_cache': {'type': 'boolean'},
+        'indicator_cache_dir': {'type': 'string'},
+        'data_load_workers': {'type': 'integer', 'minimum': 1},
+        'ticker_data_cache': {'type': 'boolean'},
+        'signal_workers': {'type': 'integer', 'minimum': 1},
+        'strategy_workers': {'type': 'integer', 'minimum': 1},
         'process_only_new_candles': {'type': 'boolean'},
+        'incremental_analysis': {'type': 'boolean'},
+        'startup_candle_count': {'type': 'integer', 'minimum': 0},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -154,6 +176,7 @@ CONF_SCHEMA = {
                 'webhookbuy': {'type': 'object'},
                 'webhooksell': {'type': 'object'},
                 'webhookstatus': {'type': 'object'},
+                'webhookperf': {'type': 'object'},
             },
         },
         'db_url': {'type': 'string'},
@@ -165,6 +188,11 @@ CONF_SCHEMA = {
                 'process_throttle_secs': {'type': 'number'},
                 'interval': {'type': 'integer'},
                 'sd_notify': {'type': 'boolean'},
+                'perf_window': {'type': 'integer', 'minimum': 1},
+                'perf_report_every': {'type': 'integer', 'minimum': 0},
+                'perf_dump_file': {'type': 'string'},
+                'db_batch_commit': {'type': 'boolean'},
+                'archive_after_days': {'type': 'integer', 'minimum': 1},
             }
         }
     },
@@ -196,6 +224,7 @@ CONF_SCHEMA = {
                 },
                 'outdated_offset': {'type': 'integer', 'minimum': 1},
                 'markets_refresh_interval': {'type': 'integer'},
+                'tickers_ttl': {'type': 'number', 'minimum': 0},
                 'ccxt_config': {'type': 'object'},
                 'ccxt_async_config': {'type': 'object'}
             },
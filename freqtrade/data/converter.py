@@ -2,6 +2,9 @@
 Functions to convert data from one format to another
 """
 import logging
+from typing import Union
+
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, to_datetime
 from freqtrade.misc import timeframe_to_minutes
@@ -10,11 +13,12 @@ from freqtrade.misc import timeframe_to_minutes
 logger = logging.getLogger(__name__)
 
 
-def parse_ticker_dataframe(ticker: list, ticker_interval: str,
+def parse_ticker_dataframe(ticker: Union[list, np.ndarray], ticker_interval: str,
                            fill_missing: bool = True) -> DataFrame:
     """
     Converts a ticker-list (format ccxt.fetch_ohlcv) to a Dataframe
     :param ticker: ticker list, as returned by exchange.async_get_candle_history
+                   (or a numpy array with the same columns)
     :param ticker_interval: ticker_interval (e.g. 5m). Used to fill up eventual missing data
     :param fill_missing: fill up missing candles with 0 candles
                          (see ohlcv_fill_up_missing_data for details)
@@ -36,13 +40,15 @@ def parse_ticker_dataframe(ticker: list, ticker_interval: str,
                                 'volume': 'float'})
 
     # group by index and aggregate results to eliminate duplicate ticks
-    frame = frame.groupby(by='date', as_index=False, sort=True).agg({
-        'open': 'first',
-        'high': 'max',
-        'low': 'min',
-        'close': 'last',
-        'volume': 'max',
-    })
+    # (skipped for sorted data without duplicates, e.g. loaded from the binary cache)
+    if not (frame['date'].is_monotonic_increasing and frame['date'].is_unique):
+        frame = frame.groupby(by='date', as_index=False, sort=True).agg({
+            'open': 'first',
+            'high': 'max',
+            'low': 'min',
+            'close': 'last',
+            'volume': 'max',
+        })
     frame.drop(frame.tail(1).index, inplace=True)     # eliminate partial candle
     logger.debug('Dropping last candle')
 
@@ -6,10 +6,15 @@ includes:
 """
 
 import logging
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Union
 
 import arrow
+import numpy as np
 from pandas import DataFrame
 
 from freqtrade import misc, OperationalException
@@ -22,11 +27,30 @@ from freqtrade.misc import timeframe_to_minutes
 logger = logging.getLogger(__name__)
 
 
+def _bisect_date(tickerlist: Union[List, np.ndarray], date_ms: float, right: bool) -> int:
+    """
+    Binary search for a date (in ms) in a tickerlist sorted by date.
+    :param right: return the index after equal dates instead of the index of the first equal date
+    :return: insertion index of date_ms
+    """
+    if isinstance(tickerlist, np.ndarray):
+        return int(np.searchsorted(tickerlist[:, 0], date_ms, side='right' if right else 'left'))
+    low, high = 0, len(tickerlist)
+    while low < high:
+        mid = (low + high) // 2
+        if tickerlist[mid][0] < date_ms or (right and tickerlist[mid][0] == date_ms):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
 def trim_tickerlist(tickerlist: List[Dict], timerange: TimeRange) -> List[Dict]:
     """
     Trim tickerlist based on given timerange
+    Works on lists and numpy arrays (as loaded from the binary cache) sorted by date.
     """
-    if not tickerlist:
+    if len(tickerlist) == 0:
         return tickerlist
 
     start_index = 0
@@ -37,18 +61,14 @@ def trim_tickerlist(tickerlist: List[Dict], timerange: TimeRange) -> List[Dict]:
     if timerange.starttype == 'index':
         start_index = timerange.startts
     elif timerange.starttype == 'date':
-        while (start_index < len(tickerlist) and
-               tickerlist[start_index][0] < timerange.startts * 1000):
-            start_index += 1
+        start_index = _bisect_date(tickerlist, timerange.startts * 1000, right=False)
 
     if timerange.stoptype == 'line':
         start_index = len(tickerlist) + timerange.stopts
     if timerange.stoptype == 'index':
         stop_index = timerange.stopts
     elif timerange.stoptype == 'date':
-        while (stop_index > 0 and
-               tickerlist[stop_index-1][0] > timerange.stopts * 1000):
-            stop_index -= 1
+        stop_index = _bisect_date(tickerlist, timerange.stopts * 1000, right=True)
 
     if start_index > stop_index:
         raise ValueError(f'The timerange [{timerange.startts},{timerange.stopts}] is incorrect')
@@ -78,35 +98,117 @@ def load_tickerdata_file(
     return pairdata
 
 
+def _tickerdata_source_file(path: Path, pair: str, ticker_interval: str) -> Optional[Path]:
+    """
+    Return the json file load_tickerdata_file() would read (.json.gz is preferred)
+    :return: Path, or None if no file exists
+    """
+    pair_s = pair.replace('/', '_')
+    file = path.joinpath(f'{pair_s}-{ticker_interval}.json')
+    gzipfile = file.with_suffix(file.suffix + '.gz')
+    if gzipfile.is_file():
+        return gzipfile
+    if file.is_file():
+        return file
+    return None
+
+
+def tickerdata_cache_file(datadir: Optional[Path], pair: str, ticker_interval: str) -> Path:
+    """Return the path of the binary cache belonging to a pair's json file"""
+    pair_s = pair.replace('/', '_')
+    return make_testdata_path(datadir).joinpath(f'{pair_s}-{ticker_interval}.npy')
+
+
+def load_cached_tickerdata(datadir: Optional[Path], pair: str,
+                           ticker_interval: str,
+                           timerange: Optional[TimeRange] = None) -> Optional[np.ndarray]:
+    """
+    Load a pair from the binary cache (.npy) next to the json file.
+    The cache holds the ticker as float64 array with the columns of ccxt.fetch_ohlcv
+    (date in ms, open, high, low, close, volume) and is memory-mapped when loaded.
+    A missing or outdated cache (older than the json file) is rebuilt from the json file.
+    :return: numpy array or None if unsuccesful
+    """
+    source = _tickerdata_source_file(make_testdata_path(datadir), pair, ticker_interval)
+    if not source:
+        return None
+
+    cache = tickerdata_cache_file(datadir, pair, ticker_interval)
+    if cache.is_file() and cache.stat().st_mtime >= source.stat().st_mtime:
+        logger.debug('Loading ticker data from cache %s', cache)
+        pairdata = np.load(cache, mmap_mode='r')
+    else:
+        tickerlist = load_tickerdata_file(datadir, pair, ticker_interval)
+        if not tickerlist:
+            return None
+        pairdata = np.array([tick[:6] for tick in tickerlist], dtype=np.float64)
+        store_tickerdata_cache(cache, pairdata)
+
+    if timerange:
+        pairdata = trim_tickerlist(pairdata, timerange)
+    return pairdata
+
+
+def store_tickerdata_cache(cache: Path, pairdata: np.ndarray) -> None:
+    """
+    Write the binary cache for a pair.
+    The file is written to a temporary file first, so concurrent readers never see partial data.
+    Failing to write the cache is not fatal - the json file is used again on the next load.
+    """
+    tmpfile = cache.with_suffix(f'.{uuid.uuid4().hex}.tmp')
+    try:
+        with open(tmpfile, 'wb') as fp:
+            np.save(fp, pairdata)
+        tmpfile.replace(cache)
+        logger.debug('Stored ticker data cache %s', cache)
+    except OSError as e:
+        logger.warning('Could not store ticker data cache %s: %s', cache, e)
+        if tmpfile.is_file():
+            tmpfile.unlink()
+
+
+def _refresh_pair_history(pair: str, ticker_interval: str, datadir: Optional[Path],
+                          timerange: TimeRange, exchange: Optional[Exchange]) -> None:
+    """
+    Download the latest ticker data for the pair (used with refresh_pairs=True)
+    """
+    if not exchange:
+        raise OperationalException("Exchange needs to be initialized when "
+                                   "calling load_data with refresh_pairs=True")
+
+    logger.info('Download data for pair and store them in %s', datadir)
+    download_pair_history(datadir=datadir,
+                          exchange=exchange,
+                          pair=pair,
+                          ticker_interval=ticker_interval,
+                          timerange=timerange)
+
+
 def load_pair_history(pair: str,
                       ticker_interval: str,
                       datadir: Optional[Path],
                       timerange: TimeRange = TimeRange(None, None, 0, 0),
                       refresh_pairs: bool = False,
                       exchange: Optional[Exchange] = None,
-                      fill_up_missing: bool = True
+                      fill_up_missing: bool = True,
+                      cache: bool = False
                       ) -> DataFrame:
     """
     Loads cached ticker history for the given pair.
+    :param cache: load the pair through the binary cache (.npy), which is written to datadir
     :return: DataFrame with ohlcv data
     """
 
     # If the user force the refresh of pairs
     if refresh_pairs:
-        if not exchange:
-            raise OperationalException("Exchange needs to be initialized when "
-                                       "calling load_data with refresh_pairs=True")
-
-        logger.info('Download data for pair and store them in %s', datadir)
-        download_pair_history(datadir=datadir,
-                              exchange=exchange,
-                              pair=pair,
-                              ticker_interval=ticker_interval,
-                              timerange=timerange)
+        _refresh_pair_history(pair, ticker_interval, datadir, timerange, exchange)
 
-    pairdata = load_tickerdata_file(datadir, pair, ticker_interval, timerange=timerange)
+    if cache:
+        pairdata = load_cached_tickerdata(datadir, pair, ticker_interval, timerange=timerange)
+    else:
+        pairdata = load_tickerdata_file(datadir, pair, ticker_interval, timerange=timerange)
 
-    if pairdata:
+    if pairdata is not None and len(pairdata) > 0:
         if timerange.starttype == 'date' and pairdata[0][0] > timerange.startts * 1000:
             logger.warning('Missing data at start for pair %s, data starts at %s',
                            pair, arrow.get(pairdata[0][0] // 1000).strftime('%Y-%m-%d %H:%M:%S'))
@@ -122,27 +224,66 @@ def load_pair_history(pair: str,
         return None
 
 
+def _timed_load_pair_history(pair: str, **kwargs) -> Tuple[Optional[DataFrame], float]:
+    """
+    Run load_pair_history() and measure how long it took
+    :return: Tuple of (DataFrame or None, duration in seconds)
+    """
+    start = time.perf_counter()
+    hist = load_pair_history(pair=pair, **kwargs)
+    return hist, time.perf_counter() - start
+
+
 def load_data(datadir: Optional[Path],
               ticker_interval: str,
               pairs: List[str],
               refresh_pairs: bool = False,
               exchange: Optional[Exchange] = None,
               timerange: TimeRange = TimeRange(None, None, 0, 0),
-              fill_up_missing: bool = True) -> Dict[str, DataFrame]:
+              fill_up_missing: bool = True,
+              workers: int = 1,
+              cache: bool = False) -> Dict[str, DataFrame]:
     """
     Loads ticker history data for a list of pairs the given parameters
+    :param workers: number of processes used to load and parse the pairs concurrently
+    :param cache: load the pairs through the binary cache (.npy), which is written to datadir
     :return: dict(<pair>:<tickerlist>)
     """
     result = {}
-
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, ticker_interval=ticker_interval,
-                                 datadir=datadir, timerange=timerange,
-                                 refresh_pairs=refresh_pairs,
-                                 exchange=exchange,
-                                 fill_up_missing=fill_up_missing)
+    start = time.perf_counter()
+    workers = max(1, min(workers, len(pairs)))
+
+    if workers > 1:
+        # The exchange can't be shared with worker processes - download first, then load
+        if refresh_pairs:
+            for pair in pairs:
+                _refresh_pair_history(pair, ticker_interval, datadir, timerange, exchange)
+        load = partial(_timed_load_pair_history, ticker_interval=ticker_interval,
+                       datadir=datadir, timerange=timerange, fill_up_missing=fill_up_missing,
+                       cache=cache)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() returns results in the order of pairs
+            loaded = list(executor.map(load, pairs))
+    else:
+        loaded = [_timed_load_pair_history(pair=pair, ticker_interval=ticker_interval,
+                                           datadir=datadir, timerange=timerange,
+                                           refresh_pairs=refresh_pairs,
+                                           exchange=exchange,
+                                           fill_up_missing=fill_up_missing,
+                                           cache=cache)
+                  for pair in pairs]
+
+    for pair, (hist, duration) in zip(pairs, loaded):
+        logger.debug('Loaded data for pair %s in %.3f seconds', pair, duration)
         if hist is not None:
             result[pair] = hist
+
+    if loaded:
+        slowest_pair, (_, slowest) = max(zip(pairs, loaded), key=lambda x: x[1][1])
+        logger.info('Loaded data for %s pairs in %.2f seconds using %s worker(s), '
+                    'slowest pair: %s (%.2f seconds)',
+                    len(pairs), time.perf_counter() - start, workers,
+                    slowest_pair, slowest)
     return result
 
 
@@ -2,12 +2,11 @@
 """ Edge positioning package """
 import logging
 from pathlib import Path
-from typing import Any, Dict, NamedTuple
+from typing import Any, Dict, List, NamedTuple
 
 import arrow
 import numpy as np
-import utils_find_1st as utf1st
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade import constants, OperationalException
 from freqtrade.arguments import Arguments
@@ -105,7 +104,9 @@ class Edge():
             ticker_interval=self.ticker_interval,
             refresh_pairs=self._refresh_pairs,
             exchange=self.exchange,
-            timerange=self._timerange
+            timerange=self._timerange,
+            workers=self.config.get('data_load_workers', 1),
+            cache=self.config.get('ticker_data_cache', False)
         )
 
         if not data:
@@ -126,7 +127,7 @@ class Edge():
         )
         headers = ['date', 'buy', 'open', 'close', 'sell', 'high', 'low']
 
-        trades: list = []
+        trades: List[DataFrame] = []
         for pair, pair_data in preprocessed.items():
             # Sorting dataframe by date and reset index
             pair_data = pair_data.sort_values(by=['date'])
@@ -135,14 +136,16 @@ class Edge():
             ticker_data = self.advise_sell(
                 self.advise_buy(pair_data, {'pair': pair}), {'pair': pair})[headers].copy()
 
-            trades += self._find_trades_for_stoploss_range(ticker_data, pair, self._stoploss_range)
+            trades.append(
+                self._find_trades_for_stoploss_range(ticker_data, pair, self._stoploss_range))
 
+        trades_df = concat(trades, ignore_index=True) if trades else DataFrame()
         # If no trade found then exit
-        if len(trades) == 0:
+        if trades_df.empty:
             return False
 
         # Fill missing, calculable columns, profit, duration , abs etc.
-        trades_df = self._fill_calculable_fields(DataFrame(trades))
+        trades_df = self._fill_calculable_fields(trades_df)
         self._cached_pairs = self._process_expectancy(trades_df)
         self._last_updated = arrow.utcnow().timestamp
 
@@ -246,10 +249,8 @@ class Edge():
         open_fee = fee / 2
         close_fee = fee / 2
 
-        result['trade_duration'] = result['close_time'] - result['open_time']
-
-        result['trade_duration'] = result['trade_duration'].map(
-            lambda x: int(x.total_seconds() / 60))
+        result['trade_duration'] = (
+            (result['close_time'] - result['open_time']) // np.timedelta64(1, 'm')).astype(int)
 
         # Spends, Takes, Profit, Absolute Profit
 
@@ -352,108 +353,131 @@ class Edge():
         # Returning a list of pairs in order of "expectancy"
         return final
 
-    def _find_trades_for_stoploss_range(self, ticker_data, pair, stoploss_range):
+    def _find_trades_for_stoploss_range(self, ticker_data: DataFrame, pair: str,
+                                        stoploss_range) -> DataFrame:
+        """
+        Find the trades of all stoplosses of stoploss_range at once.
+        A trade opens on the candle after the first buy signal,
+        and is closed by the stoploss or on the candle after a sell signal, whichever is first.
+        The next trade can open from the candle the previous one was closed on.
+        Trades which are still open at the end of the data are ignored.
+
+        All stoplosses advance one trade per step, so the number of steps is the number
+        of trades of the stoploss with the most trades.
+        :return: DataFrame with one row per trade, ordered by stoploss and open index
+        """
         buy_column = ticker_data['buy'].values
         sell_column = ticker_data['sell'].values
         date_column = ticker_data['date'].values
-        ohlc_columns = ticker_data[['open', 'high', 'low', 'close']].values
+        open_column = ticker_data['open'].values.astype(np.float64)
+        low_mins = self._range_min_table(ticker_data['low'].values.astype(np.float64))
+        length = len(open_column)
 
-        result: list = []
-        for stoploss in stoploss_range:
-            result += self._detect_next_stop_or_sell_point(
-                buy_column, sell_column, date_column, ohlc_columns, round(stoploss, 6), pair
-            )
+        next_buy = self._next_signal_index(buy_column)
+        next_sell = self._next_signal_index(sell_column)
+        stoplosses = np.round(np.asarray(stoploss_range, dtype=np.float64), 6)
 
-        return result
-
-    def _detect_next_stop_or_sell_point(self, buy_column, sell_column, date_column,
-                                        ohlc_columns, stoploss, pair):
-        """
-        Iterate through ohlc_columns in order to find the next trade
-        Next trade opens from the first buy signal noticed to
-        The sell or stoploss signal after it.
-        It then cuts OHLC, buy_column, sell_column and date_column.
-        Cut from (the exit trade index) + 1.
-
-        Author: https://github.com/mishaker
-        """
-
-        result: list = []
-        start_point = 0
+        # Index of the stoploss and candle to search the next buy signal from, per stoploss
+        sl_index = np.arange(len(stoplosses))
+        position = np.zeros(len(stoplosses), dtype=np.int64)
+        steps: List[Dict[str, np.ndarray]] = []
 
         while True:
-            open_trade_index = utf1st.find_1st(buy_column, 1, utf1st.cmp_equal)
-
-            # Return empty if we don't find trade entry (i.e. buy==1) or
-            # we find a buy but at the end of array
-            if open_trade_index == -1 or open_trade_index == len(buy_column) - 1:
-                break
-            else:
-                # When a buy signal is seen,
-                # trade opens in reality on the next candle
-                open_trade_index += 1
-
-            stop_price_percentage = stoploss + 1
-            open_price = ohlc_columns[open_trade_index, 0]
-            stop_price = (open_price * stop_price_percentage)
-
-            # Searching for the index where stoploss is hit
-            stop_index = utf1st.find_1st(
-                ohlc_columns[open_trade_index:, 2], stop_price, utf1st.cmp_smaller)
-
-            # If we don't find it then we assume stop_index will be far in future (infinite number)
-            if stop_index == -1:
-                stop_index = float('inf')
-
-            # Searching for the index where sell is hit
-            sell_index = utf1st.find_1st(sell_column[open_trade_index:], 1, utf1st.cmp_equal)
-
-            # If we don't find it then we assume sell_index will be far in future (infinite number)
-            if sell_index == -1:
-                sell_index = float('inf')
-
-            # Check if we don't find any stop or sell point (in that case trade remains open)
-            # It is not interesting for Edge to consider it so we simply ignore the trade
-            # And stop iterating there is no more entry
-            if stop_index == sell_index == float('inf'):
+            buy_index = next_buy[position]
+            # No buy signal left or buy signal on the last candle
+            found = buy_index < length - 1
+            sl_index = sl_index[found]
+            # When a buy signal is seen, trade opens in reality on the next candle
+            open_index = buy_index[found] + 1
+
+            open_price = open_column[open_index]
+            stop_price = open_price * (stoplosses[sl_index] + 1)
+            stop_index = self._first_index_below(low_mins, open_index, stop_price)
+            sell_index = next_sell[open_index]
+
+            is_stop = stop_index <= sell_index
+            # If exit is SELL then we exit at the next candle
+            exit_index = np.where(is_stop, stop_index, sell_index + 1)
+
+            # Neither stop nor sell point found (or no candle after the sell signal):
+            # the trade remains open, which is not interesting for Edge
+            closed = exit_index < length
+            sl_index = sl_index[closed]
+            open_index = open_index[closed]
+            exit_index = exit_index[closed]
+            is_stop = is_stop[closed]
+            steps.append({
+                'sl_index': sl_index,
+                'open_index': open_index,
+                'close_index': exit_index,
+                'open_rate': open_price[closed],
+                'close_rate': np.where(is_stop, stop_price[closed], open_column[exit_index]),
+                'is_stop': is_stop,
+            })
+            position = exit_index
+            # Checked at the end, so an empty stoploss range still adds one (empty) step
+            if not len(sl_index):
                 break
 
-            if stop_index <= sell_index:
-                exit_index = open_trade_index + stop_index
-                exit_type = SellType.STOP_LOSS
-                exit_price = stop_price
-            elif stop_index > sell_index:
-                # If exit is SELL then we exit at the next candle
-                exit_index = open_trade_index + sell_index + 1
-
-                # Check if we have the next candle
-                if len(ohlc_columns) - 1 < exit_index:
-                    break
-
-                exit_type = SellType.SELL_SIGNAL
-                exit_price = ohlc_columns[exit_index, 0]
-
-            trade = {'pair': pair,
-                     'stoploss': stoploss,
-                     'profit_percent': '',
-                     'profit_abs': '',
-                     'open_time': date_column[open_trade_index],
-                     'close_time': date_column[exit_index],
-                     'open_index': start_point + open_trade_index,
-                     'close_index': start_point + exit_index,
-                     'trade_duration': '',
-                     'open_rate': round(open_price, 15),
-                     'close_rate': round(exit_price, 15),
-                     'exit_type': exit_type
-                     }
-
-            result.append(trade)
-
-            # Giving a view of exit_index till the end of array
-            buy_column = buy_column[exit_index:]
-            sell_column = sell_column[exit_index:]
-            date_column = date_column[exit_index:]
-            ohlc_columns = ohlc_columns[exit_index:]
-            start_point += exit_index
+        columns = {key: np.concatenate([step[key] for step in steps]) for key in steps[0]}
+        order = np.lexsort((columns['open_index'], columns['sl_index']))
+        columns = {key: value[order] for key, value in columns.items()}
+
+        return DataFrame({
+            'pair': pair,
+            'stoploss': stoplosses[columns['sl_index']],
+            'open_time': date_column[columns['open_index']],
+            'close_time': date_column[columns['close_index']],
+            'open_index': columns['open_index'],
+            'close_index': columns['close_index'],
+            'open_rate': np.round(columns['open_rate'], 15),
+            'close_rate': np.round(columns['close_rate'], 15),
+            'exit_type': np.where(columns['is_stop'], SellType.STOP_LOSS, SellType.SELL_SIGNAL),
+        })
+
+    @staticmethod
+    def _next_signal_index(signal_column: np.ndarray) -> np.ndarray:
+        """
+        :return: for each candle, the index of the first candle from there on where the
+                 signal is 1, or len(signal_column) if there is none.
+                 Has one extra element (len(signal_column)) so it can be indexed with
+                 positions after the last candle.
+        """
+        length = len(signal_column)
+        indexes = np.append(np.where(signal_column == 1, np.arange(length), length), length)
+        return np.minimum.accumulate(indexes[::-1])[::-1]
 
-        return result
+    @staticmethod
+    def _range_min_table(values: np.ndarray) -> List[np.ndarray]:
+        """
+        Sparse table of range minimums: element k holds min(values[i:i + 2**k]) for each i,
+        padded with inf so every row can be indexed up to len(values) + 2**k.
+        """
+        levels = max(int(len(values)).bit_length(), 1)
+        padded = np.full(len(values) + 2 ** levels, np.inf)
+        padded[:len(values)] = values
+        table = [padded]
+        for level in range(1, levels + 1):
+            prev = table[-1]
+            step = 2 ** (level - 1)
+            current = np.full(len(padded), np.inf)
+            current[:len(padded) - step] = np.minimum(prev[:-step], prev[step:])
+            table.append(current)
+        return table
+
+    @staticmethod
+    def _first_index_below(min_table: List[np.ndarray], start: np.ndarray,
+                           threshold: np.ndarray) -> np.ndarray:
+        """
+        For each start / threshold pair, find the first index >= start with a value
+        below threshold, by skipping the largest blocks without any such value.
+        :param min_table: table built by _range_min_table()
+        :return: indexes, or a value >= the number of values where the threshold is never hit
+        """
+        # Last index of the padded table rows, inf on all levels
+        last_index = len(min_table[0]) - 1
+        position = np.array(start, dtype=np.int64)
+        for level in range(len(min_table) - 1, -1, -1):
+            no_hit = min_table[level][position] >= threshold
+            position = np.minimum(np.where(no_hit, position + 2 ** level, position), last_index)
+        return position
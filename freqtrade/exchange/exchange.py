@@ -16,6 +16,7 @@ from pandas import DataFrame
 from freqtrade import (constants, DependencyException, OperationalException,
                        TemporaryError, InvalidOrderException)
 from freqtrade.data.converter import parse_ticker_dataframe
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer
 from freqtrade.misc import timeframe_to_seconds, timeframe_to_msecs
 
 
@@ -83,6 +84,13 @@ class Exchange(object):
         self._config.update(config)
 
         self._cached_ticker: Dict[str, Any] = {}
+        # Tickers of all pairs from one fetch_tickers request, reused for
+        # exchange.tickers_ttl seconds by get_tickers() and get_ticker()
+        self._tickers_snapshot: Dict[str, Any] = {}
+        self._tickers_snapshot_time: float = 0.0
+        # get_ticker() doesn't try the snapshot for tickers_ttl seconds after a failed request
+        self._tickers_failed_time: float = 0.0
+        self._tickers_ttl: float = config['exchange'].get('tickers_ttl', 0)
 
         # Holds last candle refreshed time of each pair
         self._pairs_last_refresh_time: Dict[Tuple[str, str], int] = {}
@@ -91,6 +99,8 @@ class Exchange(object):
 
         # Holds candles
         self._klines: Dict[Tuple[str, str], DataFrame] = {}
+        # Holds the closed candles behind _klines, extended on each refresh
+        self._ohlcv_buffers: Dict[Tuple[str, str], OHLCVBuffer] = {}
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: Dict[str, Any] = {}
@@ -451,10 +461,20 @@ class Exchange(object):
         except ccxt.BaseError as e:
             raise OperationalException(e)
 
-    @retrier
-    def get_tickers(self) -> Dict:
+    def _snapshot_valid(self, now: float) -> bool:
+        return bool(self._tickers_ttl) and now - self._tickers_snapshot_time < self._tickers_ttl
+
+    def _fetch_tickers(self, now: float) -> Dict:
+        """
+        Fetch the tickers of all pairs and keep them as snapshot if tickers_ttl is set.
+        Not retried, see get_tickers()
+        """
         try:
-            return self._api.fetch_tickers()
+            tickers = self._api.fetch_tickers()
+            if self._tickers_ttl:
+                self._tickers_snapshot = tickers
+                self._tickers_snapshot_time = now
+            return tickers
         except ccxt.NotSupported as e:
             raise OperationalException(
                 f'Exchange {self._api.name} does not support fetching tickers in batch.'
@@ -465,9 +485,48 @@ class Exchange(object):
         except ccxt.BaseError as e:
             raise OperationalException(e)
 
+    @retrier
+    def get_tickers(self) -> Dict:
+        now = arrow.utcnow().float_timestamp
+        if self._snapshot_valid(now):
+            return self._tickers_snapshot
+        return self._fetch_tickers(now)
+
+    def _get_snapshot_ticker(self, pair: str) -> Optional[Dict]:
+        """
+        Ticker of the pair from the tickers snapshot, refreshed if older than tickers_ttl.
+        A failed refresh isn't retried before tickers_ttl expired again.
+        :return: None if the snapshot is disabled, not available or has no bid/ask for the pair
+        """
+        if not self._tickers_ttl or not self.exchange_has('fetchTickers'):
+            return None
+        now = arrow.utcnow().float_timestamp
+        if self._snapshot_valid(now):
+            tickers = self._tickers_snapshot
+        elif now - self._tickers_failed_time < self._tickers_ttl:
+            return None
+        else:
+            try:
+                tickers = self._fetch_tickers(now)
+            except (TemporaryError, OperationalException) as e:
+                logger.debug('Could not use tickers snapshot: %s', e)
+                self._tickers_failed_time = now
+                return None
+        data = tickers.get(pair)
+        if not data or data.get('bid') is None or data.get('ask') is None:
+            return None
+        self._cached_ticker[pair] = {
+            'bid': float(data['bid']),
+            'ask': float(data['ask']),
+        }
+        return data
+
     @retrier
     def get_ticker(self, pair: str, refresh: Optional[bool] = True) -> dict:
         if refresh or pair not in self._cached_ticker.keys():
+            snapshot = self._get_snapshot_ticker(pair)
+            if snapshot:
+                return snapshot
             try:
                 if pair not in self._api.markets:
                     raise DependencyException(f"Pair {pair} not available")
@@ -525,7 +584,9 @@ class Exchange(object):
 
     def refresh_latest_ohlcv(self, pair_list: List[Tuple[str, str]]) -> List[Tuple[str, List]]:
         """
-        Refresh in-memory ohlcv asyncronously and set `_klines` with the result
+        Refresh in-memory ohlcv asyncronously and set `_klines` with the result.
+        Pairs already in cache only fetch the candles after the last cached candle,
+        the full default window is downloaded again if the new candles don't line up.
         """
         logger.debug("Refreshing ohlcv data for %d pairs", len(pair_list))
 
@@ -535,7 +596,10 @@ class Exchange(object):
         for pair, ticker_interval in set(pair_list):
             if (not ((pair, ticker_interval) in self._klines)
                     or self._now_is_time_to_refresh(pair, ticker_interval)):
-                input_coroutines.append(self._async_get_candle_history(pair, ticker_interval))
+                buffer = self._ohlcv_buffers.get((pair, ticker_interval))
+                since_ms = buffer.next_date_ms if buffer is not None else None
+                input_coroutines.append(
+                    self._async_get_candle_history(pair, ticker_interval, since_ms))
             else:
                 logger.debug("Using cached ohlcv data for %s, %s ...", pair, ticker_interval)
 
@@ -543,6 +607,26 @@ class Exchange(object):
             asyncio.gather(*input_coroutines, return_exceptions=True))
 
         # handle caching
+        full_refresh = self._cache_ohlcv_results(tickers)
+        if full_refresh:
+            logger.info("Gap in refreshed ohlcv data for %s, downloading full history",
+                        full_refresh)
+            full_tickers = asyncio.get_event_loop().run_until_complete(
+                asyncio.gather(*(self._async_get_candle_history(pair, ticker_interval)
+                                 for pair, ticker_interval in full_refresh),
+                               return_exceptions=True))
+            self._cache_ohlcv_results(full_tickers)
+            tickers = [res for res in tickers if isinstance(res, Exception)
+                       or (res[0], res[1]) not in full_refresh] + full_tickers
+        return tickers
+
+    def _cache_ohlcv_results(self, tickers: List) -> List[Tuple[str, str]]:
+        """
+        Store fetch results in `_klines`.
+        Results for pairs with an ohlcv buffer are appended to the buffer.
+        :return: pair / ticker interval tuples which could not be appended due to a gap
+        """
+        full_refresh = []
         for res in tickers:
             if isinstance(res, Exception):
                 logger.warning("Async code raised an exception: %s", res.__class__.__name__)
@@ -550,13 +634,25 @@ class Exchange(object):
             pair = res[0]
             ticker_interval = res[1]
             ticks = res[2]
+            key = (pair, ticker_interval)
+            buffer = self._ohlcv_buffers.get(key)
+            if buffer is not None:
+                if not buffer.extend(ticks):
+                    del self._ohlcv_buffers[key]
+                    full_refresh.append(key)
+                    continue
+                self._klines[key] = buffer.to_dataframe()
+            else:
+                # keeping parsed dataframe in cache
+                self._klines[key] = parse_ticker_dataframe(
+                    ticks, ticker_interval, fill_missing=True)
+                if len(self._klines[key]):
+                    self._ohlcv_buffers[key] = OHLCVBuffer.from_dataframe(
+                        self._klines[key], ticker_interval)
             # keeping last candle time as last refreshed time of the pair
             if ticks:
-                self._pairs_last_refresh_time[(pair, ticker_interval)] = ticks[-1][0] // 1000
-            # keeping parsed dataframe in cache
-            self._klines[(pair, ticker_interval)] = parse_ticker_dataframe(
-                ticks, ticker_interval, fill_missing=True)
-        return tickers
+                self._pairs_last_refresh_time[key] = ticks[-1][0] // 1000
+        return full_refresh
 
     def _now_is_time_to_refresh(self, pair: str, ticker_interval: str) -> bool:
         # Calculating ticker interval in seconds
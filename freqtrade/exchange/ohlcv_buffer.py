@@ -0,0 +1,118 @@
+"""
+Array backed store of the closed candles of one pair / ticker interval
+"""
+import logging
+from typing import List
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+from freqtrade.misc import timeframe_to_msecs
+
+logger = logging.getLogger(__name__)
+
+# Minimum number of candles kept per pair, so pairs with a short history
+# can grow up to the size the exchange returns for established pairs.
+MIN_OHLCV_BUFFER_SIZE = 500
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class OHLCVBuffer(object):
+    """
+    Fixed size ring buffer of candles (in ccxt fetch_ohlcv column order).
+    Only gapless, closed candles are stored, so the buffer can be turned into the
+    same dataframe parse_ticker_dataframe() returns, without the groupby / resample.
+    """
+
+    def __init__(self, ticker_interval: str, capacity: int) -> None:
+        self._interval_ms = timeframe_to_msecs(ticker_interval)
+        self._data = np.empty((capacity, 6), dtype=np.float64)
+        self._start = 0
+        self._length = 0
+
+    @classmethod
+    def from_dataframe(cls, frame: DataFrame, ticker_interval: str) -> 'OHLCVBuffer':
+        """
+        Create a buffer holding the candles of a dataframe returned by
+        parse_ticker_dataframe(fill_missing=True)
+        """
+        buffer = cls(ticker_interval, max(len(frame), MIN_OHLCV_BUFFER_SIZE))
+        rows = np.empty((len(frame), 6), dtype=np.float64)
+        rows[:, 0] = frame['date'].values.astype('datetime64[ms]').astype(np.int64)
+        rows[:, 1:] = frame[OHLCV_COLUMNS].values
+        buffer._append(rows)
+        return buffer
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def last_date_ms(self) -> int:
+        """ Open time of the newest candle in the buffer """
+        return int(self._data[(self._start + self._length - 1) % self.capacity, 0])
+
+    @property
+    def next_date_ms(self) -> int:
+        """ Open time of the first candle missing in the buffer """
+        return self.last_date_ms + self._interval_ms
+
+    def _append(self, rows: np.ndarray) -> None:
+        """
+        Append rows, overwriting the oldest rows once the buffer is full
+        """
+        capacity = self.capacity
+        if len(rows) >= capacity:
+            self._data[:] = rows[-capacity:]
+            self._start = 0
+            self._length = capacity
+            return
+        end = (self._start + self._length) % capacity
+        head = min(len(rows), capacity - end)
+        self._data[end:end + head] = rows[:head]
+        self._data[:len(rows) - head] = rows[head:]
+        overflow = max(self._length + len(rows) - capacity, 0)
+        self._start = (self._start + overflow) % capacity
+        self._length = min(self._length + len(rows), capacity)
+
+    def extend(self, ticks: List) -> bool:
+        """
+        Append the candles of a fetch_ohlcv result newer than the newest candle in the buffer.
+        The last candle of the result is still open and not stored.
+        :param ticks: fetch_ohlcv result, sorted by date
+        :return: False if the new candles don't directly follow the buffer
+                 (nothing is appended in that case), True otherwise
+        """
+        if not len(self) or len(ticks) < 2:
+            return bool(len(self))
+        rows = np.array(ticks[:-1], dtype=np.float64)
+        rows = rows[rows[:, 0] > self.last_date_ms]
+        if not len(rows):
+            return True
+        expected = self.next_date_ms + np.arange(len(rows)) * self._interval_ms
+        if not np.array_equal(rows[:, 0], expected):
+            return False
+        self._append(rows)
+        return True
+
+    def to_array(self) -> np.ndarray:
+        """
+        :return: copy of the buffered candles, oldest first
+        """
+        end = self._start + self._length
+        if end <= self.capacity:
+            return self._data[self._start:end].copy()
+        return np.concatenate((self._data[self._start:], self._data[:end - self.capacity]))
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        :return: the buffered candles in the format of parse_ticker_dataframe()
+        """
+        data = self.to_array()
+        frame = DataFrame(data[:, 1:], columns=OHLCV_COLUMNS)
+        frame.insert(0, 'date', to_datetime(data[:, 0].astype(np.int64), unit='ms', utc=True))
+        return frame
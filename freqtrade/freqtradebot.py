@@ -5,13 +5,16 @@ Freqtrade is the main module of this bot. It contains the class Freqtrade()
 import copy
 import logging
 import traceback
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import arrow
 from requests.exceptions import RequestException
 
 from freqtrade import (DependencyException, OperationalException, InvalidOrderException,
+                       TemporaryError,
                        __version__, constants, persistence)
 from freqtrade.data.converter import order_book_to_dataframe
 from freqtrade.data.dataprovider import DataProvider
@@ -22,6 +25,7 @@ from freqtrade.rpc import RPCManager, RPCMessageType
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver, PairListResolver
 from freqtrade.state import State
 from freqtrade.strategy.interface import SellType, IStrategy
+from freqtrade.timings import ProcessTimings
 from freqtrade.wallets import Wallets
 
 
@@ -73,6 +77,22 @@ class FreqtradeBot(object):
 
         self.active_pair_whitelist: List[str] = self.config['exchange']['pair_whitelist']
 
+        # Thread pool evaluating the signals of all whitelisted pairs concurrently
+        signal_workers = self.config.get('signal_workers', 1)
+        self._signal_executor = ThreadPoolExecutor(max_workers=signal_workers) \
+            if signal_workers > 1 else None
+
+        # Wall time of the stages of process()
+        internals = self.config.get('internals', {})
+        self.timings = ProcessTimings(
+            internals.get('perf_window', constants.PROCESS_TIMINGS_WINDOW))
+        self._perf_report_every = internals.get('perf_report_every', 0)
+        perf_dump_file = internals.get('perf_dump_file')
+        self._perf_dump_file = Path(perf_dump_file) if perf_dump_file else None
+        self._db_batch_commit = internals.get('db_batch_commit', False)
+        self._archive_after_days = internals.get('archive_after_days')
+        self._next_archive = datetime.min
+
         persistence.init(self.config)
 
         # Set initial bot state from config
@@ -88,6 +108,8 @@ class FreqtradeBot(object):
 
         self.rpc.cleanup()
         persistence.cleanup()
+        if self._signal_executor:
+            self._signal_executor.shutdown()
 
     def process(self) -> bool:
         """
@@ -95,46 +117,99 @@ class FreqtradeBot(object):
         otherwise a new trade is created.
         :return: True if one or more trades has been created or closed, False otherwise
         """
+        with self.timings.iteration():
+            if self._db_batch_commit:
+                # One database transaction for all trade changes of the iteration
+                with persistence.transaction():
+                    state_changed = self._process_stages()
+            else:
+                state_changed = self._process_stages()
+        self._report_timings()
+        return state_changed
+
+    def _process_stages(self) -> bool:
+        """
+        Body of process(), with the wall time of every stage measured in self.timings
+        :return: True if one or more trades has been created or closed, False otherwise
+        """
         state_changed = False
+        timings = self.timings
 
         # Check whether markets have to be reloaded
-        self.exchange._reload_markets()
+        with timings.stage('reload_markets'):
+            self.exchange._reload_markets()
 
         # Refresh whitelist
-        self.pairlists.refresh_pairlist()
-        self.active_pair_whitelist = self.pairlists.whitelist
+        with timings.stage('refresh_pairlist'):
+            self.pairlists.refresh_pairlist()
+            self.active_pair_whitelist = self.pairlists.whitelist
 
         # Calculating Edge positioning
         if self.edge:
-            self.edge.calculate()
-            self.active_pair_whitelist = self.edge.adjust(self.active_pair_whitelist)
+            with timings.stage('edge'):
+                self.edge.calculate()
+                self.active_pair_whitelist = self.edge.adjust(self.active_pair_whitelist)
 
-        # Query trades from persistence layer
-        trades = Trade.get_open_trades()
+        with timings.stage('refresh_data'):
+            # Query trades from persistence layer
+            trades = Trade.get_open_trades()
 
-        # Extend active-pair whitelist with pairs from open trades
-        # It ensures that tickers are downloaded for open trades
-        self._extend_whitelist_with_trades(self.active_pair_whitelist, trades)
+            # Extend active-pair whitelist with pairs from open trades
+            # It ensures that tickers are downloaded for open trades
+            self._extend_whitelist_with_trades(self.active_pair_whitelist, trades)
 
-        # Refreshing candles
-        self.dataprovider.refresh(self._create_pair_whitelist(self.active_pair_whitelist),
-                                  self.strategy.informative_pairs())
+            # Refreshing candles
+            self.dataprovider.refresh(self._create_pair_whitelist(self.active_pair_whitelist),
+                                      self.strategy.informative_pairs())
 
         # First process current opened trades
-        for trade in trades:
-            state_changed |= self.process_maybe_execute_sell(trade)
+        with timings.stage('sell'):
+            for trade in trades:
+                state_changed |= self.process_maybe_execute_sell(trade)
 
         # Then looking for buy opportunities
         if len(trades) < self.config['max_open_trades']:
-            state_changed = self.process_maybe_execute_buy()
+            with timings.stage('buy'):
+                state_changed = self.process_maybe_execute_buy()
 
         if 'unfilledtimeout' in self.config:
             # Check and handle any timed out open orders
-            self.check_handle_timedout()
-            Trade.session.flush()
+            with timings.stage('check_timedout'):
+                self.check_handle_timedout()
+                Trade.session.flush()
+
+        if self._archive_after_days and datetime.utcnow() >= self._next_archive:
+            with timings.stage('archive'):
+                self.archive_closed_trades()
 
         return state_changed
 
+    def archive_closed_trades(self) -> None:
+        """
+        Archive the trades closed more than internals.archive_after_days ago, once a day
+        """
+        now = datetime.utcnow()
+        archived = persistence.archive_closed_trades(
+            now - timedelta(days=self._archive_after_days))
+        if archived:
+            logger.info('Archived %s closed trades', archived)
+        self._next_archive = now + timedelta(days=1)
+
+    def _report_timings(self) -> None:
+        """
+        Write the process timings to the dump file and send them to the rpc modules,
+        if configured
+        """
+        if self._perf_dump_file:
+            self.timings.dump(self._perf_dump_file)
+        if self._perf_report_every and self.timings.iterations % self._perf_report_every == 0:
+            msg: Dict[str, Any] = {
+                'type': RPCMessageType.PERF_NOTIFICATION,
+                'iterations': self.timings.iterations,
+            }
+            msg.update(self.timings.flat_summary())
+            self.rpc.send_msg(msg)
+
     def _extend_whitelist_with_trades(self, whitelist: List[str], trades: List[Any]):
         """
         Extend whitelist with pairs from open trades
@@ -267,10 +342,7 @@ class FreqtradeBot(object):
             return False
 
         # running get_signal on historical data fetched
-        for _pair in whitelist:
-            (buy, sell) = self.strategy.get_signal(
-                _pair, interval, self.dataprovider.ohlcv(_pair, self.strategy.ticker_interval))
-
+        for _pair, (buy, sell) in self._get_signals(whitelist, interval):
             if buy and not sell:
                 stake_amount = self._get_trade_stake_amount(_pair)
                 if not stake_amount:
@@ -291,6 +363,23 @@ class FreqtradeBot(object):
 
         return False
 
+    def _get_signals(self, pairs: List[str],
+                     interval: str) -> Iterable[Tuple[str, Tuple[bool, bool]]]:
+        """
+        Calculates the (buy, sell) signals for the given pairs.
+        With signal_workers > 1 all pairs are analyzed concurrently, otherwise pairs are
+        analyzed one by one while iterating over the result.
+        :return: (pair, (buy, sell)) tuples, always in the order of pairs
+        """
+        def get_signal(pair: str) -> Tuple[bool, bool]:
+            return self.strategy.get_signal(pair, interval,
+                                            self.dataprovider.ohlcv(pair, interval))
+
+        if self._signal_executor:
+            # map() keeps the order of pairs, independent of which analysis finishes first
+            return zip(pairs, list(self._signal_executor.map(get_signal, pairs)))
+        return ((pair, get_signal(pair)) for pair in pairs)
+
     def _check_depth_of_market_buy(self, pair: str, conf: Dict) -> bool:
         """
         Checks depth of market before executing a buy
@@ -541,6 +630,32 @@ class FreqtradeBot(object):
             rate = self.exchange.get_ticker(pair, refresh)['bid']
         return rate
 
+    def get_sell_rates(self, pairs: Iterable[str]) -> Dict[str, float]:
+        """
+        Get the sell rates of several pairs, from one request for all tickers where
+        possible. Falls back to get_sell_rate() for pairs the tickers have no bid for.
+        :return: rate per pair, pairs not available on the exchange are missing
+        """
+        pairs = set(pairs)
+        rates: Dict[str, float] = {}
+        if len(pairs) > 1 and not self.config.get('ask_strategy', {}).get('use_order_book'):
+            try:
+                tickers = self.exchange.get_tickers()
+            except (OperationalException, TemporaryError) as error:
+                logger.debug('Could not fetch all tickers: %s', error)
+                tickers = {}
+            for pair in pairs:
+                bid = tickers.get(pair, {}).get('bid')
+                if isinstance(bid, (int, float)):
+                    rates[pair] = bid
+
+        for pair in pairs.difference(rates):
+            try:
+                rates[pair] = self.get_sell_rate(pair, False)
+            except DependencyException:
+                pass
+        return rates
+
     def handle_trade(self, trade: Trade) -> bool:
         """
         Sells the current pair if the threshold is reached and updates the trade record.
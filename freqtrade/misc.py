@@ -4,6 +4,7 @@ Various tool function for Freqtrade and scripts
 
 import gzip
 import logging
+import multiprocessing
 import re
 from datetime import datetime
 from typing import Dict
@@ -155,3 +156,15 @@ def timeframe_to_msecs(ticker_interval: str) -> int:
     Same as above, but returns milliseconds.
     """
     return Exchange.parse_timeframe(ticker_interval) * 1000
+
+
+def uses_fork_start_method() -> bool:
+    """
+    Check if new processes are forked, without fixing the multiprocessing start method
+    as a side effect. An unset start method is the platform default.
+    """
+    start_method = multiprocessing.get_start_method(allow_none=True)
+    if start_method is None:
+        # The platform default is listed first
+        start_method = multiprocessing.get_all_start_methods()[0]
+    return start_method == 'fork'
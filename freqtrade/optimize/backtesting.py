@@ -5,22 +5,28 @@ This module contains the backtesting logic
 """
 import logging
 from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, NamedTuple, Optional
 
 import numpy as np
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp, to_datetime
 from tabulate import tabulate
 
 from freqtrade import optimize
-from freqtrade import DependencyException, constants
+from freqtrade import DependencyException, OperationalException, constants
 from freqtrade.arguments import Arguments
 from freqtrade.configuration import Configuration
 from freqtrade.data import history
 from freqtrade.data.dataprovider import DataProvider
-from freqtrade.misc import file_dump_json, timeframe_to_minutes
+from freqtrade.misc import file_dump_json, timeframe_to_minutes, uses_fork_start_method
+from freqtrade.optimize.indicator_cache import IndicatorCache
+from freqtrade.optimize.vectorized import (NS_PER_MINUTE, ExitCandidates, ExitParameters,
+                                           ExitPoint, TickerArrays, buy_candidates, find_exit,
+                                           find_exits, pair_ticker_arrays, profit_abs,
+                                           profit_percent)
 from freqtrade.persistence import Trade
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
 from freqtrade.state import RunMode
@@ -30,6 +36,19 @@ import matplotlib.pyplot as plt
 
 logger = logging.getLogger(__name__)
 
+# Backtesting instance and arguments of a parallel --strategy-list run. Forked workers
+# inherit them (and the loaded ticker data) copy-on-write instead of pickling them.
+_strategy_worker_state: Dict[str, Any] = {}
+
+
+def _backtest_strategy_worker(index: int) -> DataFrame:
+    """
+    Backtest strategy number `index` of the strategylist in a forked worker process
+    """
+    backtesting = _strategy_worker_state['backtesting']
+    return backtesting._backtest_strategy(backtesting.strategylist[index],
+                                          **_strategy_worker_state['kwargs'])
+
 
 class BacktestResult(NamedTuple):
     """
@@ -269,11 +288,10 @@ class Backtesting(object):
             logger.info('Dumping backtest results to %s', recordfilename)
             file_dump_json(recordfilename, records)
 
-    def _get_ticker_list(self, processed) -> Dict[str, DataFrame]:
+    def _get_ticker_data(self, processed) -> Dict[str, DataFrame]:
         """
-        Helper function to convert a processed tickerlist into a list for performance reasons.
-
-        Used by backtest() - so keep this optimized for performance.
+        Helper function to populate buy/sell signals for a processed tickerlist.
+        Signals are shifted by one candle, so each row holds the signal of the previous candle.
         """
         headers = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high']
         ticker: Dict = {}
@@ -289,12 +307,27 @@ class Backtesting(object):
             ticker_data.loc[:, 'sell'] = ticker_data['sell'].shift(1)
 
             ticker_data.drop(ticker_data.head(1).index, inplace=True)
-
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            ticker[pair] = [x for x in ticker_data.itertuples()]
+            ticker[pair] = ticker_data
         return ticker
 
+    def _get_ticker_list(self, processed) -> Dict[str, DataFrame]:
+        """
+        Helper function to convert a processed tickerlist into a list for performance reasons.
+
+        Used by backtest_loop() - so keep this optimized for performance.
+        """
+        # Convert from Pandas to list for performance reasons
+        # (Looping Pandas is slow.)
+        return {pair: [x for x in ticker_data.itertuples()]
+                for pair, ticker_data in self._get_ticker_data(processed).items()}
+
+    def _get_ticker_arrays(self, processed) -> Dict[str, TickerArrays]:
+        """
+        Helper function to convert a processed tickerlist into numpy arrays.
+        Used by the vectorized backtest engine.
+        """
+        return pair_ticker_arrays(self._get_ticker_data(processed))
+
     def _get_sell_trade_entry(
             self, pair: str, buy_row: DataFrame,
             partial_ticker: List, trade_count_lock: Dict, args: Dict) -> Optional[BacktestResult]:
@@ -374,9 +407,32 @@ class Backtesting(object):
             return btr
         return None
 
+    def _vectorized_engine(self) -> bool:
+        return (self.config.get('backtest_engine', constants.DEFAULT_BACKTEST_ENGINE)
+                == 'vectorized')
+
+    def get_ticker(self, processed: Dict[str, DataFrame]) -> Dict:
+        """
+        Populate buy/sell signals in the format used by the configured backtest engine.
+        Pass the result to backtest() as `ticker` to backtest the same signals repeatedly.
+        """
+        if self._vectorized_engine():
+            return self._get_ticker_arrays(processed)
+        return self._get_ticker_list(processed)
+
     def backtest(self, args: Dict) -> DataFrame:
         """
-        Implements backtesting functionality
+        Implements backtesting functionality, using the configured backtest engine.
+        :param args: see backtest_loop()
+        :return: DataFrame
+        """
+        if self._vectorized_engine():
+            return self.backtest_vectorized(args)
+        return self.backtest_loop(args)
+
+    def backtest_loop(self, args: Dict) -> DataFrame:
+        """
+        Implements backtesting functionality by looping over all candles
 
         NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
         Of course try to not have ugly code. By some accessor are sometime slower than functions.
@@ -385,6 +441,7 @@ class Backtesting(object):
         :param args: a dict containing:
             stake_amount: btc amount to use for each trade
             processed: a processed dictionary with format {pair, data}
+            ticker: result of get_ticker(processed), populated from `processed` if not given
             max_open_trades: maximum number of concurrent trades (default: 0, disabled)
             position_stacking: do we allow position stacking? (default: False)
         :return: DataFrame
@@ -398,7 +455,7 @@ class Backtesting(object):
         trade_count_lock: Dict = {}
 
         # Dict of ticker-lists for performance (looping lists is a lot faster than dataframes)
-        ticker: Dict = self._get_ticker_list(processed)
+        ticker: Dict = args['ticker'] if 'ticker' in args else self._get_ticker_list(processed)
 
         lock_pair_until: Dict = {}
         # Indexes per pair, so some pairs are allowed to have a missing start.
@@ -453,6 +510,225 @@ class Backtesting(object):
             tmp += timedelta(minutes=self.ticker_interval_mins)
         return DataFrame.from_records(trades, columns=BacktestResult._fields)
 
+    def backtest_vectorized(self, args: Dict) -> DataFrame:
+        """
+        Vectorized backtest engine - produces the same results as backtest_loop().
+
+        Exits are searched with array scans (see freqtrade.optimize.vectorized),
+        so python code only runs once per buy signal instead of once per candle and pair.
+        Buy signals are processed in the same order as the candle-loop would see them,
+        so max_open_trades and position stacking behave identically.
+
+        :param args: same as backtest_loop()
+        :return: DataFrame
+        """
+        processed = args['processed']
+        stake_amount = args['stake_amount']
+        max_open_trades = args.get('max_open_trades', 0)
+        position_stacking = args.get('position_stacking', False)
+        start_ns = Timestamp(args['start_date'].datetime).value
+        end_ns = Timestamp(args['end_date'].datetime).value
+        interval_ns = self.ticker_interval_mins * NS_PER_MINUTE
+        trades: List[BacktestResult] = []
+
+        ticker = args['ticker'] if 'ticker' in args else self._get_ticker_arrays(processed)
+        exit_params = ExitParameters.from_strategy(self.strategy, self.fee, stake_amount)
+        pairs = list(ticker)
+        if not pairs:
+            return DataFrame.from_records(trades, columns=BacktestResult._fields)
+
+        # Collect buy candidates in candle-loop order (time-step, then pair)
+        pair_ids, rows = buy_candidates(ticker, start_ns, end_ns, interval_ns)
+
+        # Open trades per candle - replaces trade_count_lock from the candle-loop
+        all_dates = np.unique(np.concatenate([ticker[pair].date_ns for pair in pairs]))
+        date_idx = {pair: np.searchsorted(all_dates, ticker[pair].date_ns) for pair in pairs}
+        trade_count = np.zeros(len(all_dates), dtype=np.int64)
+
+        lock_pair_until: Dict = {}
+        for pair_id, row in zip(pair_ids, rows):
+            pair = pairs[pair_id]
+            arrays = ticker[pair]
+
+            if (not position_stacking and pair in lock_pair_until
+                    and arrays.date_ns[row] <= lock_pair_until[pair]):
+                # without positionstacking, we can only have one open trade per pair.
+                continue
+
+            if max_open_trades > 0:
+                # Check if max_open_trades has already been reached for the given date
+                if not trade_count[date_idx[pair][row]] < max_open_trades:
+                    continue
+                trade_count[date_idx[pair][row]] += 1
+
+            exit_point = find_exit(arrays, row, exit_params)
+            if not exit_point:
+                # Set lock_pair_until to end of testing period if trade could not be closed
+                lock_pair_until[pair] = end_ns
+                continue
+
+            if max_open_trades > 0:
+                np.add.at(trade_count, date_idx[pair][row + 1:exit_point.row + 1], 1)
+
+            trades.append(self._get_vectorized_trade_entry(pair, arrays, row, exit_point,
+                                                           stake_amount))
+            lock_pair_until[pair] = arrays.date_ns[exit_point.row]
+
+        return DataFrame.from_records(trades, columns=BacktestResult._fields)
+
+    def backtest_exit_candidates(self, args: Dict, roi_tables: List[Dict],
+                                 stoplosses: List[float]) -> List[DataFrame]:
+        """
+        Backtest many minimal_roi tables and stoplosses in one pass over the buy signals.
+        With position stacking and without max_open_trades every buy signal opens a trade,
+        so the entries don't depend on the exits: the exits of all candidates are searched
+        together for each entry (see freqtrade.optimize.vectorized.find_exits()).
+
+        Produces the same trades as backtest_vectorized() with the candidate's minimal_roi
+        and stoploss, profits are calculated with the array functions of the vectorized module.
+        :param args: same as backtest_loop(). `ticker` has to be the result of
+                     _get_ticker_arrays() if given. position_stacking is required.
+        :param roi_tables: minimal_roi table per candidate
+        :param stoplosses: stoploss per candidate
+        :return: one DataFrame of trades per candidate, in the order of the candidates
+        """
+        if not args.get('position_stacking', False) or args.get('max_open_trades', 0) > 0:
+            raise OperationalException('Evaluating exit candidates together requires position '
+                                       'stacking and no max_open_trades limit.')
+        candidates = ExitCandidates.from_values(roi_tables, stoplosses)
+        ticker = args['ticker'] if 'ticker' in args else self._get_ticker_arrays(args['processed'])
+        exit_params = ExitParameters.from_strategy(self.strategy, self.fee, args['stake_amount'])
+        pairs = list(ticker)
+        pair_ids, rows = buy_candidates(ticker, Timestamp(args['start_date'].datetime).value,
+                                        Timestamp(args['end_date'].datetime).value,
+                                        self.ticker_interval_mins * NS_PER_MINUTE)
+
+        # One row per trade, one column per candidate
+        trade_pairs, open_ns, open_rates, open_index = [], [], [], []
+        exit_ns, close_rates, close_index, sell_types = [], [], [], []
+        for pair_id, row in zip(pair_ids, rows):
+            arrays = ticker[pairs[pair_id]]
+            exits = find_exits(arrays, row, exit_params, candidates)
+            if exits is None:
+                continue
+            exit_rows, sell_type, close_rate = exits
+            trade_pairs.append(pairs[pair_id])
+            open_ns.append(arrays.date_ns[row])
+            open_rates.append(arrays.open[row])
+            open_index.append(arrays.index[row])
+            exit_ns.append(arrays.date_ns[exit_rows])
+            close_rates.append(close_rate)
+            close_index.append(arrays.index[exit_rows])
+            sell_types.append(sell_type)
+
+        if not trade_pairs:
+            return [DataFrame.from_records([], columns=BacktestResult._fields)
+                    for _ in stoplosses]
+
+        open_time = to_datetime(np.array(open_ns), utc=True)
+        open_rate = np.array(open_rates)[:, np.newaxis]
+        close_rate = np.array(close_rates)
+        exit_time = np.array(exit_ns)
+        sell_reason = np.array(sell_types)
+        percent = profit_percent(close_rate, open_rate, exit_params.fee)
+        absolute = profit_abs(close_rate, open_rate, exit_params.fee, exit_params.stake_amount)
+        duration = (exit_time - np.array(open_ns)[:, np.newaxis]) // NS_PER_MINUTE
+        close_index_arr = np.array(close_index)
+
+        return [DataFrame({
+            'pair': trade_pairs,
+            'profit_percent': percent[:, num],
+            'profit_abs': absolute[:, num],
+            'open_time': open_time,
+            'close_time': to_datetime(exit_time[:, num], utc=True),
+            'open_index': open_index,
+            'close_index': close_index_arr[:, num],
+            'trade_duration': duration[:, num],
+            'open_at_end': sell_reason[:, num] == SellType.FORCE_SELL,
+            'open_rate': open_rate[:, 0],
+            'close_rate': close_rate[:, num],
+            'sell_reason': sell_reason[:, num],
+        }, columns=BacktestResult._fields) for num in range(len(stoplosses))]
+
+    def _get_vectorized_trade_entry(self, pair: str, arrays: TickerArrays, buy_index: int,
+                                    exit_point: ExitPoint, stake_amount: float) -> BacktestResult:
+        """
+        Build the BacktestResult for a trade found by the vectorized engine.
+        Profits are calculated through Trade, same as the candle-loop does.
+        """
+        open_rate = arrays.open[buy_index]
+        open_time = arrays.dates[buy_index]
+        close_time = arrays.dates[exit_point.row]
+        trade = Trade(
+            open_rate=open_rate,
+            open_date=open_time,
+            stake_amount=stake_amount,
+            amount=stake_amount / open_rate,
+            fee_open=self.fee,
+            fee_close=self.fee
+        )
+        return BacktestResult(pair=pair,
+                              profit_percent=trade.calc_profit_percent(rate=exit_point.close_rate),
+                              profit_abs=trade.calc_profit(rate=exit_point.close_rate),
+                              open_time=open_time,
+                              close_time=close_time,
+                              trade_duration=int((close_time - open_time).total_seconds() // 60),
+                              open_index=arrays.index[buy_index],
+                              close_index=arrays.index[exit_point.row],
+                              open_at_end=exit_point.open_at_end,
+                              open_rate=open_rate,
+                              close_rate=exit_point.close_rate,
+                              sell_reason=exit_point.sell_type
+                              )
+
+    def _backtest_strategy(self, strategy: IStrategy, data: Dict[str, DataFrame],
+                           indicator_cache: Optional[IndicatorCache],
+                           backtest_args: Dict[str, Any]) -> DataFrame:
+        """
+        Populate indicators and signals for one strategy and backtest it
+        :param backtest_args: arguments for backtest(), except 'processed'
+        :return: DataFrame of the backtest results
+        """
+        logger.info("Running backtesting for Strategy %s", strategy.get_strategy_name())
+        self._set_strategy(strategy)
+
+        # need to reprocess data every time to populate signals
+        if indicator_cache:
+            preprocessed = indicator_cache.tickerdata_to_dataframe(self.strategy, data)
+            # The copies in preprocessed are all this strategy needs from now on
+            indicator_cache.release(self.strategy)
+        else:
+            preprocessed = self.strategy.tickerdata_to_dataframe(data)
+
+        return self.backtest({'processed': preprocessed, **backtest_args})
+
+    def _backtest_strategies_parallel(self, workers: int, data: Dict[str, DataFrame],
+                                      indicator_cache: Optional[IndicatorCache],
+                                      backtest_args: Dict[str, Any]) -> Dict[str, DataFrame]:
+        """
+        Backtest all strategies of the strategylist in forked worker processes.
+        Workers read the ticker data from the memory inherited from this process,
+        only the results are sent back.
+        :return: dict(<strategy name>: <backtest results>)
+        """
+        logger.info('Backtesting %s strategies using %s worker processes ...',
+                    len(self.strategylist), workers)
+        _strategy_worker_state.update({
+            'backtesting': self,
+            'kwargs': {'data': data, 'indicator_cache': indicator_cache,
+                       'backtest_args': backtest_args},
+        })
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map() returns results in the order of the strategylist
+                results = list(executor.map(_backtest_strategy_worker,
+                                            range(len(self.strategylist))))
+        finally:
+            _strategy_worker_state.clear()
+
+        return {strat.get_strategy_name(): result
+                for strat, result in zip(self.strategylist, results)}
+
     def start(self) -> None:
         """
         Run a backtesting end-to-end
@@ -479,7 +755,9 @@ class Backtesting(object):
                 ticker_interval=self.ticker_interval,
                 refresh_pairs=self.config.get('refresh_pairs', False),
                 exchange=self.exchange,
-                timerange=timerange
+                timerange=timerange,
+                workers=self.config.get('data_load_workers', 1),
+                cache=self.config.get('ticker_data_cache', False)
             )
 
         if not data:
@@ -491,36 +769,45 @@ class Backtesting(object):
         else:
             logger.info('Ignoring max_open_trades (--disable-max-market-positions was used) ...')
             max_open_trades = 0
-        all_results = {}
-
-        for strat in self.strategylist:
-            logger.info("Running backtesting for Strategy %s", strat.get_strategy_name())
-            self._set_strategy(strat)
-
-            min_date, max_date = optimize.get_timeframe(data)
-            # Validate dataframe for missing values (mainly at start and end, as fillup is called)
-            optimize.validate_backtest_data(data, min_date, max_date,
-                                            timeframe_to_minutes(self.ticker_interval))
-            logger.info(
-                'Measuring data from %s up to %s (%s days)..',
-                min_date.isoformat(),
-                max_date.isoformat(),
-                (max_date - min_date).days
-            )
-            # need to reprocess data every time to populate signals
-            preprocessed = self.strategy.tickerdata_to_dataframe(data)
+        all_results: Dict[str, DataFrame] = {}
 
-            # Execute backtest and print results
-            all_results[self.strategy.get_strategy_name()] = self.backtest(
-                {
-                    'stake_amount': self.config.get('stake_amount'),
-                    'processed': preprocessed,
-                    'max_open_trades': max_open_trades,
-                    'position_stacking': self.config.get('position_stacking', False),
-                    'start_date': min_date,
-                    'end_date': max_date,
-                }
-            )
+        min_date, max_date = optimize.get_timeframe(data)
+        # Validate dataframe for missing values (mainly at start and end, as fillup is called)
+        optimize.validate_backtest_data(data, min_date, max_date,
+                                        timeframe_to_minutes(self.ticker_interval))
+        logger.info(
+            'Measuring data from %s up to %s (%s days)..',
+            min_date.isoformat(),
+            max_date.isoformat(),
+            (max_date - min_date).days
+        )
+        indicator_cache = IndicatorCache(Path(self.config.get(
+            'indicator_cache_dir', constants.DEFAULT_INDICATOR_CACHE_DIR))) \
+            if self.config.get('indicator_cache', False) else None
+
+        backtest_args = {
+            'stake_amount': self.config.get('stake_amount'),
+            'max_open_trades': max_open_trades,
+            'position_stacking': self.config.get('position_stacking', False),
+            'start_date': min_date,
+            'end_date': max_date,
+        }
+
+        workers = min(self.config.get('strategy_workers', 1), len(self.strategylist))
+        # ProcessPoolExecutor only takes a start method (mp_context) from python 3.7 on
+        if workers > 1 and not uses_fork_start_method():
+            logger.warning('Backtesting strategies in parallel needs the "fork" start method, '
+                           'which is not the default on this platform. '
+                           'Backtesting strategies one after another ...')
+            workers = 1
+
+        if workers > 1:
+            all_results = self._backtest_strategies_parallel(workers, data, indicator_cache,
+                                                             backtest_args)
+        else:
+            for strat in self.strategylist:
+                all_results[strat.get_strategy_name()] = self._backtest_strategy(
+                    strat, data, indicator_cache, backtest_args)
 
         for strategy, results in all_results.items():
 
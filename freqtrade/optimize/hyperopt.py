@@ -4,29 +4,37 @@
 This module contains the hyperopt logic
 """
 
+import hashlib
 import logging
 import multiprocessing
 import os
+import socket
 import sys
+import time
+import uuid
 from argparse import Namespace
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from math import exp
-from operator import itemgetter
 from pathlib import Path
 from pprint import pprint
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from joblib import Parallel, delayed, dump, load, wrap_non_picklable_objects
 from pandas import DataFrame
 from skopt import Optimizer
 from skopt.space import Dimension
 
+from freqtrade import OperationalException, constants
 from freqtrade.arguments import Arguments
 from freqtrade.configuration import Configuration
 from freqtrade.data.history import load_data
+from freqtrade.misc import uses_fork_start_method
 from freqtrade.optimize import get_timeframe
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.trial_store import TrialStore
 from freqtrade.state import RunMode
 from freqtrade.resolvers import HyperOptResolver
+from freqtrade.timings import ProcessTimings
 
 import numpy as np
 import datetime
@@ -34,6 +42,76 @@ logger = logging.getLogger(__name__)
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 TICKERDATA_PICKLE = os.path.join('user_data', 'hyperopt_tickerdata.pkl')
+TRIALS_FILE = os.path.join('user_data', 'hyperopt_results.sqlite')
+
+# Distributed hyperopt, in seconds: how often the trial store is polled, how long workers
+# wait for new points before exiting, and after which time points claimed by a worker
+# without result are queued again
+DISTRIBUTED_POLL_INTERVAL = 1.0
+DISTRIBUTED_IDLE_TIMEOUT = 600
+DISTRIBUTED_STALE_TIMEOUT = 3600
+
+# Processed ticker data of the running hyperopt, cached per (worker) process.
+# joblib keeps its worker processes alive between batches, so TICKERDATA_PICKLE
+# is only unpickled once per process instead of once per epoch.
+_processed_cache: Dict[str, Any] = {}
+
+
+def load_processed(run_id: Optional[str],
+                   filename: str = TICKERDATA_PICKLE) -> Dict[str, DataFrame]:
+    """
+    Load the processed ticker data dumped by Hyperopt.start()
+    :param run_id: id of the dump. Data is reused as long as the id does not change,
+                   None always loads the data from disk.
+    :param filename: file the data was dumped to
+    :return: processed ticker data
+    """
+    if run_id is None or _processed_cache.get('run_id') != run_id:
+        _processed_cache['data'] = load(filename)
+        _processed_cache['run_id'] = run_id
+    return _processed_cache['data']
+
+
+# Buy/sell signals of the processed ticker data, cached per (worker) process
+# when neither the buy nor the sell space is optimized.
+_signal_cache: Dict[str, Any] = {}
+
+
+def load_signals(run_id: Optional[str], populate: Callable[[], Dict],
+                 kind: str = 'ticker') -> Dict:
+    """
+    Return the signals of the processed ticker data, see Backtesting.get_ticker()
+    :param run_id: id of the processed data dump. Signals are reused as long as
+                   the id does not change, None always populates them.
+    :param populate: function populating the signals
+    :param kind: format of the signals returned by `populate`, each is cached separately
+    :return: signals as returned by `populate`
+    """
+    if run_id is None or _signal_cache.get('run_id') != run_id:
+        _signal_cache['signals'] = {}
+        _signal_cache['run_id'] = run_id
+    if run_id is None or kind not in _signal_cache['signals']:
+        _signal_cache['signals'][kind] = populate()
+    return _signal_cache['signals'][kind]
+
+
+# Hyperopt instance of the async scheduler. Forked workers inherit it
+# instead of pickling it for every evaluation.
+_hyperopt_worker_state: Dict[str, Any] = {}
+
+
+def _generate_optimizer_worker(params: List) -> Dict:
+    """
+    Evaluate one point of the search space in a forked worker process
+    """
+    return _hyperopt_worker_state['hyperopt'].generate_optimizer(params)
+
+
+def _distributed_worker() -> int:
+    """
+    Evaluate queued points in a forked worker process, see Hyperopt.run_worker()
+    """
+    return _hyperopt_worker_state['hyperopt'].run_worker()
 
 
 class Hyperopt(Backtesting):
@@ -64,9 +142,26 @@ class Hyperopt(Backtesting):
         # check that the reported Σ% values do not exceed this!
         self.expected_max_profit = 1000
 
-        # Previous evaluations
-        self.trials_file = os.path.join('user_data', 'hyperopt_results.pickle')
+        # Evaluations of all runs, see TrialStore
+        self.trials_file = Path(config.get('hyperopt_trials_file', TRIALS_FILE))
+        self.trial_store: Optional[TrialStore] = None
+        # Evaluations not yet written to the trial store
         self.trials: List = []
+        # Id of the search space, set by start()
+        self.space_id = ''
+
+        # Id of the current TICKERDATA_PICKLE dump, see load_processed()
+        self.processed_id: Optional[str] = None
+
+        # Loss and params of the evaluated points by params_key(), see run_cached().
+        # Left out when the instance is pickled for the joblib workers, see __getstate__()
+        self.results_cache: Dict[Tuple, Dict] = {}
+        self.cache_lookups = 0
+        self.cache_hits = 0
+
+        # Wall time of loading the data, and of asking, telling and evaluating points.
+        # log_timings() reports the totals, the window only limits the kept samples
+        self.timings = ProcessTimings(window=100)
 
     def get_args(self, params):
         dimensions = self.hyperopt_space()
@@ -81,28 +176,40 @@ class Hyperopt(Backtesting):
         arg_dict = {dim.name: value for dim, value in zip(dimensions, params)}
         return arg_dict
 
-    def save_trials(self) -> None:
+    def get_space_id(self) -> str:
         """
-        Save hyperopt trials to file
+        Identify the search space by the names and bounds of its dimensions, the hyperopt
+        and strategy classes and the data backtested (timerange, pairs and ticker interval).
+        Stored trials are only reused for the same search space.
         """
-        if self.trials:
-            logger.info('Saving %d evaluations to \'%s\'', len(self.trials), self.trials_file)
-            dump(self.trials, self.trials_file)
+        dimensions = ','.join(f'{dim.name}:{dim}' for dim in self.hyperopt_space())
+        space = '|'.join([
+            dimensions,
+            self.custom_hyperopt.__class__.__name__,
+            self.strategy.get_strategy_name(),
+            str(self.config.get('timerange')),
+            ','.join(sorted(self.config['exchange']['pair_whitelist'])),
+            str(self.ticker_interval),
+        ])
+        return hashlib.sha1(space.encode('utf-8')).hexdigest()
 
-    def read_trials(self) -> List:
+    def save_trials(self) -> None:
         """
-        Read hyperopt trials file
+        Append the trials evaluated since the last call to the trial store
         """
-        logger.info('Reading Trials from \'%s\'', self.trials_file)
-        trials = load(self.trials_file)
-        os.remove(self.trials_file)
-        return trials
+        if self.trials and self.trial_store:
+            logger.debug('Saving %d evaluations to \'%s\'', len(self.trials), self.trials_file)
+            self.trial_store.append(self.trials, self.space_id)
+            self.trials = []
 
     def log_trials_result(self) -> None:
         """
         Display Best hyperopt result
         """
-        results = sorted(self.trials, key=itemgetter('loss'))
+        results = self.trial_store.best(self.space_id) if self.trial_store else []
+        if not results:
+            logger.info('No evaluations found for this search space.')
+            return
         best_result = results[0]
         logger.info(
             'Best result:\n%s\nwith values:\n',
@@ -144,7 +251,8 @@ class Hyperopt(Backtesting):
         Objective function, returns sortino ratio
         """
         period = self.max_date - self.min_date
-        days_period = period.days
+        # Successive halving may backtest less than a day
+        days_period = max(period.days, 1)
 
         sum_total_profit = total_profit.sum()
         #adding slippage of 0.1% per trade
@@ -220,11 +328,7 @@ class Hyperopt(Backtesting):
             spaces += self.custom_hyperopt.stoploss_space()
         return spaces
 
-    def generate_optimizer(self, _params: Dict) -> Dict:
-        params = self.get_args(_params)
-        if self.has_space('roi'):
-            self.strategy.minimal_roi = self.custom_hyperopt.generate_roi_table(params)
-
+    def _set_signal_functions(self, params: Dict) -> None:
         if self.has_space('buy'):
             self.advise_buy = self.custom_hyperopt.buy_strategy_generator(params)
         elif hasattr(self.custom_hyperopt, 'populate_buy_trend'):
@@ -235,22 +339,28 @@ class Hyperopt(Backtesting):
         elif hasattr(self.custom_hyperopt, 'populate_sell_trend'):
             self.advise_sell = self.custom_hyperopt.populate_sell_trend  # type: ignore
 
-        if self.has_space('stoploss'):
-            self.strategy.stoploss = params['stoploss']
-
-        processed = load(TICKERDATA_PICKLE)
+    def _get_backtest_args(self, fidelity: float = 1.0) -> Dict[str, Any]:
+        """
+        :param fidelity: share of the timerange to backtest, starting at its beginning
+        """
+        processed = load_processed(self.processed_id)
         min_date, max_date = get_timeframe(processed)
+        if fidelity < 1:
+            max_date = min_date + (max_date - min_date) * fidelity
         self.min_date = min_date
         self.max_date = max_date
-        results = self.backtest(
-            {
-                'stake_amount': self.config['stake_amount'],
-                'processed': processed,
-                'position_stacking': self.config.get('position_stacking', True),
-                'start_date': min_date,
-                'end_date': max_date,
-            }
-        )
+        return {
+            'stake_amount': self.config['stake_amount'],
+            'processed': processed,
+            'position_stacking': self.config.get('position_stacking', True),
+            'start_date': min_date,
+            'end_date': max_date,
+        }
+
+    def _evaluate_results(self, results: DataFrame, params: Dict) -> Dict:
+        """
+        Calculate the loss of a backtest result
+        """
         result_explanation = self.format_results(results)
 
         #total_profit = results.profit_percent.sum()
@@ -275,6 +385,57 @@ class Hyperopt(Backtesting):
             'result': result_explanation,
         }
 
+    def generate_optimizer(self, _params: List, fidelity: float = 1.0) -> Dict:
+        params = self.get_args(_params)
+        if self.has_space('roi'):
+            self.strategy.minimal_roi = self.custom_hyperopt.generate_roi_table(params)
+
+        self._set_signal_functions(params)
+
+        if self.has_space('stoploss'):
+            self.strategy.stoploss = params['stoploss']
+
+        backtest_args = self._get_backtest_args(fidelity)
+        if not self.has_space('buy') and not self.has_space('sell'):
+            # Signals don't depend on roi / stoploss - populate them once per process
+            processed = backtest_args['processed']
+            backtest_args['ticker'] = load_signals(self.processed_id,
+                                                   lambda: self.get_ticker(processed))
+        results = self.backtest(backtest_args)
+        return self._evaluate_results(results, params)
+
+    def exit_candidates_possible(self) -> bool:
+        """
+        Tell if points can be evaluated together by generate_optimizer_batch():
+        only roi and stoploss are optimized, with position stacking.
+        """
+        return (not self.has_space('buy') and not self.has_space('sell')
+                and self.config.get('position_stacking', True))
+
+    def generate_optimizer_batch(self, points: List[List]) -> List[Dict]:
+        """
+        Evaluate many points of a roi / stoploss search space in one pass over
+        the buy signals, see Backtesting.backtest_exit_candidates()
+        :return: one result per point, same as generate_optimizer()
+        """
+        params_list = [self.get_args(point) for point in points]
+        self._set_signal_functions({})
+
+        roi_tables = [self.custom_hyperopt.generate_roi_table(params)
+                      if self.has_space('roi') else self.strategy.minimal_roi
+                      for params in params_list]
+        stoplosses = [params['stoploss'] if self.has_space('stoploss') else self.strategy.stoploss
+                      for params in params_list]
+
+        backtest_args = self._get_backtest_args()
+        processed = backtest_args['processed']
+        backtest_args['ticker'] = load_signals(self.processed_id,
+                                               lambda: self._get_ticker_arrays(processed),
+                                               kind='arrays')
+        all_results = self.backtest_exit_candidates(backtest_args, roi_tables, stoplosses)
+        return [self._evaluate_results(results, params)
+                for results, params in zip(all_results, params_list)]
+
     def format_results(self, results: DataFrame) -> str:
         """
         Return the format result in a string
@@ -299,61 +460,468 @@ class Hyperopt(Backtesting):
             acq_optimizer_kwargs={'n_jobs': cpu_count}
         )
 
-    def run_optimizer_parallel(self, parallel, asked) -> List:
+    def __getstate__(self) -> Dict:
+        """
+        Pickle the instance without the results cache, which the workers don't use
+        """
+        state = self.__dict__.copy()
+        state['results_cache'] = {}
+        return state
+
+    @staticmethod
+    def cache_entry(result: Dict) -> Dict:
+        """
+        Entry of the results cache: only the loss and params of the evaluation result,
+        as the loss of a cached point never improves the best loss, see log_results()
+        """
+        return {'loss': result['loss'], 'params': result['params']}
+
+    @staticmethod
+    def params_key(params: Dict) -> Tuple:
+        """
+        Key of the results cache: the parameter dict with numpy scalars converted
+        to python values, so points asked by skopt and loaded from the trial store match
+        """
+        return tuple(sorted((name, value.item() if hasattr(value, 'item') else value)
+                            for name, value in params.items()))
+
+    def run_cached(self, asked: List[List], evaluate: Callable[[List[List]], List]) -> List:
+        """
+        Evaluate only the asked points which were not evaluated before,
+        and reuse the cached results for the others
+        :param evaluate: returns the results of the new points, in their order
+        :return: results in the order of `asked`, the full results for the new points
+            and the cache entries (loss and params) for the others
+        """
+        keys = [self.params_key(self.get_args(point)) for point in asked]
+        new: Dict[Tuple, List] = {}
+        for key, point in zip(keys, asked):
+            if key not in self.results_cache and key not in new:
+                new[key] = point
+        results: Dict[Tuple, Dict] = {}
+        if new:
+            f_val = evaluate(list(new.values()))
+            results.update(zip(new, f_val))
+            self.results_cache.update((key, self.cache_entry(result))
+                                      for key, result in results.items())
+            self.trials += f_val
+        self.cache_lookups += len(asked)
+        self.cache_hits += len(asked) - len(new)
+        return [results[key] if key in results else self.results_cache[key] for key in keys]
+
+    def log_cache_stats(self) -> None:
+        """
+        Display how many evaluations were answered by the results cache
+        """
+        if self.cache_lookups:
+            logger.info('Results cache: %d of %d points were evaluated before '
+                        '(%.1f%% hit rate).', self.cache_hits, self.cache_lookups,
+                        100.0 * self.cache_hits / self.cache_lookups)
+
+    def run_optimizer_parallel(self, parallel, asked, fidelity: float = 1.0) -> List:
         return parallel(delayed(
-                        wrap_non_picklable_objects(self.generate_optimizer))(v) for v in asked)
+                        wrap_non_picklable_objects(self.generate_optimizer))(v, fidelity)
+                        for v in asked)
 
-    def load_previous_results(self):
-        #read trials file if we have one
-        if os.path.exists(self.trials_file) and os.path.getsize(self.trials_file) > 0:
-            self.trials = self.read_trials()
-            logger.info(
-                'Loaded %d previous evaluations from disk.',
-                len(self.trials)
-            )
+    def run_optimizer_parallel_batch(self, parallel, asked, jobs: int) -> List:
+        """
+        Split the asked points into one chunk per job, each evaluated by
+        generate_optimizer_batch()
+        :return: results in the order of `asked`
+        """
+        size = -(-len(asked) // jobs)
+        chunks = [asked[i:i + size] for i in range(0, len(asked), size)]
+        f_val = parallel(delayed(
+            wrap_non_picklable_objects(self.generate_optimizer_batch))(c) for c in chunks)
+        return [result for chunk in f_val for result in chunk]
 
-    def start(self) -> None:
+    def ask(self, opt: Optimizer, n_points: int) -> List[List]:
+        with self.timings.stage('ask'):
+            return opt.ask(n_points=n_points)
+
+    def tell(self, opt: Optimizer, x: List, y: Any) -> None:
+        """
+        Tell results to the optimizer, see Optimizer.tell()
+        """
+        self.trim_history(opt)
+        with self.timings.stage('tell'):
+            opt.tell(x, y)
+
+    def trim_history(self, opt: Optimizer) -> None:
+        """
+        Keep at most hyperopt_optimizer_history points in the optimizer, as its model
+        is refitted on all of them at every tell. The best half is kept, filled up
+        with the most recent points.
+        """
+        limit = self.config.get('hyperopt_optimizer_history')
+        if not limit or len(opt.yi) <= limit:
+            return
+        best = set(sorted(range(len(opt.yi)), key=opt.yi.__getitem__)[:limit // 2])
+        recent = [i for i in reversed(range(len(opt.yi))) if i not in best]
+        keep = sorted(best.union(recent[:limit - len(best)]))
+        opt.Xi[:] = [opt.Xi[i] for i in keep]
+        opt.yi[:] = [opt.yi[i] for i in keep]
+        # Only the last model is used to ask for points
+        del opt.models[:-1]
+
+    def log_timings(self) -> None:
+        """
+        Display where the time of the run went, and warn if the optimizer itself
+        took longer than evaluating the points
+        """
+        totals = self.timings.totals()
+        if not totals:
+            return
+        logger.info('Time spent:\n%s', '\n'.join(
+            f'{stage:>10}: {total:10.2f} s in {count:6d} calls, {total / count * 1000:10.1f} ms'
+            f' per call' for stage, (count, total) in totals.items()))
+        overhead = sum(totals[stage][1] for stage in ('ask', 'tell') if stage in totals)
+        evaluate = totals.get('evaluate', (0, 0.0))[1]
+        if evaluate and overhead > evaluate:
+            logger.warning('Asking and telling the optimizer took longer than evaluating the '
+                           'points (%.1f s vs %.1f s). Consider limiting its history with '
+                           '--optimizer-history.', overhead, evaluate)
+
+    @staticmethod
+    def ask_pending(opt: Optimizer, pending: List[List]) -> List:
+        """
+        Ask for a new point while other points are still being evaluated.
+        Like Optimizer.ask(n_points) with strategy "cl_min", the pending points are
+        told to a copy of the optimizer with the best loss so far, so the new point
+        differs from them.
+        :param pending: points asked for, but not told yet
+        :return: the new point
+        """
+        if not pending:
+            return opt.ask()
+        opt_copy = opt.copy(random_state=opt.rng.randint(0, np.iinfo(np.int32).max))
+        y_lie = min(opt.yi) if opt.yi else 0.0
+        opt_copy.tell(pending, [y_lie] * len(pending))
+        return opt_copy.ask()
+
+    def run_optimizer_batches(self, opt: Optimizer, cpus: int) -> None:
+        """
+        Evaluate `cpus` * hyperopt_batch_size points at a time, telling the optimizer
+        once the whole batch is done.
+        When only roi and stoploss are optimized, the points of each core are evaluated
+        together by generate_optimizer_batch().
+        """
+        points = cpus * self.config.get('hyperopt_batch_size', 1)
+        batch_exits = points > cpus and self.exit_candidates_possible()
+        if batch_exits:
+            logger.info('Evaluating %s roi / stoploss points per CPU core in one pass ...',
+                        points // cpus)
+        EVALS = max(self.total_tries // points, 1)
+        with Parallel(n_jobs=cpus) as parallel:
+            for i in range(EVALS):
+                asked = self.ask(opt, points)
+                with self.timings.stage('evaluate'):
+                    if batch_exits:
+                        f_val = self.run_cached(asked, lambda new: (
+                            self.run_optimizer_parallel_batch(parallel, new, cpus)))
+                    else:
+                        f_val = self.run_cached(asked, lambda new: self.run_optimizer_parallel(
+                            parallel, new))
+                self.tell(opt, asked, [i['loss'] for i in f_val])
+
+                for j in range(points):
+                    self.log_results({
+                        'loss': f_val[j]['loss'],
+                        'current_tries': i * points + j,
+                        'total_tries': self.total_tries,
+                        'result': f_val[j]['result'],
+                    })
+                self.save_trials()
+
+    def run_optimizer_halving(self, opt: Optimizer, cpus: int) -> None:
+        """
+        Successive halving: each step asks for `cpus` * eta ** (rungs - 1) points and
+        backtests them on the first 1 / eta ** (rungs - 1) of the timerange. The best
+        1 / eta of them are promoted to an eta times longer part, until the last rung
+        backtests the remaining `cpus` points on the whole timerange.
+        Every point is told with the loss of the longest part it was backtested on.
+        """
+        rungs = self.config['hyperopt_halving_rungs']
+        eta = constants.HYPEROPT_HALVING_ETA
+        points = cpus * eta ** (rungs - 1)
+        logger.info('Successive halving: backtesting %d points per step on 1/%d of the '
+                    'timerange, the best %d of them on the whole timerange ...',
+                    points, eta ** (rungs - 1), cpus)
+        EVALS = max(self.total_tries // points, 1)
+        with Parallel(n_jobs=cpus) as parallel:
+            for i in range(EVALS):
+                asked = self.ask(opt, points)
+                losses = [MAX_LOSS] * points
+                promoted = list(range(points))
+                with self.timings.stage('evaluate'):
+                    for rung in range(rungs - 1):
+                        fidelity = 1 / eta ** (rungs - 1 - rung)
+                        f_val = self.run_optimizer_parallel(
+                            parallel, [asked[j] for j in promoted], fidelity)
+                        for j, result in zip(promoted, f_val):
+                            losses[j] = result['loss']
+                        promoted = sorted(promoted, key=losses.__getitem__)
+                        promoted = promoted[:max(len(promoted) // eta, 1)]
+
+                    f_val = self.run_cached([asked[j] for j in promoted], lambda new: (
+                        self.run_optimizer_parallel(parallel, new)))
+                for j, result in zip(promoted, f_val):
+                    losses[j] = result['loss']
+                    self.log_results({
+                        'loss': result['loss'],
+                        'current_tries': i * points + j,
+                        'total_tries': self.total_tries,
+                        'result': result['result'],
+                    })
+                self.tell(opt, asked, losses)
+                self.save_trials()
+
+    def run_optimizer_async(self, opt: Optimizer, cpus: int) -> None:
+        """
+        Keep all `cpus` worker processes busy: every result is told to the optimizer
+        as soon as it arrives, and a new point is asked for the free worker right away.
+        """
+        total = max(self.total_tries, 1)
+        pending: Dict[Future, List] = {}
+        asked = told = 0
+        _hyperopt_worker_state['hyperopt'] = self
+        try:
+            with ProcessPoolExecutor(max_workers=cpus) as executor:
+                while told < total:
+                    done = set()
+                    while len(pending) < cpus and asked < total:
+                        with self.timings.stage('ask'):
+                            point = self.ask_pending(opt, list(pending.values()))
+                        asked += 1
+                        key = self.params_key(self.get_args(point))
+                        self.cache_lookups += 1
+                        if key in self.results_cache:
+                            # Told right away, without taking a worker
+                            self.cache_hits += 1
+                            cached: Future = Future()
+                            cached.set_result(self.results_cache[key])
+                            pending[cached] = point
+                            done.add(cached)
+                            break
+                        pending[executor.submit(_generate_optimizer_worker, point)] = point
+
+                    if not done:
+                        with self.timings.stage('evaluate'):
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        point = pending.pop(future)
+                        f_val = future.result()
+                        self.tell(opt, point, f_val['loss'])
+
+                        key = self.params_key(self.get_args(point))
+                        if key not in self.results_cache:
+                            self.results_cache[key] = self.cache_entry(f_val)
+                            self.trials.append(f_val)
+                        self.log_results({
+                            'loss': f_val['loss'],
+                            'current_tries': told,
+                            'total_tries': self.total_tries,
+                            'result': f_val['result'],
+                        })
+                        told += 1
+                    self.save_trials()
+        finally:
+            for future in pending:
+                future.cancel()
+            _hyperopt_worker_state.clear()
+
+    def run_optimizer_distributed(self, opt: Optimizer, cpus: int) -> None:
+        """
+        Coordinator of distributed hyperopt: queue points in the trial store, keeping
+        `cpus` of them waiting for a worker, and tell the results stored by the workers.
+        Backtests are left to `hyperopt --worker` processes attached to the same store.
+        """
+        store = self.trial_store
+        if store is None:
+            raise OperationalException('Distributed hyperopt needs a trial store.')
+        total = max(self.total_tries, 1)
+        run = uuid.uuid4().hex
+        pending: Dict[int, List] = {}
+        asked = told = 0
+        logger.info('Queueing points in \'%s\', waiting for workers ...', self.trials_file)
+        try:
+            while told < total:
+                done: List[Tuple[List, Dict]] = []
+                while asked < total and store.queued(run) < cpus:
+                    with self.timings.stage('ask'):
+                        point = self.ask_pending(opt, list(pending.values()))
+                    asked += 1
+                    key = self.params_key(self.get_args(point))
+                    self.cache_lookups += 1
+                    if key in self.results_cache:
+                        # Told right away, without queueing it
+                        self.cache_hits += 1
+                        done.append((point, self.results_cache[key]))
+                        break
+                    pending[store.enqueue([point], self.space_id, run)[0]] = point
+
+                # Results are stored by the workers already
+                for queue_id, f_val in store.finished(list(pending)).items():
+                    point = pending.pop(queue_id)
+                    self.results_cache[self.params_key(self.get_args(point))] = \
+                        self.cache_entry(f_val)
+                    done.append((point, f_val))
+
+                for point, f_val in done:
+                    self.tell(opt, point, f_val['loss'])
+                    self.log_results({
+                        'loss': f_val['loss'],
+                        'current_tries': told,
+                        'total_tries': self.total_tries,
+                        'result': f_val['result'],
+                    })
+                    told += 1
+                if not done:
+                    if store.requeue_stale(run, DISTRIBUTED_STALE_TIMEOUT):
+                        logger.warning('Queued points again whose worker did not report back.')
+                    with self.timings.stage('evaluate'):
+                        time.sleep(DISTRIBUTED_POLL_INTERVAL)
+        finally:
+            store.cancel(run)
+
+    def run_worker(self) -> int:
+        """
+        Evaluate the points queued for this search space by a coordinator, until
+        none was queued for DISTRIBUTED_IDLE_TIMEOUT seconds
+        :return: number of evaluated points
+        """
+        store = self.trial_store
+        if store is None:
+            raise OperationalException('Hyperopt workers need a trial store.')
+        worker = f'{socket.gethostname()}:{os.getpid()}'
+        evaluated = 0
+        idle_since = time.time()
+        while time.time() - idle_since < DISTRIBUTED_IDLE_TIMEOUT:
+            claimed = store.claim(self.space_id, worker)
+            if claimed is None:
+                time.sleep(DISTRIBUTED_POLL_INTERVAL)
+                continue
+            queue_id, point = claimed
+            store.complete(queue_id, self.generate_optimizer(point), self.space_id)
+            evaluated += 1
+            idle_since = time.time()
+        return evaluated
+
+    def run_workers(self, cpus: int) -> None:
+        """
+        Run one worker per CPU core, see run_worker()
+        """
+        logger.info('Evaluating the points queued in \'%s\' on %d CPU cores ...',
+                    self.trials_file, cpus)
+        # ProcessPoolExecutor only takes a start method (mp_context) from python 3.7 on
+        if not uses_fork_start_method():
+            logger.warning('Running several workers needs the "fork" start method, which is '
+                           'not the default on this platform. Using a single worker ...')
+            evaluated = self.run_worker()
+        else:
+            _hyperopt_worker_state['hyperopt'] = self
+            try:
+                with ProcessPoolExecutor(max_workers=cpus) as executor:
+                    futures = [executor.submit(_distributed_worker) for _ in range(cpus)]
+                    evaluated = sum(future.result() for future in futures)
+            finally:
+                _hyperopt_worker_state.clear()
+        logger.info('No points queued for %d seconds. Evaluated %d points.',
+                    DISTRIBUTED_IDLE_TIMEOUT, evaluated)
+
+    def load_previous_results(self, opt: Optimizer) -> None:
+        """
+        Warm-start the optimizer and the results cache with the stored trials of the same
+        search space. The space id covers the backtested data, so cached results of other
+        timeranges, pairs or ticker intervals are not reused.
+        """
+        if not self.trial_store:
+            return
+        dimensions = self.hyperopt_space()
+        points, losses = [], []
+        for trial in self.trial_store.trials(self.space_id):
+            if trial['loss'] is None:
+                continue
+            self.results_cache[self.params_key(trial['params'])] = self.cache_entry(trial)
+            points.append([trial['params'][dim.name] for dim in dimensions])
+            losses.append(trial['loss'])
+        if points:
+            self.tell(opt, points, losses)
+            self.current_best_loss = min(self.current_best_loss, min(losses))
+            logger.info('Loaded %d previous evaluations from \'%s\'.',
+                        len(points), self.trials_file)
+
+    def load_processed_data(self, dump_file: bool = True) -> None:
+        """
+        Load and process the ticker data of the backtests
+        :param dump_file: dump the data to TICKERDATA_PICKLE for the joblib workers,
+                          otherwise it's only cached for the forked worker processes
+        """
         timerange = Arguments.parse_timerange(None if self.config.get(
             'timerange') is None else str(self.config.get('timerange')))
         data = load_data(
             datadir=Path(self.config['datadir']) if self.config.get('datadir') else None,
             pairs=self.config['exchange']['pair_whitelist'],
             ticker_interval=self.ticker_interval,
-            timerange=timerange
+            timerange=timerange,
+            workers=self.config.get('data_load_workers', 1),
+            cache=self.config.get('ticker_data_cache', False)
         )
 
         #if self.has_space('buy') or self.has_space('sell'):
         self.strategy.advise_indicators = \
             self.custom_hyperopt.populate_indicators  # type: ignore
-        dump(self.strategy.tickerdata_to_dataframe(data), TICKERDATA_PICKLE)
+        processed = self.strategy.tickerdata_to_dataframe(data)
+        self.processed_id = uuid.uuid4().hex
+        if dump_file:
+            dump(processed, TICKERDATA_PICKLE)
+        else:
+            # Several workers on one host would overwrite each other's TICKERDATA_PICKLE
+            _processed_cache.update({'data': processed, 'run_id': self.processed_id})
+
+    def start(self) -> None:
+        scheduler = self.config.get('hyperopt_scheduler', constants.DEFAULT_HYPEROPT_SCHEDULER)
+        worker = self.config.get('hyperopt_worker', False)
+        halving = self.config.get('hyperopt_halving_rungs', 1) > 1
+        # The coordinator of distributed hyperopt leaves the backtests to the workers
+        if worker or halving or scheduler != 'distributed':
+            with self.timings.stage('load data'):
+                self.load_processed_data(dump_file=not worker)
         self.exchange = None  # type: ignore
-        self.load_previous_results()
+        self.trial_store = TrialStore(self.trials_file)
+        self.space_id = self.get_space_id()
 
         cpus = multiprocessing.cpu_count()
         logger.info(f'Found {cpus} CPU cores. Let\'s make them scream!')
 
+        if worker:
+            self.run_workers(cpus)
+            return
+
+        # ProcessPoolExecutor only takes a start method (mp_context) from python 3.7 on
+        if scheduler == 'async' and not uses_fork_start_method():
+            logger.warning('The async scheduler needs the "fork" start method, which is not '
+                           'the default on this platform. Using the batch scheduler ...')
+            scheduler = 'batch'
+
         opt = self.get_optimizer(cpus)
-        EVALS = max(self.total_tries // cpus, 1)
+        self.load_previous_results(opt)
         try:
-            with Parallel(n_jobs=cpus) as parallel:
-                for i in range(EVALS):
-                    asked = opt.ask(n_points=cpus)
-                    f_val = self.run_optimizer_parallel(parallel, asked)
-                    opt.tell(asked, [i['loss'] for i in f_val])
-
-                    self.trials += f_val
-                    for j in range(cpus):
-                        self.log_results({
-                            'loss': f_val[j]['loss'],
-                            'current_tries': i * cpus + j,
-                            'total_tries': self.total_tries,
-                            'result': f_val[j]['result'],
-                        })
+            if halving:
+                self.run_optimizer_halving(opt, cpus)
+            elif scheduler == 'async':
+                self.run_optimizer_async(opt, cpus)
+            elif scheduler == 'distributed':
+                self.run_optimizer_distributed(opt, cpus)
+            else:
+                self.run_optimizer_batches(opt, cpus)
         except KeyboardInterrupt:
             print('User interrupted..')
 
         self.save_trials()
         self.log_trials_result()
+        self.log_cache_stats()
+        self.log_timings()
 
 
 def start(args: Namespace) -> None:
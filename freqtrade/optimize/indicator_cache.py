@@ -0,0 +1,140 @@
+"""
+Persistent cache of the dataframes returned by IStrategy.advise_indicators()
+"""
+import hashlib
+import inspect
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pandas import DataFrame, read_pickle
+from pandas.util import hash_pandas_object
+
+from freqtrade.strategy.interface import IStrategy
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+
+def strategy_hash(strategy: IStrategy) -> str:
+    """
+    Identify the indicators a strategy calculates, by the source of the module
+    defining its populate_indicators(), the name of that method, the name of the strategy
+    class and its class attributes, which populate_indicators() may read.
+    The ticker interval is part of the cache file name. Values the strategy reads from
+    the configuration are not covered.
+    """
+    strategy_class = type(strategy)
+    populate_indicators = strategy_class.populate_indicators
+    source = inspect.getsource(inspect.getmodule(populate_indicators))
+    hasher = hashlib.sha1(source.encode('utf-8'))
+    hasher.update(populate_indicators.__qualname__.encode('utf-8'))
+    hasher.update(strategy_class.__qualname__.encode('utf-8'))
+    hasher.update(repr(class_attributes(strategy_class)).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def class_attributes(strategy_class: Type[IStrategy]) -> List[Tuple[str, Any]]:
+    """
+    Public class attributes of a strategy class and its bases below IStrategy,
+    without methods and properties
+    :return: (name, value) tuples sorted by name
+    """
+    attributes: Dict[str, Any] = {}
+    mro = strategy_class.__mro__
+    # Base classes first, so subclasses override their values
+    for klass in reversed(mro[:mro.index(IStrategy)]):
+        attributes.update((name, value) for name, value in vars(klass).items()
+                          if not name.startswith('_') and not callable(value)
+                          and not isinstance(value, (staticmethod, classmethod, property)))
+    return sorted(attributes.items())
+
+
+def data_fingerprint(dataframe: DataFrame) -> str:
+    """
+    Hash of the ohlcv content of a dataframe. Other columns are ignored, so frames
+    already populated by another strategy give the same fingerprint.
+    """
+    ohlcv = dataframe[OHLCV_COLUMNS]
+    return hashlib.sha1(hash_pandas_object(ohlcv, index=True).values.tobytes()).hexdigest()
+
+
+class IndicatorCache(object):
+    """
+    Stores the indicator dataframe of each pair as pickle file, named by
+    pair, ticker interval, strategy hash and data fingerprint.
+    Files are never invalidated - stale files simply don't match any more.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        # Dataframes calculated or loaded during this run, by strategy hash.
+        # Released by release() once a strategy is backtested.
+        self._frames: Dict[str, Dict[Path, DataFrame]] = {}
+
+    def cache_file(self, strategy: IStrategy, pair: str, dataframe: DataFrame,
+                   strategy_key: Optional[str] = None) -> Path:
+        """
+        :param strategy_key: strategy_hash() of the strategy, calculated if not given
+        """
+        strategy_key = strategy_key or strategy_hash(strategy)
+        return self.cache_dir.joinpath(
+            f"{pair.replace('/', '_')}-{strategy.ticker_interval}-"
+            f"{strategy_key[:16]}-{data_fingerprint(dataframe)[:16]}.pkl")
+
+    def advise_indicators(self, strategy: IStrategy, dataframe: DataFrame,
+                          pair: str, strategy_key: Optional[str] = None) -> DataFrame:
+        """
+        Cached version of strategy.advise_indicators().
+        Unlike advise_indicators(), the given dataframe is not modified.
+        :return: a copy of the cached dataframe, so callers may modify it
+        """
+        strategy_key = strategy_key or strategy_hash(strategy)
+        cache_file = self.cache_file(strategy, pair, dataframe, strategy_key)
+        frames = self._frames.setdefault(strategy_key, {})
+        frame = frames.get(cache_file)
+        if frame is None and cache_file.is_file():
+            try:
+                frame = read_pickle(str(cache_file))
+            except Exception as error:
+                logger.warning('Could not read indicator cache %s: %s', cache_file, error)
+        if frame is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            frame = strategy.advise_indicators(dataframe.copy(), {'pair': pair})
+            self._store(cache_file, frame)
+        frames[cache_file] = frame
+        return frame.copy()
+
+    def tickerdata_to_dataframe(self, strategy: IStrategy,
+                                tickerdata: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Cached version of strategy.tickerdata_to_dataframe()
+        """
+        strategy_key = strategy_hash(strategy)
+        result = {pair: self.advise_indicators(strategy, pair_data, pair, strategy_key)
+                  for pair, pair_data in tickerdata.items()}
+        logger.info('Indicator cache: %s hits, %s misses', self.hits, self.misses)
+        return result
+
+    def release(self, strategy: IStrategy) -> None:
+        """
+        Drop the dataframes of a strategy from memory. They are still read from disk
+        when needed again.
+        """
+        self._frames.pop(strategy_hash(strategy), None)
+
+    def _store(self, cache_file: Path, frame: DataFrame) -> None:
+        # Unique per process, parallel strategy workers may store the same file
+        tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            frame.to_pickle(str(tmp_file))
+            os.replace(str(tmp_file), str(cache_file))
+        except OSError as error:
+            logger.warning('Could not write indicator cache %s: %s', cache_file, error)
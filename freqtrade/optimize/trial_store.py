@@ -0,0 +1,203 @@
+"""
+Append-only store of hyperopt evaluations, kept in a SQLite file.
+Also holds the queue of points distributed to hyperopt workers.
+"""
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    # numpy scalars, as returned by skopt
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class TrialStore(object):
+    """
+    Evaluated hyperopt trials. Every call opens its own connection, so the store
+    can be pickled to joblib workers and shared by several processes.
+
+    Trials are tagged with the id of the search space they were evaluated on,
+    so results of a different search space are not mixed in.
+
+    Points queued by a coordinator are claimed by the workers of the same search
+    space. A queued point has no worker yet, a running point no trial yet.
+    """
+
+    def __init__(self, filename: Path, timeout: float = 30.0) -> None:
+        self.filename = filename
+        self.timeout = timeout
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.filename), timeout=self.timeout)
+
+    def _init_db(self) -> None:
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS trials ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'space TEXT NOT NULL, '
+                'params TEXT NOT NULL, '
+                'loss REAL, '
+                'result TEXT, '
+                'created REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS trials_space_loss ON trials (space, loss)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS queue ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'run TEXT NOT NULL, '
+                'space TEXT NOT NULL, '
+                'point TEXT NOT NULL, '
+                'worker TEXT, '
+                'trial INTEGER, '
+                'created REAL NOT NULL, '
+                'claimed REAL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS queue_space_worker ON queue (space, worker)')
+            conn.execute('CREATE INDEX IF NOT EXISTS queue_run ON queue (run)')
+
+    def append(self, trials: List[Dict], space: str) -> None:
+        """
+        Store evaluated trials in one transaction
+        :param trials: dicts with params, loss and result, as returned by generate_optimizer()
+        :param space: id of the search space the trials were evaluated on
+        """
+        if not trials:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany('INSERT INTO trials (space, params, loss, result, created) '
+                             'VALUES (?, ?, ?, ?, ?)', [self._trial_row(trial, space)
+                                                        for trial in trials])
+
+    @staticmethod
+    def _trial_row(trial: Dict, space: str) -> Tuple:
+        return (space, json.dumps(trial['params'], default=_json_default),
+                trial['loss'], trial['result'], time.time())
+
+    def _select(self, query: str, args: tuple) -> Iterator[Dict]:
+        with closing(self._connect()) as conn:
+            for params, loss, result in conn.execute(query, args):
+                yield {'params': json.loads(params), 'loss': loss, 'result': result}
+
+    def trials(self, space: str) -> List[Dict]:
+        """
+        :return: all trials of the search space, in the order they were stored
+        """
+        return list(self._select('SELECT params, loss, result FROM trials '
+                                 'WHERE space = ? ORDER BY id', (space, )))
+
+    def best(self, space: str, limit: int = 1) -> List[Dict]:
+        """
+        :return: the `limit` trials of the search space with the lowest loss
+        """
+        return list(self._select('SELECT params, loss, result FROM trials '
+                                 'WHERE space = ? AND loss IS NOT NULL '
+                                 'ORDER BY loss, id LIMIT ?', (space, limit)))
+
+    def count(self, space: Optional[str] = None) -> int:
+        """
+        :return: number of trials of the search space, or of all trials
+        """
+        with closing(self._connect()) as conn:
+            if space is None:
+                return conn.execute('SELECT COUNT(*) FROM trials').fetchone()[0]
+            return conn.execute('SELECT COUNT(*) FROM trials WHERE space = ?',
+                                (space, )).fetchone()[0]
+
+    def enqueue(self, points: List[List], space: str, run: str) -> List[int]:
+        """
+        Queue points for the workers of the search space
+        :param run: id of the coordinator run the points belong to
+        :return: queue ids of the points
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            # lastrowid is always set after an INSERT into a rowid table
+            return [cast(int, conn.execute('INSERT INTO queue (run, space, point, created) '
+                                           'VALUES (?, ?, ?, ?)',
+                                           (run, space, json.dumps(point, default=_json_default),
+                                            now)).lastrowid)
+                    for point in points]
+
+    def claim(self, space: str, worker: str) -> Optional[Tuple[int, List]]:
+        """
+        Take the oldest queued point of the search space
+        :param worker: name of the claiming worker
+        :return: queue id and point, None if no point is queued
+        """
+        with closing(self._connect()) as conn:
+            # Exclusive from the select on, so no two workers claim the same point
+            conn.isolation_level = None
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute('SELECT id, point FROM queue WHERE space = ? '
+                                   'AND worker IS NULL ORDER BY id LIMIT 1', (space, )).fetchone()
+                if row:
+                    conn.execute('UPDATE queue SET worker = ?, claimed = ? WHERE id = ?',
+                                 (worker, time.time(), row[0]))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return (row[0], json.loads(row[1])) if row else None
+
+    def complete(self, queue_id: int, trial: Dict, space: str) -> None:
+        """
+        Store the trial of a claimed point and mark the point as done
+        """
+        with closing(self._connect()) as conn, conn:
+            trial_id = conn.execute('INSERT INTO trials (space, params, loss, result, created) '
+                                    'VALUES (?, ?, ?, ?, ?)',
+                                    self._trial_row(trial, space)).lastrowid
+            conn.execute('UPDATE queue SET trial = ? WHERE id = ?', (trial_id, queue_id))
+
+    def finished(self, queue_ids: List[int]) -> Dict[int, Dict]:
+        """
+        :return: trials of the done points among `queue_ids`, by queue id
+        """
+        if not queue_ids:
+            return {}
+        placeholders = ', '.join('?' * len(queue_ids))
+        with closing(self._connect()) as conn:
+            rows = conn.execute('SELECT queue.id, trials.params, trials.loss, trials.result '
+                                'FROM queue JOIN trials ON trials.id = queue.trial '
+                                f'WHERE queue.id IN ({placeholders})', queue_ids).fetchall()
+        return {queue_id: {'params': json.loads(params), 'loss': loss, 'result': result}
+                for queue_id, params, loss, result in rows}
+
+    def queued(self, run: str) -> int:
+        """
+        :return: number of points of the run not claimed by a worker yet
+        """
+        with closing(self._connect()) as conn:
+            return conn.execute('SELECT COUNT(*) FROM queue WHERE run = ? AND worker IS NULL',
+                                (run, )).fetchone()[0]
+
+    def requeue_stale(self, run: str, timeout: float) -> int:
+        """
+        Queue the points of the run again which were claimed more than `timeout`
+        seconds ago without result, e.g. because the worker died
+        :return: number of points queued again
+        """
+        with closing(self._connect()) as conn, conn:
+            return conn.execute('UPDATE queue SET worker = NULL, claimed = NULL '
+                                'WHERE run = ? AND trial IS NULL AND claimed < ?',
+                                (run, time.time() - timeout)).rowcount
+
+    def cancel(self, run: str) -> None:
+        """
+        Remove the points of the run not claimed by a worker yet
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM queue WHERE run = ? AND worker IS NULL', (run, ))
@@ -0,0 +1,493 @@
+# pragma pylint: disable=too-many-arguments, too-many-locals
+
+"""
+Array based exit detection used by the vectorized backtest engine.
+
+The functions in this module mirror IStrategy.should_sell() (stoploss, trailing stoploss,
+ROI and sell signal handling), but evaluate a whole window of candles at once
+on numpy arrays instead of calling should_sell() candle by candle.
+"""
+import logging
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex
+
+from freqtrade.persistence import Trade
+from freqtrade.strategy.interface import IStrategy, SellType
+
+logger = logging.getLogger(__name__)
+
+# Number of candles evaluated in the first pass when searching for an exit.
+# The window doubles on every following pass, so short trades stay cheap
+# while long trades don't need one pass per candle.
+SCAN_WINDOW = 64
+
+NS_PER_MINUTE = 60 * 10**9
+
+
+class TickerArrays(NamedTuple):
+    """
+    Column arrays of one pair, as returned by Backtesting._get_ticker_data()
+    """
+    index: np.ndarray
+    dates: DatetimeIndex
+    date_ns: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    buy: np.ndarray
+    sell: np.ndarray
+    # Rate used for stoploss checks (`low or rate` in should_sell)
+    low_rate: np.ndarray
+    # Rate used to move min/max rates and the trailing stop (`high or low_rate`)
+    high_rate: np.ndarray
+    # Rate used for ROI checks (`high or rate` in should_sell)
+    roi_rate: np.ndarray
+    buy_flag: np.ndarray
+    sell_flag: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, frame: DataFrame) -> 'TickerArrays':
+        dates = DatetimeIndex(frame['date'])
+        open_ = frame['open'].values.astype(np.float64)
+        high = frame['high'].values.astype(np.float64)
+        low = frame['low'].values.astype(np.float64)
+        buy = frame['buy'].values.astype(np.float64)
+        sell = frame['sell'].values.astype(np.float64)
+        low_rate = np.where(low != 0, low, open_)
+        return cls(
+            index=frame.index.values,
+            dates=dates,
+            date_ns=dates.asi8,
+            open=open_,
+            high=high,
+            low=low,
+            buy=buy,
+            sell=sell,
+            low_rate=low_rate,
+            high_rate=np.where(high != 0, high, low_rate),
+            roi_rate=np.where(high != 0, high, open_),
+            # Truthiness as used by should_sell() - NaN counts as a signal there as well
+            buy_flag=buy != 0,
+            sell_flag=sell != 0,
+        )
+
+
+class ExitParameters(NamedTuple):
+    """
+    Strategy and configuration settings taking part in the sell decision
+    """
+    stoploss: float
+    roi_durations: np.ndarray
+    roi_values: np.ndarray
+    trailing_stop: bool
+    trailing_stop_positive: Optional[float]
+    trailing_stop_positive_offset: float
+    trailing_only_offset_is_reached: bool
+    use_sell_signal: bool
+    sell_profit_only: bool
+    ignore_roi_if_buy_signal: bool
+    fee: float
+    stake_amount: float
+
+    @classmethod
+    def from_strategy(cls, strategy: IStrategy, fee: float,
+                      stake_amount: float) -> 'ExitParameters':
+        config = strategy.config
+        experimental = config.get('experimental', {})
+        roi = sorted((float(k), float(v)) for k, v in strategy.minimal_roi.items())
+        return cls(
+            stoploss=strategy.stoploss,
+            roi_durations=np.array([k for k, _ in roi], dtype=np.float64),
+            roi_values=np.array([v for _, v in roi], dtype=np.float64),
+            trailing_stop=bool(config.get('trailing_stop', False)),
+            trailing_stop_positive=config.get('trailing_stop_positive')
+            if 'trailing_stop_positive' in config else None,
+            trailing_stop_positive_offset=config.get('trailing_stop_positive_offset') or 0.0,
+            trailing_only_offset_is_reached=bool(
+                config.get('trailing_only_offset_is_reached', False)),
+            use_sell_signal=bool(experimental.get('use_sell_signal', False)),
+            sell_profit_only=bool(experimental.get('sell_profit_only', False)),
+            ignore_roi_if_buy_signal=bool(experimental.get('ignore_roi_if_buy_signal', False)),
+            fee=fee,
+            stake_amount=stake_amount,
+        )
+
+
+class ExitCandidates(NamedTuple):
+    """
+    ROI tables and stoplosses evaluated together by find_exits().
+    ROI tables are padded with infinite durations, so all rows have the same length.
+    """
+    stoploss: np.ndarray
+    roi_durations: np.ndarray
+    roi_values: np.ndarray
+
+    @classmethod
+    def from_values(cls, roi_tables: Sequence[Dict],
+                    stoplosses: Sequence[float]) -> 'ExitCandidates':
+        """
+        :param roi_tables: one minimal_roi dict per candidate
+        :param stoplosses: one stoploss per candidate
+        """
+        if len(roi_tables) != len(stoplosses):
+            raise ValueError('Number of roi tables and stoplosses does not match: '
+                             f'{len(roi_tables)} != {len(stoplosses)}')
+        tables = [sorted((float(k), float(v)) for k, v in table.items()) for table in roi_tables]
+        width = max([len(table) for table in tables] + [1])
+        durations = np.full((len(tables), width), np.inf)
+        values = np.full((len(tables), width), np.inf)
+        for num, table in enumerate(tables):
+            durations[num, :len(table)] = [k for k, _ in table]
+            values[num, :len(table)] = [v for _, v in table]
+        return cls(np.asarray(stoplosses, dtype=np.float64), durations, values)
+
+
+class ExitPoint(NamedTuple):
+    """
+    Exit found for a trade
+    """
+    # Row of the exit in the TickerArrays (a field named `index` would shadow tuple.index)
+    row: int
+    sell_type: SellType
+    close_rate: float
+    open_at_end: bool
+
+
+def _fix_rounding_ties(rounded: np.ndarray, profit: np.ndarray, rate: np.ndarray,
+                       open_rate: Union[float, np.ndarray], fee: float, stake_amount: float,
+                       trade_profit: Callable[[Trade, float], float]) -> np.ndarray:
+    """
+    Trade calculates profits with Decimals. Close to half of the 8th digit, the float error
+    of the array formulas may round the other way: these few profits are calculated
+    by `trade_profit` on a Trade instead.
+    """
+    scaled = np.abs(profit) * 1e8
+    ties = np.nonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    if len(ties[0]):
+        rates, open_rates = np.broadcast_arrays(rate, open_rate)
+        for pos in zip(*ties):
+            trade = Trade(open_rate=open_rates[pos], stake_amount=stake_amount,
+                          amount=stake_amount / open_rates[pos], fee_open=fee, fee_close=fee)
+            rounded[pos] = trade_profit(trade, rates[pos])
+    return rounded
+
+
+def profit_percent(rate: np.ndarray, open_rate: Union[float, np.ndarray],
+                   fee: float) -> np.ndarray:
+    """
+    Vectorized equivalent of Trade.calc_profit_percent() (rounded to 8 digits)
+    """
+    profit = rate * (1 - fee) / (open_rate * (1 + fee)) - 1
+    # The percentage doesn't depend on the stake amount
+    return _fix_rounding_ties(np.round(profit, 8), profit, rate, open_rate, fee, 1.0,
+                              lambda trade, rate: trade.calc_profit_percent(rate=rate))
+
+
+def profit_abs(rate: np.ndarray, open_rate: Union[float, np.ndarray], fee: float,
+               stake_amount: float) -> np.ndarray:
+    """
+    Vectorized equivalent of Trade.calc_profit() (rounded to 8 digits)
+    """
+    amount = stake_amount / open_rate
+    profit = amount * rate * (1 - fee) - amount * open_rate * (1 + fee)
+    return _fix_rounding_ties(np.round(profit, 8), profit, rate, open_rate, fee, stake_amount,
+                              lambda trade, rate: trade.calc_profit(rate=rate))
+
+
+def roi_close_rate(params: ExitParameters, open_rate: float, trade_dur: int) -> float:
+    """
+    Rate at which the ROI sell is assumed to be filled (same formula as Backtesting)
+    """
+    roi_idx = np.searchsorted(params.roi_durations, trade_dur, side='right') - 1
+    roi = params.roi_values[roi_idx]
+    return - (open_rate * roi + open_rate * (1 + params.fee)) / (params.fee - 1)
+
+
+def consumed_steps(date_ns: np.ndarray, start_ns: int, interval_ns: int) -> np.ndarray:
+    """
+    Returns the time-step at which Backtesting.backtest_loop() looks at each row.
+    The loop advances each pair by at most one row per step, and only once the time-counter
+    (start_date + (step + 1) * interval) reached the row's date.
+    """
+    if len(date_ns) == 0:
+        return np.array([], dtype=np.int64)
+    first = np.maximum(-((start_ns - date_ns) // interval_ns) - 1, 0)
+    rows = np.arange(len(date_ns), dtype=np.int64)
+    return rows + np.maximum.accumulate(first - rows)
+
+
+def _stop_losses(arrays: TickerArrays, start: int, stop: int, open_rate: float,
+                 stop_loss: float, max_rate: float,
+                 params: ExitParameters) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stoploss and max_rate per candle of the window [start, stop),
+    as adjusted by IStrategy.stop_loss_reached() while the trade is open
+    """
+    low_rate = arrays.low_rate[start:stop]
+    high_rate = arrays.high_rate[start:stop]
+    max_rates = np.maximum(np.maximum.accumulate(high_rate), max_rate)
+    if not params.trailing_stop:
+        return np.full(len(low_rate), stop_loss), max_rates
+
+    profit_low = profit_percent(low_rate, open_rate, params.fee)
+    offset = params.trailing_stop_positive_offset
+    stop_value = np.full(len(low_rate), params.stoploss)
+    if params.trailing_stop_positive is not None:
+        stop_value[profit_low > offset] = params.trailing_stop_positive
+    candidates = high_rate * (1 - np.abs(stop_value))
+    if params.trailing_only_offset_is_reached:
+        candidates[profit_low < offset] = -np.inf
+    return np.maximum(np.maximum.accumulate(candidates), stop_loss), max_rates
+
+
+def _roi_and_signal_exits(arrays: TickerArrays, start: int, stop: int, buy_index: int,
+                          params: ExitParameters) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ROI and sell signal exits per candle of the window [start, stop)
+    :return: Tuple of (roi_hit, regular_exit) boolean arrays
+    """
+    open_rate = arrays.open[buy_index]
+    trade_dur = (arrays.date_ns[start:stop] - arrays.date_ns[buy_index]) / NS_PER_MINUTE
+    roi_idx = np.searchsorted(params.roi_durations, trade_dur, side='right') - 1
+    threshold = np.where(roi_idx >= 0, params.roi_values[np.maximum(roi_idx, 0)], np.inf)
+    roi_hit = profit_percent(arrays.roi_rate[start:stop], open_rate, params.fee) > threshold
+
+    buy_flag = arrays.buy_flag[start:stop]
+    if params.use_sell_signal:
+        signal_hit = arrays.sell_flag[start:stop] & ~buy_flag
+        if params.sell_profit_only:
+            signal_hit &= profit_abs(arrays.open[start:stop], open_rate, params.fee,
+                                     params.stake_amount) > 0
+    else:
+        signal_hit = np.zeros(stop - start, dtype=bool)
+
+    regular_exit = roi_hit | signal_hit
+    if params.ignore_roi_if_buy_signal:
+        regular_exit &= ~buy_flag
+    return roi_hit, regular_exit
+
+
+def find_exit(arrays: TickerArrays, buy_index: int,
+              params: ExitParameters) -> Optional[ExitPoint]:
+    """
+    Find the exit for a trade opened on row `buy_index`.
+    Candles are evaluated in windows of growing size, starting on the row after the buy row.
+    :return: ExitPoint, or None if there is no candle after the buy row
+    """
+    length = len(arrays.open)
+    start = buy_index + 1
+    if start >= length:
+        return None
+
+    open_rate = arrays.open[buy_index]
+    # Initial stoploss, as set by adjust_stop_loss(initial=True)
+    stop_loss = open_rate * (1 - abs(params.stoploss))
+    max_rate = open_rate
+    window = SCAN_WINDOW
+
+    while start < length:
+        stop = min(start + window, length)
+        stop_losses, max_rates = _stop_losses(arrays, start, stop, open_rate,
+                                              stop_loss, max_rate, params)
+        stop_hit = stop_losses >= arrays.low_rate[start:stop]
+        roi_hit, regular_exit = _roi_and_signal_exits(arrays, start, stop, buy_index, params)
+        exits = stop_hit | regular_exit
+
+        if exits.any():
+            pos = int(np.argmax(exits))
+            index = start + pos
+            if stop_hit[pos]:
+                sell_type = SellType.STOP_LOSS
+                if params.trailing_stop and open_rate != max_rates[pos]:
+                    sell_type = SellType.TRAILING_STOP_LOSS
+                return ExitPoint(index, sell_type, stop_losses[pos], False)
+            if roi_hit[pos]:
+                trade_dur = int((arrays.date_ns[index] - arrays.date_ns[buy_index])
+                                // NS_PER_MINUTE)
+                return ExitPoint(index, SellType.ROI,
+                                 roi_close_rate(params, open_rate, trade_dur), False)
+            return ExitPoint(index, SellType.SELL_SIGNAL, arrays.open[index], False)
+
+        stop_loss = stop_losses[-1]
+        max_rate = max_rates[-1]
+        start = stop
+        window *= 2
+
+    # No sell condition found - trade still open at end of backtest period
+    return ExitPoint(length - 1, SellType.FORCE_SELL, arrays.open[length - 1], True)
+
+
+def _stop_losses_batch(arrays: TickerArrays, start: int, stop: int, open_rate: float,
+                       stop_loss: np.ndarray, max_rate: np.ndarray, stoploss: np.ndarray,
+                       params: ExitParameters) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    _stop_losses() for several stoplosses at once
+    :param stop_loss: current stop price per candidate
+    :param max_rate: current max_rate per candidate
+    :param stoploss: configured stoploss per candidate
+    :return: Tuple of (stoploss, max_rate) arrays with one row per candidate
+    """
+    width = stop - start
+    low_rate = arrays.low_rate[start:stop]
+    high_rate = arrays.high_rate[start:stop]
+    max_rates = np.maximum(np.maximum.accumulate(high_rate)[np.newaxis, :],
+                           max_rate[:, np.newaxis])
+    if not params.trailing_stop:
+        return np.broadcast_to(stop_loss[:, np.newaxis], (len(stop_loss), width)), max_rates
+
+    profit_low = profit_percent(low_rate, open_rate, params.fee)
+    offset = params.trailing_stop_positive_offset
+    stop_value = np.repeat(stoploss[:, np.newaxis], width, axis=1)
+    if params.trailing_stop_positive is not None:
+        stop_value[:, profit_low > offset] = params.trailing_stop_positive
+    candidates = high_rate[np.newaxis, :] * (1 - np.abs(stop_value))
+    if params.trailing_only_offset_is_reached:
+        candidates[:, profit_low < offset] = -np.inf
+    return (np.maximum(np.maximum.accumulate(candidates, axis=1), stop_loss[:, np.newaxis]),
+            max_rates)
+
+
+def _roi_lookup(roi_durations: np.ndarray, roi_values: np.ndarray,
+                trade_dur: np.ndarray) -> np.ndarray:
+    """
+    ROI threshold per candidate (row of roi_durations) and trade duration,
+    np.inf where no ROI entry applies yet
+    """
+    roi_idx = (roi_durations[:, np.newaxis, :] <= trade_dur[..., np.newaxis]).sum(axis=2) - 1
+    threshold = np.take_along_axis(roi_values, np.maximum(roi_idx, 0), axis=1)
+    return np.where(roi_idx >= 0, threshold, np.inf)
+
+
+def _roi_and_signal_exits_batch(arrays: TickerArrays, start: int, stop: int, buy_index: int,
+                                roi_durations: np.ndarray, roi_values: np.ndarray,
+                                params: ExitParameters) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    _roi_and_signal_exits() for several ROI tables at once
+    :return: Tuple of (roi_hit, regular_exit) boolean arrays with one row per candidate
+    """
+    open_rate = arrays.open[buy_index]
+    trade_dur = (arrays.date_ns[start:stop] - arrays.date_ns[buy_index]) / NS_PER_MINUTE
+    threshold = _roi_lookup(roi_durations, roi_values, trade_dur)
+    roi_profit = profit_percent(arrays.roi_rate[start:stop], open_rate, params.fee)
+    roi_hit = roi_profit[np.newaxis, :] > threshold
+
+    buy_flag = arrays.buy_flag[start:stop]
+    if params.use_sell_signal:
+        signal_hit = arrays.sell_flag[start:stop] & ~buy_flag
+        if params.sell_profit_only:
+            signal_hit &= profit_abs(arrays.open[start:stop], open_rate, params.fee,
+                                     params.stake_amount) > 0
+    else:
+        signal_hit = np.zeros(stop - start, dtype=bool)
+
+    regular_exit = roi_hit | signal_hit[np.newaxis, :]
+    if params.ignore_roi_if_buy_signal:
+        regular_exit &= ~buy_flag[np.newaxis, :]
+    return roi_hit, regular_exit
+
+
+def find_exits(arrays: TickerArrays, buy_index: int, params: ExitParameters,
+               candidates: ExitCandidates) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    find_exit() for all candidates at once. Stoploss and ROI table are taken from
+    `candidates`, all other settings from `params`.
+    Candles are evaluated in windows of growing size, until every candidate found its exit.
+    :return: Tuple of (exit index, SellType, close rate) arrays with one element per candidate,
+             or None if there is no candle after the buy row.
+             Trades still open at the end of the data have SellType.FORCE_SELL.
+    """
+    length = len(arrays.open)
+    start = buy_index + 1
+    if start >= length:
+        return None
+
+    count = len(candidates.stoploss)
+    open_rate = arrays.open[buy_index]
+    # Initial stoploss, as set by adjust_stop_loss(initial=True)
+    stop_loss = open_rate * (1 - np.abs(candidates.stoploss))
+    max_rate = np.full(count, open_rate)
+    exit_index = np.full(count, length - 1)
+    sell_type = np.full(count, SellType.FORCE_SELL, dtype=object)
+    close_rate = np.full(count, arrays.open[length - 1])
+
+    # Candidates without exit so far
+    pending = np.arange(count)
+    window = SCAN_WINDOW
+    while start < length and len(pending):
+        stop = min(start + window, length)
+        stop_losses, max_rates = _stop_losses_batch(
+            arrays, start, stop, open_rate, stop_loss[pending], max_rate[pending],
+            candidates.stoploss[pending], params)
+        stop_hit = stop_losses >= arrays.low_rate[np.newaxis, start:stop]
+        roi_hit, regular_exit = _roi_and_signal_exits_batch(
+            arrays, start, stop, buy_index, candidates.roi_durations[pending],
+            candidates.roi_values[pending], params)
+        exits = stop_hit | regular_exit
+
+        found = exits.any(axis=1)
+        rows = np.flatnonzero(found)
+        pos = np.argmax(exits[rows], axis=1)
+        index = start + pos
+        is_stop = stop_hit[rows, pos]
+        is_roi = roi_hit[rows, pos] & ~is_stop
+        done = pending[rows]
+
+        trade_dur = (arrays.date_ns[index] - arrays.date_ns[buy_index]) // NS_PER_MINUTE
+        roi = _roi_lookup(candidates.roi_durations[done], candidates.roi_values[done],
+                          trade_dur[:, np.newaxis].astype(np.float64))[:, 0]
+        roi_rate = - (open_rate * roi + open_rate * (1 + params.fee)) / (params.fee - 1)
+
+        types = np.where(is_roi, SellType.ROI, SellType.SELL_SIGNAL)
+        stop_type = SellType.STOP_LOSS
+        if params.trailing_stop:
+            stop_type = np.where(max_rates[rows, pos] != open_rate,
+                                 SellType.TRAILING_STOP_LOSS, SellType.STOP_LOSS)
+        exit_index[done] = index
+        sell_type[done] = np.where(is_stop, stop_type, types)
+        close_rate[done] = np.where(is_stop, stop_losses[rows, pos],
+                                    np.where(is_roi, roi_rate, arrays.open[index]))
+
+        stop_loss[pending] = stop_losses[:, -1]
+        max_rate[pending] = max_rates[:, -1]
+        pending = pending[~found]
+        start = stop
+        window *= 2
+
+    return exit_index, sell_type, close_rate
+
+
+def buy_candidates(ticker: Dict[str, TickerArrays], start_ns: int, end_ns: int,
+                   interval_ns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rows with a buy signal (and no sell signal) within the backtest period,
+    in the order Backtesting.backtest_loop() looks at them (time-step, then pair).
+    :return: Tuple of (position of the pair in `ticker`, row) arrays, one element per candidate
+    """
+    # Number of time-steps the candle-loop runs for
+    max_steps = -((start_ns - end_ns) // interval_ns) - 1
+
+    candidate_steps, candidate_pairs, candidate_rows = [], [], []
+    for pair_id, arrays in enumerate(ticker.values()):
+        steps = consumed_steps(arrays.date_ns, start_ns, interval_ns)
+        rows = np.flatnonzero((steps < max_steps)
+                              & ~(arrays.buy == 0) & ~(arrays.sell == 1))
+        candidate_steps.append(steps[rows])
+        candidate_pairs.append(np.full(len(rows), pair_id))
+        candidate_rows.append(rows)
+    if not candidate_rows:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+
+    steps = np.concatenate(candidate_steps)
+    pair_ids = np.concatenate(candidate_pairs)
+    rows = np.concatenate(candidate_rows)
+    order = np.lexsort((rows, pair_ids, steps))
+    return pair_ids[order], rows[order]
+
+
+def pair_ticker_arrays(ticker: Dict[str, DataFrame]) -> Dict[str, TickerArrays]:
+    """
+    Convert signal-populated ticker frames to TickerArrays
+    """
+    return {pair: TickerArrays.from_dataframe(frame) for pair, frame in ticker.items()}
@@ -3,18 +3,19 @@ This module contains the class to persist trades into SQLite
 """
 
 import logging
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import arrow
-from sqlalchemy import (Boolean, Column, DateTime, Float, Integer, String,
-                        create_engine, inspect)
+from sqlalchemy import (Boolean, Column, Date, DateTime, Float, Integer, Numeric, String,
+                        cast, create_engine, event, inspect)
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm.scoping import scoped_session
 from sqlalchemy.orm.session import sessionmaker
-from sqlalchemy import func
+from sqlalchemy import func, text
 from sqlalchemy.pool import StaticPool
 
 from freqtrade import OperationalException
@@ -24,6 +25,23 @@ logger = logging.getLogger(__name__)
 _DECL_BASE: Any = declarative_base()
 _SQL_DOCS_URL = 'http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls'
 
+# Aggregates of the trade table, see Trade.get_closed_stats() and Trade.get_performance().
+# Cleared whenever a trade is created, opened, closed or deleted, and whenever the session
+# commits or rolls back, as they may have been computed from uncommitted changes.
+_stats_cache: Dict[str, Any] = {}
+
+
+def _clear_stats_cache(*args) -> None:
+    _stats_cache.clear()
+
+
+def _round_profit(expression):
+    """
+    Round a float SQL expression to 8 digits, as Trade rounds its profits.
+    Cast to NUMERIC first, as some databases only round exact numbers.
+    """
+    return func.round(cast(expression, Numeric), 8, type_=Float)
+
 
 def init(config: Dict) -> None:
     """
@@ -50,7 +68,17 @@ def init(config: Dict) -> None:
         raise OperationalException(f'Given value for db_url: \'{db_url}\' '
                                    f'is no valid database URL! (See {_SQL_DOCS_URL})')
 
-    session = scoped_session(sessionmaker(bind=engine, autoflush=True, autocommit=True))
+    if (config.get('internals', {}).get('db_batch_commit') and engine.dialect.name == 'sqlite'
+            and engine.url.database not in (None, '', ':memory:')):
+        # Readers don't block the writer, and a commit appends to the log
+        # instead of rewriting the database pages
+        event.listen(engine, 'connect', _enable_wal)
+
+    session_factory = sessionmaker(bind=engine, autoflush=True, autocommit=True)
+    event.listen(session_factory, 'after_commit', _clear_stats_cache)
+    event.listen(session_factory, 'after_rollback', _clear_stats_cache)
+    session = scoped_session(session_factory)
+    _clear_stats_cache()
     Trade.session = session()
     Trade.query = session.query_property()
     _DECL_BASE.metadata.create_all(engine)
@@ -61,6 +89,30 @@ def init(config: Dict) -> None:
         clean_dry_run_db()
 
 
+def _enable_wal(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.close()
+
+
+@contextmanager
+def transaction() -> Iterator[None]:
+    """
+    Write all trade changes made within the block in one transaction on leaving it,
+    instead of one transaction per flush. Changes are written also if the block raises,
+    as they would have been without the transaction.
+    """
+    Trade.session.begin(subtransactions=True)
+    try:
+        yield
+    finally:
+        try:
+            Trade.session.commit()
+        except Exception:
+            Trade.session.rollback()
+            raise
+
+
 def has_column(columns, searchname: str) -> bool:
     return len(list(filter(lambda x: x["name"] == searchname, columns))) == 1
 
@@ -76,7 +128,9 @@ def check_migrate(engine) -> None:
     inspector = inspect(engine)
 
     cols = inspector.get_columns('trades')
-    tabs = inspector.get_table_names()
+    # The archive tables are created along with trades and don't count for the backup name
+    tabs = [tab for tab in inspector.get_table_names()
+            if tab not in ('trades_archive', 'trades_rollup')]
     table_back_name = 'trades_bak'
     for i, table_back_name in enumerate(tabs):
         table_back_name = f'trades_bak{i}'
@@ -145,6 +199,13 @@ def check_migrate(engine) -> None:
         inspector = inspect(engine)
         cols = inspector.get_columns('trades')
 
+    # Indexes added to an existing table are not created by create_all()
+    indexes = [index['name'] for index in inspect(engine).get_indexes('trades')]
+    for index in Trade.__table__.indexes:
+        if index.name not in indexes:
+            logger.info(f'Creating index {index.name}')
+            index.create(bind=engine)
+
 
 def cleanup() -> None:
     """
@@ -165,11 +226,42 @@ def clean_dry_run_db() -> None:
             trade.open_order_id = None
 
 
+def archive_closed_trades(closed_before: datetime) -> int:
+    """
+    Move the trades closed before `closed_before` from the trades table to trades_archive,
+    and add them to the daily rollups (trades_rollup) the statistics of closed trades
+    are read from. Keeps the trades table, and with it its queries and migrations, small.
+    :return: number of archived trades
+    """
+    trades = Trade.query.filter(Trade.is_open.is_(False),
+                                Trade.close_date < closed_before,
+                                Trade.open_rate.isnot(None), Trade.open_rate != 0).all()
+    if not trades:
+        return 0
+
+    rollups: Dict[Tuple[date, str], TradeRollup] = {}
+    # Unlike transaction(), nothing is written if moving any of the trades fails
+    with Trade.session.begin(subtransactions=True):
+        for trade in trades:
+            key = (trade.close_date.date(), trade.pair)
+            if key not in rollups:
+                rollups[key] = (Trade.session.query(TradeRollup).get(key)
+                                or TradeRollup.create(*key))
+                Trade.session.add(rollups[key])
+            rollups[key].add(trade)
+            Trade.session.add(ArchivedTrade.from_trade(trade))
+            Trade.session.delete(trade)
+    _clear_stats_cache()
+    return len(trades)
+
+
 class Trade(_DECL_BASE):
     """
     Class used to define a trade structure
     """
     __tablename__ = 'trades'
+    # Don't hand out the ids of archived trades again
+    __table_args__ = {'sqlite_autoincrement': True}
 
     id = Column(Integer, primary_key=True)
     exchange = Column(String, nullable=False)
@@ -185,7 +277,7 @@ class Trade(_DECL_BASE):
     stake_amount = Column(Float, nullable=False)
     amount = Column(Float)
     open_date = Column(DateTime, nullable=False, default=datetime.utcnow)
-    close_date = Column(DateTime)
+    close_date = Column(DateTime, index=True)
     open_order_id = Column(String)
     # absolute value of the stop loss
     stop_loss = Column(Float, nullable=True, default=0.0)
@@ -364,6 +456,16 @@ class Trade(_DECL_BASE):
         profit = close_trade_price - open_trade_price
         return float(f"{profit:.8f}")
 
+    @classmethod
+    def profit_expression(cls):
+        """
+        SQL expression of calc_profit() with the trade's own close rate and fees,
+        to aggregate the profit of closed trades in the database
+        """
+        close_trade_price = cls.amount * func.coalesce(cls.close_rate, 0.0) * (1 - cls.fee_close)
+        open_trade_price = cls.amount * cls.open_rate * (1 + cls.fee_open)
+        return _round_profit(close_trade_price - open_trade_price)
+
     def calc_profit_percent(
             self,
             rate: Optional[float] = None,
@@ -401,3 +503,188 @@ class Trade(_DECL_BASE):
         Query trades from persistence layer
         """
         return Trade.query.filter(Trade.is_open.is_(True)).all()
+
+    @staticmethod
+    def get_performance() -> List[Tuple[str, float, int]]:
+        """
+        Sum of close_profit and number of closed trades per pair, best pair first.
+        Memoised until a trade is opened or closed.
+        """
+        if 'performance' in _stats_cache:
+            return _stats_cache['performance']
+
+        performance = Trade.session.query(
+            Trade.pair,
+            func.sum(Trade.close_profit).label('profit_sum'),
+            func.count(Trade.pair).label('count')
+        ).filter(Trade.is_open.is_(False)) \
+            .group_by(Trade.pair) \
+            .order_by(text('profit_sum DESC')) \
+            .all()
+
+        archived = Trade.session.query(TradeRollup.pair,
+                                       func.sum(TradeRollup.close_profit_sum),
+                                       func.sum(TradeRollup.trade_count)) \
+            .group_by(TradeRollup.pair) \
+            .all()
+        if archived:
+            pairs = {pair: (profit_sum or 0.0, count) for pair, profit_sum, count in performance}
+            for pair, profit_sum, count in archived:
+                pair_profit_sum, pair_count = pairs.get(pair, (0.0, 0))
+                pairs[pair] = (pair_profit_sum + profit_sum, pair_count + count)
+            performance = sorted(((pair, profit_sum, count)
+                                  for pair, (profit_sum, count) in pairs.items()),
+                                 key=lambda row: row[1], reverse=True)
+
+        _stats_cache['performance'] = performance
+        return performance
+
+    @staticmethod
+    def get_closed_stats() -> Dict[str, Any]:
+        """
+        Aggregates of the closed trades, calculated in the database.
+        Trades without open_rate are left out, except for trade_count.
+        Archived trades are included through their rollups.
+        Memoised until a trade is opened or closed.
+        :return: dict with trade_count and first/latest_open_date of all trades,
+                 closed_count, profit_sum and profit_percent_sum of the closed trades,
+                 duration_sum (in seconds) and duration_count of trades with close_date
+        """
+        if 'closed' in _stats_cache:
+            return _stats_cache['closed']
+
+        first = Trade.query.with_entities(Trade.open_date).order_by(Trade.id).first()
+        latest = Trade.query.with_entities(Trade.open_date).order_by(Trade.id.desc()).first()
+        with_rate = Trade.query.filter(Trade.open_rate.isnot(None), Trade.open_rate != 0)
+
+        profit_percent = _round_profit(
+            func.coalesce(Trade.close_rate, 0.0) * (1 - Trade.fee_close)
+            / (Trade.open_rate * (1 + Trade.fee_open)) - 1)
+        closed_count, profit_sum, profit_percent_sum = with_rate \
+            .filter(Trade.is_open.is_(False)) \
+            .with_entities(func.count(Trade.id), func.sum(Trade.profit_expression()),
+                           func.sum(profit_percent)) \
+            .one()
+
+        with_close_date = with_rate.filter(Trade.close_date.isnot(None))
+        if Trade.session.get_bind().dialect.name == 'sqlite':
+            duration_sum, duration_count = with_close_date.with_entities(
+                func.sum((func.julianday(Trade.close_date) - func.julianday(Trade.open_date))
+                         * 86400),
+                func.count(Trade.id)
+            ).one()
+        else:
+            # Date arithmetic differs between databases, only load the dates
+            durations = [(close_date - open_date).total_seconds() for open_date, close_date
+                         in with_close_date.with_entities(Trade.open_date, Trade.close_date)]
+            duration_sum, duration_count = sum(durations), len(durations)
+
+        (archived_count, archived_profit_sum, archived_profit_percent_sum,
+         archived_duration_sum, archived_first, archived_latest) = Trade.session.query(
+            func.sum(TradeRollup.trade_count), func.sum(TradeRollup.profit_sum),
+            func.sum(TradeRollup.profit_percent_sum), func.sum(TradeRollup.duration_sum),
+            func.min(TradeRollup.first_open_date), func.max(TradeRollup.latest_open_date)
+        ).one()
+        archived_count = archived_count or 0
+        # An open trade may be older than the archived ones
+        first_dates = [open_date for open_date in (first[0] if first else None, archived_first)
+                       if open_date]
+
+        _stats_cache['closed'] = {
+            'trade_count': Trade.query.count() + archived_count,
+            'first_open_date': min(first_dates) if first_dates else None,
+            'latest_open_date': latest[0] if latest else archived_latest,
+            'closed_count': closed_count + archived_count,
+            'profit_sum': (profit_sum or 0.0) + (archived_profit_sum or 0.0),
+            'profit_percent_sum': ((profit_percent_sum or 0.0)
+                                   + (archived_profit_percent_sum or 0.0)),
+            'duration_sum': (duration_sum or 0.0) + (archived_duration_sum or 0.0),
+            'duration_count': duration_count + archived_count,
+        }
+        return _stats_cache['closed']
+
+
+class ArchivedTrade(_DECL_BASE):
+    """
+    Closed trade moved out of the trades table by archive_closed_trades(),
+    with the columns needed to look back at it
+    """
+    __tablename__ = 'trades_archive'
+
+    id = Column(Integer, primary_key=True)
+    # Not unique: sqlite reuses the ids of deleted rows in trades tables
+    # created before they used AUTOINCREMENT
+    trade_id = Column(Integer, nullable=False, index=True)
+    exchange = Column(String, nullable=False)
+    pair = Column(String, nullable=False, index=True)
+    fee_open = Column(Float, nullable=False)
+    fee_close = Column(Float, nullable=False)
+    open_rate = Column(Float)
+    close_rate = Column(Float)
+    close_profit = Column(Float)
+    stake_amount = Column(Float, nullable=False)
+    amount = Column(Float)
+    open_date = Column(DateTime, nullable=False)
+    close_date = Column(DateTime, index=True)
+    sell_reason = Column(String, nullable=True)
+    strategy = Column(String, nullable=True)
+    ticker_interval = Column(Integer, nullable=True)
+
+    calc_open_trade_price = Trade.calc_open_trade_price
+    calc_close_trade_price = Trade.calc_close_trade_price
+    calc_profit = Trade.calc_profit
+
+    @classmethod
+    def from_trade(cls, trade: Trade) -> 'ArchivedTrade':
+        return cls(trade_id=trade.id,
+                   **{column.name: getattr(trade, column.name)
+                      for column in cls.__table__.columns
+                      if column.name not in ('id', 'trade_id')})
+
+    def __repr__(self):
+        return (f'ArchivedTrade(id={self.id}, trade_id={self.trade_id}, pair={self.pair}, '
+                f'open_date={self.open_date}, close_date={self.close_date})')
+
+
+class TradeRollup(_DECL_BASE):
+    """
+    Aggregates of the archived trades per close day and pair
+    """
+    __tablename__ = 'trades_rollup'
+
+    close_day = Column(Date, primary_key=True)
+    pair = Column(String, primary_key=True)
+    trade_count = Column(Integer, nullable=False)
+    # Sums of calc_profit(), calc_profit_percent() and close_profit
+    profit_sum = Column(Float, nullable=False)
+    profit_percent_sum = Column(Float, nullable=False)
+    close_profit_sum = Column(Float, nullable=False)
+    # In seconds
+    duration_sum = Column(Float, nullable=False)
+    first_open_date = Column(DateTime, nullable=False)
+    latest_open_date = Column(DateTime, nullable=False)
+
+    @classmethod
+    def create(cls, close_day: date, pair: str) -> 'TradeRollup':
+        return cls(close_day=close_day, pair=pair, trade_count=0, profit_sum=0.0,
+                   profit_percent_sum=0.0, close_profit_sum=0.0, duration_sum=0.0,
+                   first_open_date=datetime.max, latest_open_date=datetime.min)
+
+    def add(self, trade: Trade) -> None:
+        """
+        Add a closed trade to the aggregates
+        """
+        self.trade_count += 1
+        self.profit_sum += trade.calc_profit()
+        self.profit_percent_sum += trade.calc_profit_percent()
+        self.close_profit_sum += trade.close_profit or 0.0
+        self.duration_sum += (trade.close_date - trade.open_date).total_seconds()
+        self.first_open_date = min(self.first_open_date, trade.open_date)
+        self.latest_open_date = max(self.latest_open_date, trade.open_date)
+
+
+event.listen(Trade, 'after_insert', _clear_stats_cache)
+event.listen(Trade, 'after_delete', _clear_stats_cache)
+for _attribute in (Trade.is_open, Trade.open_rate, Trade.close_rate, Trade.close_profit,
+                   Trade.close_date):
+    event.listen(_attribute, 'set', _clear_stats_cache)
@@ -54,6 +54,8 @@ class StrategyResolver(IResolver):
                       ("trailing_stop_positive_offset",   0.0,         False),
                       ("trailing_only_offset_is_reached", None,        False),
                       ("process_only_new_candles",        None,        False),
+                      ("incremental_analysis",            None,        False),
+                      ("startup_candle_count",            None,        False),
                       ("order_types",                     None,        False),
                       ("order_time_in_force",             None,        False),
                       ("stake_currency",                  None,        False),
@@ -106,6 +108,9 @@ class StrategyResolver(IResolver):
         if not all(k in self.strategy.order_types for k in constants.REQUIRED_ORDERTYPES):
             raise ImportError(f"Impossible to load Strategy '{self.strategy.__class__.__name__}'. "
                               f"Order-types mapping is incomplete.")
+        if self.strategy.incremental_analysis and not self.strategy.startup_candle_count:
+            logger.warning("Strategy uses incremental_analysis without startup_candle_count. "
+                           "Indicators of new candles are calculated without older candles.")
 
         if not all(k in self.strategy.order_time_in_force for k in constants.REQUIRED_ORDERTIF):
             raise ImportError(f"Impossible to load Strategy '{self.strategy.__class__.__name__}'. "
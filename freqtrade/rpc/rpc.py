@@ -10,12 +10,12 @@ from typing import Dict, Any, List, Optional
 
 import arrow
 import sqlalchemy as sql
-from numpy import mean, nan_to_num, NAN
+from numpy import nan_to_num, NAN
 from pandas import DataFrame
 
 from freqtrade import TemporaryError, DependencyException
 from freqtrade.misc import shorten_date
-from freqtrade.persistence import Trade
+from freqtrade.persistence import Trade, TradeRollup
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
 from freqtrade.state import State
 from freqtrade.strategy.interface import SellType
@@ -29,6 +29,7 @@ class RPCMessageType(Enum):
     CUSTOM_NOTIFICATION = 'custom'
     BUY_NOTIFICATION = 'buy'
     SELL_NOTIFICATION = 'sell'
+    PERF_NOTIFICATION = 'perf'
 
     def __repr__(self):
         return self.value
@@ -158,18 +159,34 @@ class RPC(object):
         if not (isinstance(timescale, int) and timescale > 0):
             raise RPCException('timescale must be an integer greater than 0')
 
+        # Profit and trade count of all days in one grouped query
+        close_day = sql.func.date(Trade.close_date, type_=sql.Date)
+        daily = dict(
+            (day, (profit, count)) for day, profit, count in Trade.query
+            .with_entities(close_day, sql.func.sum(Trade.profit_expression()),
+                           sql.func.count(Trade.id))
+            .filter(Trade.is_open.is_(False))
+            .filter(Trade.close_date >= today - timedelta(days=timescale - 1))
+            .filter(Trade.close_date < today + timedelta(days=1))
+            .group_by(close_day)
+            .all()
+        )
+        # Archived trades are only in the rollups
+        for day, profit, count in Trade.session.query(
+                TradeRollup.close_day, sql.func.sum(TradeRollup.profit_sum),
+                sql.func.sum(TradeRollup.trade_count)) \
+                .filter(TradeRollup.close_day >= today - timedelta(days=timescale - 1)) \
+                .filter(TradeRollup.close_day <= today) \
+                .group_by(TradeRollup.close_day):
+            day_profit, day_count = daily.get(day, (0.0, 0))
+            daily[day] = (day_profit + profit, day_count + count)
+
         for day in range(0, timescale):
             profitday = today - timedelta(days=day)
-            trades = Trade.query \
-                .filter(Trade.is_open.is_(False)) \
-                .filter(Trade.close_date >= profitday)\
-                .filter(Trade.close_date < (profitday + timedelta(days=1)))\
-                .order_by(Trade.close_date)\
-                .all()
-            curdayprofit = sum(trade.calc_profit() for trade in trades)
+            curdayprofit, trades = daily.get(profitday, (0.0, 0))
             profit_days[profitday] = {
                 'amount': f'{curdayprofit:.8f}',
-                'trades': len(trades)
+                'trades': trades
             }
 
         return [
@@ -198,68 +215,48 @@ class RPC(object):
     def _rpc_trade_statistics(
             self, stake_currency: str, fiat_display_currency: str) -> Dict[str, Any]:
         """ Returns cumulative profit statistics """
-        trades = Trade.query.order_by(Trade.id).all()
-
-        profit_all_coin = []
-        profit_all_percent = []
-        profit_closed_coin = []
-        profit_closed_percent = []
-        durations = []
-
-        for trade in trades:
-            current_rate: float = 0.0
-
-            if not trade.open_rate:
-                continue
-            if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_percent = trade.calc_profit_percent()
-                profit_closed_coin.append(trade.calc_profit())
-                profit_closed_percent.append(profit_percent)
-            else:
-                # Get current rate
-                try:
-                    current_rate = self._freqtrade.get_sell_rate(trade.pair, False)
-                except DependencyException:
-                    current_rate = NAN
-                profit_percent = trade.calc_profit_percent(rate=current_rate)
+        # Closed trades are aggregated by the database, only open trades are loaded
+        stats = Trade.get_closed_stats()
+        performance = Trade.get_performance()
+        if not performance:
+            raise RPCException('no closed trade')
 
-            profit_all_coin.append(
-                trade.calc_profit(rate=Decimal(trade.close_rate or current_rate))
-            )
-            profit_all_percent.append(profit_percent)
+        bp_pair, bp_rate, _ = performance[0]
 
-        best_pair = Trade.session.query(
-            Trade.pair, sql.func.sum(Trade.close_profit).label('profit_sum')
-        ).filter(Trade.is_open.is_(False)) \
-            .group_by(Trade.pair) \
-            .order_by(sql.text('profit_sum DESC')).first()
+        open_trades = [trade for trade in Trade.get_open_trades() if trade.open_rate]
+        rates = self._freqtrade.get_sell_rates(trade.pair for trade in open_trades)
 
-        if not best_pair:
-            raise RPCException('no closed trade')
+        profit_closed_coin = stats['profit_sum']
+        profit_all_coin = stats['profit_sum']
+        profit_all_percent = stats['profit_percent_sum']
+        for trade in open_trades:
+            current_rate = rates.get(trade.pair, NAN)
+            profit_all_coin += trade.calc_profit(rate=Decimal(trade.close_rate or current_rate))
+            profit_all_percent += trade.calc_profit_percent(rate=current_rate)
 
-        bp_pair, bp_rate = best_pair
+        closed_count = stats['closed_count']
+        all_count = closed_count + len(open_trades)
+        profit_closed_percent = stats['profit_percent_sum'] / closed_count if closed_count else NAN
+        profit_all_percent = profit_all_percent / all_count if all_count else NAN
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_percent = round(nan_to_num(mean(profit_closed_percent)) * 100, 2)
+        profit_closed_coin_sum = round(profit_closed_coin, 8)
+        profit_closed_percent = round(nan_to_num(profit_closed_percent) * 100, 2)
         profit_closed_fiat = self._fiat_converter.convert_amount(
             profit_closed_coin_sum,
             stake_currency,
             fiat_display_currency
         ) if self._fiat_converter else 0
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_percent = round(nan_to_num(mean(profit_all_percent)) * 100, 2)
+        profit_all_coin_sum = round(profit_all_coin, 8)
+        profit_all_percent = round(nan_to_num(profit_all_percent) * 100, 2)
         profit_all_fiat = self._fiat_converter.convert_amount(
             profit_all_coin_sum,
             stake_currency,
             fiat_display_currency
         ) if self._fiat_converter else 0
 
-        num = float(len(durations) or 1)
+        num = float(stats['duration_count'] or 1)
         return {
             'profit_closed_coin': profit_closed_coin_sum,
             'profit_closed_percent': profit_closed_percent,
@@ -267,10 +264,10 @@ class RPC(object):
             'profit_all_coin': profit_all_coin_sum,
             'profit_all_percent': profit_all_percent,
             'profit_all_fiat': profit_all_fiat,
-            'trade_count': len(trades),
-            'first_trade_date': arrow.get(trades[0].open_date).humanize(),
-            'latest_trade_date': arrow.get(trades[-1].open_date).humanize(),
-            'avg_duration': str(timedelta(seconds=sum(durations) / num)).split('.')[0],
+            'trade_count': stats['trade_count'],
+            'first_trade_date': arrow.get(stats['first_open_date']).humanize(),
+            'latest_trade_date': arrow.get(stats['latest_open_date']).humanize(),
+            'avg_duration': str(timedelta(seconds=stats['duration_sum'] / num)).split('.')[0],
             'best_pair': bp_pair,
             'best_rate': round(bp_rate * 100, 2),
         }
@@ -452,13 +449,7 @@ class RPC(object):
         Shows a performance statistic from finished trades
         """
 
-        pair_rates = Trade.session.query(Trade.pair,
-                                         sql.func.sum(Trade.close_profit).label('profit_sum'),
-                                         sql.func.count(Trade.pair).label('count')) \
-            .filter(Trade.is_open.is_(False)) \
-            .group_by(Trade.pair) \
-            .order_by(sql.text('profit_sum DESC')) \
-            .all()
+        pair_rates = Trade.get_performance()
         return [
             {'pair': pair, 'profit': round(rate * 100, 2), 'count': count}
             for pair, rate, count in pair_rates
@@ -504,3 +495,10 @@ class RPC(object):
         if not self._freqtrade.edge:
             raise RPCException(f'Edge is not enabled.')
         return self._freqtrade.edge.accepted_pairs()
+
+    def _rpc_perf(self) -> List[Dict[str, Any]]:
+        """ Returns the rolling wall time statistics of the process loop stages """
+        timings = self._freqtrade.timings
+        if not timings.iterations:
+            raise RPCException('no process iteration recorded yet')
+        return timings.summary()
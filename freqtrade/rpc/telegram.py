@@ -99,6 +99,7 @@ class Telegram(RPC):
             CommandHandler('whitelist', self._whitelist),
             CommandHandler('blacklist', self._blacklist, pass_args=True),
             CommandHandler('edge', self._edge),
+            CommandHandler('perf', self._perf),
             CommandHandler('help', self._help),
             CommandHandler('version', self._version),
         ]
@@ -170,6 +171,10 @@ class Telegram(RPC):
         elif msg['type'] == RPCMessageType.CUSTOM_NOTIFICATION:
             message = '{status}'.format(**msg)
 
+        elif msg['type'] == RPCMessageType.PERF_NOTIFICATION:
+            # Periodic timing reports are meant for webhooks, /perf shows them on demand
+            return
+
         else:
             raise NotImplementedError('Unknown message type: {}'.format(msg['type']))
 
@@ -543,6 +548,25 @@ class Telegram(RPC):
         except RPCException as e:
             self._send_msg(str(e), bot=bot)
 
+    @authorized_only
+    def _perf(self, bot: Bot, update: Update) -> None:
+        """
+        Handler for /perf
+        Shows the wall time of the process loop stages, in milliseconds
+        """
+        try:
+            timings = self._rpc_perf()
+            perf_tab = tabulate(
+                [[stats['stage'], stats['count']] +
+                 [round(stats[key] * 1000, 1) for key in ('last', 'p50', 'p90', 'p99', 'max')]
+                 for stats in timings],
+                headers=['Stage', 'Runs', 'Last', 'p50', 'p90', 'p99', 'Max'],
+                tablefmt='simple')
+            message = f'<b>Process timings (ms):</b>\n<pre>{perf_tab}</pre>'
+            self._send_msg(message, bot=bot, parse_mode=ParseMode.HTML)
+        except RPCException as e:
+            self._send_msg(str(e), bot=bot)
+
     @authorized_only
     def _help(self, bot: Bot, update: Update) -> None:
         """
@@ -574,6 +598,7 @@ class Telegram(RPC):
                   "*/blacklist [pair]:* `Show current blacklist, or adds one or more pairs " \
                   "to the blacklist.` \n" \
                   "*/edge:* `Shows validated pairs by Edge if it is enabeld` \n" \
+                  "*/perf:* `Shows the time spent in each stage of the bot loop` \n" \
                   "*/help:* `This help message`\n" \
                   "*/version:* `Show version`"
 
@@ -45,6 +45,8 @@ class Webhook(RPC):
                 valuedict = self._config['webhook'].get('webhooksell', None)
             elif msg['type'] == RPCMessageType.STATUS_NOTIFICATION:
                 valuedict = self._config['webhook'].get('webhookstatus', None)
+            elif msg['type'] == RPCMessageType.PERF_NOTIFICATION:
+                valuedict = self._config['webhook'].get('webhookperf', None)
             else:
                 raise NotImplementedError('Unknown message type: {}'.format(msg['type']))
             if not valuedict:
@@ -6,11 +6,11 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, NamedTuple, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import warnings
 
 import arrow
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.misc import timeframe_to_minutes
@@ -96,6 +96,13 @@ class IStrategy(ABC):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = False
 
+    # analyze only new candles (plus startup_candle_count candles before them)
+    # and append them to the previously analyzed dataframe
+    incremental_analysis: bool = False
+
+    # number of candles the indicators need before producing valid values
+    startup_candle_count: int = 0
+
     # Class level variables (intentional) containing
     # the dataprovider (dp) (access to other candles, historic data, ...)
     # and wallets - access to the current balance.
@@ -106,6 +113,8 @@ class IStrategy(ABC):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: Dict[str, datetime] = {}
+        # Last analyzed dataframe per pair, used by incremental_analysis
+        self._analyzed_per_pair: Dict[str, DataFrame] = {}
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -168,9 +177,10 @@ class IStrategy(ABC):
                 self._last_candle_seen_per_pair.get(pair, None) != dataframe.iloc[-1]['date']):
             # Defs that only make change on new candle data.
             logger.debug("TA Analysis Launched")
-            dataframe = self.advise_indicators(dataframe, metadata)
-            dataframe = self.advise_buy(dataframe, metadata)
-            dataframe = self.advise_sell(dataframe, metadata)
+            if self.incremental_analysis:
+                dataframe = self._analyze_ticker_incremental(dataframe, metadata)
+            else:
+                dataframe = self._analyze_ticker_full(dataframe, metadata)
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -183,6 +193,60 @@ class IStrategy(ABC):
 
         return dataframe
 
+    def _analyze_ticker_full(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Populate indicators, buy and sell signals for the whole dataframe
+        """
+        dataframe = self.advise_indicators(dataframe, metadata)
+        dataframe = self.advise_buy(dataframe, metadata)
+        return self.advise_sell(dataframe, metadata)
+
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Analyze only the candles added since the last call for this pair.
+        The new candles are analyzed together with the startup_candle_count candles before them,
+        and appended to the previously analyzed dataframe.
+        Falls back to a full analysis if the new data does not continue the analyzed dataframe.
+        :return: DataFrame with the same candles as the given dataframe
+        """
+        pair = str(metadata.get('pair'))
+        analyzed = self._analyzed_per_pair.get(pair)
+        new_candles = self._count_new_candles(analyzed, dataframe)
+
+        if analyzed is None or new_candles is None:
+            logger.debug("Full TA Analysis for pair %s", pair)
+            dataframe = self._analyze_ticker_full(dataframe, metadata)
+        else:
+            logger.debug("Incremental TA Analysis for pair %s (%s new candles)",
+                         pair, new_candles)
+            if new_candles > 0:
+                start = max(len(dataframe) - new_candles - self.startup_candle_count, 0)
+                window = self._analyze_ticker_full(dataframe.iloc[start:].copy(), metadata)
+                analyzed = concat([analyzed, window.iloc[-new_candles:]], sort=False)
+            dataframe = analyzed.iloc[-len(dataframe):].reset_index(drop=True)
+
+        self._analyzed_per_pair[pair] = dataframe
+        return dataframe
+
+    @staticmethod
+    def _count_new_candles(analyzed: Optional[DataFrame], dataframe: DataFrame) -> Optional[int]:
+        """
+        Number of candles in dataframe after the last analyzed candle.
+        :return: number of new candles, or None if the dataframe does not continue
+                 the analyzed dataframe
+        """
+        if analyzed is None or analyzed.empty:
+            return None
+        last_date = analyzed.iloc[-1]['date']
+        pos = int(dataframe['date'].searchsorted(last_date))
+        if pos >= len(dataframe) or dataframe.iloc[pos]['date'] != last_date:
+            return None
+        new_candles = len(dataframe) - pos - 1
+        # Analyzed dataframe too short to cover the start of the dataframe
+        if len(analyzed) + new_candles < len(dataframe):
+            return None
+        return new_candles
+
     def get_signal(self, pair: str, interval: str,
                    dataframe: DataFrame) -> Tuple[bool, bool]:
         """
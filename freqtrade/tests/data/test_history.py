@@ -1,25 +1,29 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
 import json
+import logging
 import os
 from pathlib import Path
 import uuid
 from shutil import copyfile
 
 import arrow
+import numpy as np
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 import pytest
 
 from freqtrade import OperationalException
 from freqtrade.arguments import TimeRange
 from freqtrade.data import history
+from freqtrade.data.converter import parse_ticker_dataframe
 from freqtrade.data.history import (download_pair_history,
                                     load_cached_data_for_updating,
                                     load_tickerdata_file,
                                     make_testdata_path,
                                     trim_tickerlist)
 from freqtrade.misc import file_dump_json
-from freqtrade.tests.conftest import get_patched_exchange, log_has
+from freqtrade.tests.conftest import get_patched_exchange, log_has, log_has_re
 
 # Change this if modifying UNITTEST/BTC testdatafile
 _BTC_UNITTEST_LENGTH = 13681
@@ -360,6 +364,45 @@ def test_init(default_conf, mocker) -> None:
     )
 
 
+@pytest.mark.parametrize('workers', [1, 3])
+def test_load_data_workers(caplog, tmpdir, workers) -> None:
+    caplog.set_level(logging.DEBUG)
+    datadir = Path(str(tmpdir))
+    pairs = ['XRP/BTC', 'ETH/BTC', 'MEME/BTC', 'ADA/BTC']
+    for pair in ['XRP/BTC', 'ETH/BTC', 'ADA/BTC']:
+        copyfile(make_testdata_path(None) / 'UNITTEST_BTC-8m.json.gz',
+                 datadir / f'{pair.replace("/", "_")}-8m.json.gz')
+    timerange = TimeRange(None, 'line', 0, -200)
+
+    data = history.load_data(datadir, '8m', pairs, timerange=timerange, workers=workers)
+
+    # Same order as pairs, pairs without data are left out
+    assert list(data) == ['XRP/BTC', 'ETH/BTC', 'ADA/BTC']
+    expected = history.load_pair_history('XRP/BTC', '8m', datadir, timerange=timerange)
+    for pair in data:
+        assert_frame_equal(data[pair], expected)
+    for pair in pairs:
+        assert log_has_re(f'Loaded data for pair {pair} in .* seconds', caplog.record_tuples)
+    assert log_has_re(f'Loaded data for 4 pairs in .* seconds using {min(workers, 4)} worker',
+                      caplog.record_tuples)
+
+
+def test_load_data_workers_refresh(mocker, default_conf, tmpdir) -> None:
+    datadir = Path(str(tmpdir))
+    exchange = get_patched_exchange(mocker, default_conf)
+    download_mock = mocker.patch('freqtrade.data.history.download_pair_history')
+    pairs = ['XRP/BTC', 'ETH/BTC']
+
+    # Downloads happen in this process, before the pairs are loaded
+    assert history.load_data(datadir, '8m', pairs, refresh_pairs=True,
+                             exchange=exchange, workers=2) == {}
+    assert download_mock.call_count == 2
+    assert [c[1]['pair'] for c in download_mock.call_args_list] == pairs
+
+    with pytest.raises(OperationalException, match=r'Exchange needs to be initialized when.*'):
+        history.load_data(datadir, '8m', pairs, refresh_pairs=True, workers=2)
+
+
 def test_trim_tickerlist() -> None:
     file = os.path.join(os.path.dirname(__file__), '..', 'testdata', 'UNITTEST_BTC-1m.json')
     with open(file) as data_file:
@@ -450,6 +493,60 @@ def test_trim_tickerlist() -> None:
     assert not ticker
 
 
+def _trim_tickerlist_linear(tickerlist, timerange):
+    # Reference implementation, scanning the dates one by one
+    start_index, stop_index = 0, len(tickerlist)
+    if timerange.starttype == 'date':
+        while (start_index < len(tickerlist) and
+               tickerlist[start_index][0] < timerange.startts * 1000):
+            start_index += 1
+    if timerange.stoptype == 'date':
+        while stop_index > 0 and tickerlist[stop_index - 1][0] > timerange.stopts * 1000:
+            stop_index -= 1
+    return tickerlist[start_index:stop_index]
+
+
+@pytest.mark.parametrize('as_array', [False, True])
+def test_trim_tickerlist_bisect(as_array) -> None:
+    # 100 candles of 5 minutes, starting at 2018-01-01 00:00
+    start_ms = 1514764800000
+    ticker_list = [[start_ms + i * 300000, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(100)]
+    data = np.array(ticker_list, dtype=np.float64) if as_array else ticker_list
+
+    def dates(ticker):
+        return [int(tick[0]) for tick in ticker]
+
+    # line
+    assert dates(trim_tickerlist(data, TimeRange(None, 'line', 0, -5))) == dates(ticker_list[-5:])
+    assert dates(trim_tickerlist(data, TimeRange('line', None, 5, 0))) == dates(ticker_list[:5])
+    # index
+    assert (dates(trim_tickerlist(data, TimeRange('index', 'index', 5, 10)))
+            == dates(ticker_list[5:10]))
+    with pytest.raises(ValueError, match=r'The timerange .* is incorrect'):
+        trim_tickerlist(data, TimeRange('index', 'index', 10, 5))
+    # date - exact candle dates are included on both ends
+    timerange = TimeRange('date', 'date', ticker_list[5][0] / 1000, ticker_list[10][0] / 1000)
+    assert dates(trim_tickerlist(data, timerange)) == dates(ticker_list[5:11])
+    timerange = TimeRange('date', 'date', ticker_list[5][0] / 1000 + 1,
+                          ticker_list[10][0] / 1000 - 1)
+    assert dates(trim_tickerlist(data, timerange)) == dates(ticker_list[6:10])
+    # date - timerange outside of the data
+    timerange = TimeRange('date', None, ticker_list[-1][0] / 1000 + 1, 0)
+    assert len(trim_tickerlist(data, timerange)) == 0
+    timerange = TimeRange(None, 'date', 0, ticker_list[0][0] / 1000 - 1)
+    assert len(trim_tickerlist(data, timerange)) == 0
+    timerange = TimeRange('date', 'date', ticker_list[0][0] / 1000 - 3600,
+                          ticker_list[-1][0] / 1000 + 3600)
+    assert len(trim_tickerlist(data, timerange)) == 100
+
+    # Same result as scanning the list for every combination of start and stop
+    for start in range(start_ms - 300000, start_ms + 101 * 300000, 150000):
+        for stop in range(start, start_ms + 101 * 300000, 450000):
+            timerange = TimeRange('date', 'date', start / 1000, stop / 1000)
+            assert (dates(trim_tickerlist(data, timerange))
+                    == dates(_trim_tickerlist_linear(ticker_list, timerange)))
+
+
 def test_file_dump_json_tofile() -> None:
     file = os.path.join(os.path.dirname(__file__), '..', 'testdata',
                         'test_{id}.json'.format(id=str(uuid.uuid4())))
@@ -473,3 +570,72 @@ def test_file_dump_json_tofile() -> None:
 
     # Remove the file
     _clean_test_file(file)
+
+
+def test_load_cached_tickerdata(mocker, tmpdir) -> None:
+    datadir = Path(str(tmpdir))
+    copyfile(make_testdata_path(None) / 'UNITTEST_BTC-8m.json.gz',
+             datadir / 'UNITTEST_BTC-8m.json.gz')
+    cache = history.tickerdata_cache_file(datadir, 'UNITTEST/BTC', '8m')
+    assert cache == datadir / 'UNITTEST_BTC-8m.npy'
+    assert not cache.is_file()
+
+    # First load builds the cache from the json file
+    tickerdata = history.load_cached_tickerdata(datadir, 'UNITTEST/BTC', '8m')
+    assert cache.is_file()
+    assert tickerdata.shape == (_BTC_UNITTEST_LENGTH, 6)
+    tickerlist = load_tickerdata_file(datadir, 'UNITTEST/BTC', '8m')
+    assert tickerdata[0].tolist() == tickerlist[0]
+    assert tickerdata[-1].tolist() == tickerlist[-1]
+
+    # Second load memory-maps the cache
+    json_mock = mocker.patch('freqtrade.data.history.load_tickerdata_file')
+    tickerdata = history.load_cached_tickerdata(datadir, 'UNITTEST/BTC', '8m')
+    assert isinstance(tickerdata, np.memmap)
+    assert tickerdata.shape == (_BTC_UNITTEST_LENGTH, 6)
+    assert json_mock.call_count == 0
+
+    # Cache older than the json file is rebuilt
+    stat = cache.stat()
+    os.utime(str(cache), (stat.st_atime, stat.st_mtime - 100))
+    json_mock.return_value = tickerlist[:10]
+    tickerdata = history.load_cached_tickerdata(datadir, 'UNITTEST/BTC', '8m')
+    assert json_mock.call_count == 1
+    assert len(tickerdata) == 10
+    assert len(np.load(str(cache))) == 10
+
+    # Timerange is applied to cached data
+    tickerdata = history.load_cached_tickerdata(datadir, 'UNITTEST/BTC', '8m',
+                                                TimeRange(None, 'line', 0, -5))
+    assert tickerdata.tolist() == tickerlist[5:10]
+
+    # No json file - cache is ignored
+    assert history.load_cached_tickerdata(datadir, 'UNITTEST/BTC', '7m') is None
+
+
+def test_load_pair_history_cache(tmpdir) -> None:
+    datadir = Path(str(tmpdir))
+    copyfile(make_testdata_path(None) / 'UNITTEST_BTC-8m.json.gz',
+             datadir / 'UNITTEST_BTC-8m.json.gz')
+    expected = parse_ticker_dataframe(load_tickerdata_file(datadir, 'UNITTEST/BTC', '8m'), '8m')
+    cache = history.tickerdata_cache_file(datadir, 'UNITTEST/BTC', '8m')
+
+    # The cache is only written when enabled
+    assert_frame_equal(history.load_pair_history('UNITTEST/BTC', '8m', datadir), expected)
+    assert not cache.is_file()
+
+    # Built from json, then loaded from the cache
+    assert_frame_equal(history.load_pair_history('UNITTEST/BTC', '8m', datadir, cache=True),
+                       expected)
+    assert cache.is_file()
+    assert_frame_equal(history.load_pair_history('UNITTEST/BTC', '8m', datadir, cache=True),
+                       expected)
+
+
+def test_store_tickerdata_cache_error(mocker, caplog, tmpdir) -> None:
+    cache = Path(str(tmpdir)) / 'UNITTEST_BTC-8m.npy'
+    mocker.patch('freqtrade.data.history.np.save', side_effect=OSError('disk full'))
+    history.store_tickerdata_cache(cache, np.zeros((2, 6)))
+    assert not cache.is_file()
+    assert os.listdir(str(tmpdir)) == []
+    assert log_has(f'Could not store ticker data cache {cache}: disk full', caplog.record_tuples)
@@ -110,7 +110,7 @@ def test_edge_results(edge_conf, mocker, caplog, data) -> None:
     edge.fee = 0
 
     trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', [data.stop_loss])
-    results = edge._fill_calculable_fields(DataFrame(trades)) if trades else DataFrame()
+    results = edge._fill_calculable_fields(trades)
 
     print(results)
 
@@ -255,7 +255,7 @@ def test_edge_heartbeat_calculate(mocker, edge_conf):
 
 
 def mocked_load_data(datadir, pairs=[], ticker_interval='0m', refresh_pairs=False,
-                     timerange=None, exchange=None):
+                     timerange=None, exchange=None, workers=1):
     hz = 0.1
     base = 0.001
 
@@ -360,3 +360,86 @@ def test_process_expectancy(mocker, edge_conf):
     assert round(final['TEST/BTC'].risk_reward_ratio, 10) == 306.5384615384
     assert round(final['TEST/BTC'].required_risk_reward, 10) == 2.0
     assert round(final['TEST/BTC'].expectancy, 10) == 101.5128205128
+
+
+def _reference_trades(frame, stoploss):
+    """
+    Candle by candle trade detection for a single stoploss
+    """
+    buy, sell = frame['buy'].values, frame['sell'].values
+    open_, low = frame['open'].values, frame['low'].values
+    trades = []
+    position = 0
+    while True:
+        buys = np.flatnonzero(buy[position:] == 1)
+        if not len(buys) or position + buys[0] == len(buy) - 1:
+            return trades
+        open_index = position + buys[0] + 1
+        stop_price = open_[open_index] * (1 + stoploss)
+        stops = np.flatnonzero(low[open_index:] < stop_price)
+        sells = np.flatnonzero(sell[open_index:] == 1)
+        stop_index = open_index + stops[0] if len(stops) else math.inf
+        sell_index = open_index + sells[0] if len(sells) else math.inf
+        if stop_index == sell_index == math.inf:
+            return trades
+        if stop_index <= sell_index:
+            trades.append((stoploss, open_index, stop_index, SellType.STOP_LOSS, stop_price))
+            position = stop_index
+        else:
+            if sell_index + 1 >= len(buy):
+                return trades
+            trades.append((stoploss, open_index, sell_index + 1, SellType.SELL_SIGNAL,
+                           open_[sell_index + 1]))
+            position = sell_index + 1
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_find_trades_for_stoploss_range_random(mocker, edge_conf, seed):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+
+    rng = np.random.RandomState(seed)
+    length = 700
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, length)))
+    open_ = np.concatenate([[100], close[:-1]])
+    frame = DataFrame({
+        'date': to_datetime(np.arange(length) * 300, unit='s', utc=True),
+        'open': open_,
+        'high': np.maximum(open_, close) * 1.002,
+        'low': np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.005, length))),
+        'close': close,
+        'buy': (rng.uniform(size=length) < 0.05).astype(int),
+        'sell': (rng.uniform(size=length) < 0.03).astype(int),
+    })
+    stoploss_range = np.arange(-0.01, -0.1, -0.001)
+
+    trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', stoploss_range)
+
+    expected = [trade for stoploss in stoploss_range
+                for trade in _reference_trades(frame, round(stoploss, 6))]
+    assert len(trades) == len(expected)
+    assert (trades['pair'] == 'TEST/BTC').all()
+    assert list(zip(trades['stoploss'], trades['open_index'], trades['close_index'],
+                    trades['exit_type'])) == [trade[:4] for trade in expected]
+    assert np.allclose(trades['close_rate'], [trade[4] for trade in expected])
+    assert (trades['open_time'].values == frame['date'].values[trades['open_index']]).all()
+
+
+def test_find_trades_for_stoploss_range_no_trades(mocker, edge_conf):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    frame = _build_backtest_dataframe(tc0.data)
+    trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', [-0.01, -0.02])
+    assert trades.empty
+    assert 'exit_type' in trades.columns
+
+
+def test_find_trades_for_stoploss_range_empty_range(mocker, edge_conf):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    frame = _build_backtest_dataframe(tc1.data)
+    # min, max and step pointing in different directions give no stoplosses
+    trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC',
+                                                  np.arange(-0.01, -0.05, 0.001))
+    assert trades.empty
+    assert 'exit_type' in trades.columns
@@ -10,9 +10,11 @@ import arrow
 import ccxt
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from freqtrade import (DependencyException, OperationalException,
                        TemporaryError, InvalidOrderException)
+from freqtrade.data.converter import parse_ticker_dataframe
 from freqtrade.exchange import Binance, Exchange, Kraken
 from freqtrade.exchange.exchange import API_RETRY_COUNT
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
@@ -869,6 +871,60 @@ def test_get_tickers(default_conf, mocker, exchange_name):
     exchange.get_tickers()
 
 
+@pytest.mark.parametrize("exchange_name", EXCHANGES)
+def test_get_tickers_snapshot(default_conf, mocker, exchange_name):
+    api_mock = MagicMock()
+    api_mock.fetch_tickers = MagicMock(return_value={
+        'ETH/BTC': {'symbol': 'ETH/BTC', 'bid': 0.5, 'ask': 1, 'last': 42},
+        'LTC/BTC': {'symbol': 'LTC/BTC', 'bid': None, 'ask': None, 'last': 41},
+    })
+    api_mock.fetch_ticker = MagicMock(return_value={
+        'symbol': 'LTC/BTC', 'bid': 0.6, 'ask': 0.7, 'last': 0.65})
+    api_mock.markets = {'ETH/BTC': {}, 'LTC/BTC': {}}
+    api_mock.has = {'fetchTickers': True}
+    default_conf['exchange']['tickers_ttl'] = 10
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, id=exchange_name)
+
+    # One request for all tickers within tickers_ttl
+    assert exchange.get_tickers()['ETH/BTC']['bid'] == 0.5
+    assert exchange.get_ticker('ETH/BTC')['last'] == 42
+    assert exchange.get_ticker('ETH/BTC', refresh=False)['bid'] == 0.5
+    assert api_mock.fetch_tickers.call_count == 1
+    assert api_mock.fetch_ticker.call_count == 0
+
+    # Tickers without bid/ask are fetched on their own
+    assert exchange.get_ticker('LTC/BTC')['bid'] == 0.6
+    assert api_mock.fetch_ticker.call_count == 1
+
+    # Refreshed when expired
+    exchange._tickers_snapshot_time -= 10
+    exchange.get_ticker('ETH/BTC')
+    assert api_mock.fetch_tickers.call_count == 2
+
+    # A failed request is neither retried nor repeated within tickers_ttl
+    fetch_tickers = api_mock.fetch_tickers
+    api_mock.fetch_tickers = MagicMock(side_effect=ccxt.NetworkError('Unavailable'))
+    exchange._tickers_snapshot_time -= 10
+    assert exchange.get_ticker('ETH/BTC')['bid'] == 0.6
+    assert exchange.get_ticker('ETH/BTC')['bid'] == 0.6
+    assert api_mock.fetch_tickers.call_count == 1
+    assert api_mock.fetch_ticker.call_count == 3
+    api_mock.fetch_tickers = fetch_tickers
+    exchange._tickers_failed_time -= 10
+    assert exchange.get_ticker('ETH/BTC')['bid'] == 0.5
+    assert api_mock.fetch_tickers.call_count == 3
+    assert api_mock.fetch_ticker.call_count == 3
+
+    # Disabled
+    default_conf['exchange']['tickers_ttl'] = 0
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, id=exchange_name)
+    exchange.get_tickers()
+    exchange.get_tickers()
+    exchange.get_ticker('ETH/BTC')
+    assert api_mock.fetch_tickers.call_count == 5
+    assert api_mock.fetch_ticker.call_count == 4
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_get_ticker(default_conf, mocker, exchange_name):
     api_mock = MagicMock()
@@ -1006,6 +1062,46 @@ def test_refresh_latest_ohlcv(mocker, default_conf, caplog) -> None:
                    caplog.record_tuples)
 
 
+def test_refresh_latest_ohlcv_incremental(mocker, default_conf, caplog) -> None:
+    interval_ms = 5 * 60 * 1000
+    start = (arrow.utcnow().timestamp * 1000 // interval_ms - 100) * interval_ms
+    ticks = [[start + i * interval_ms, 1 + i, 2 + i, 0.5 + i, 1.5 + i, 10 + i]
+             for i in range(101)]
+    fetched = {'ticks': ticks[:51]}
+
+    async def mock_fetch_ohlcv(pair, timeframe, since=None):
+        return [tick for tick in fetched['ticks'] if since is None or tick[0] >= since]
+
+    caplog.set_level(logging.DEBUG)
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._api_async.fetch_ohlcv = MagicMock(side_effect=mock_fetch_ohlcv)
+    pair = ('IOTA/ETH', '5m')
+
+    exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_args[1]['since'] is None
+    assert len(exchange.klines(pair)) == 50
+
+    # Only candles after the last closed candle are fetched and appended
+    fetched['ticks'] = ticks[:81]
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 2
+    assert exchange._api_async.fetch_ohlcv.call_args[1]['since'] == ticks[50][0]
+    assert len(res[0][2]) == 31
+    assert_frame_equal(exchange.klines(pair), parse_ticker_dataframe(ticks[:81], '5m'))
+
+    # A gap in the new candles triggers a full download
+    fetched['ticks'] = ticks[:82] + ticks[83:]
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 4
+    assert exchange._api_async.fetch_ohlcv.call_args[1]['since'] is None
+    assert log_has(f"Gap in refreshed ohlcv data for {[pair]}, downloading full history",
+                   caplog.record_tuples)
+    assert len(res) == 1
+    assert len(res[0][2]) == 100
+    assert_frame_equal(exchange.klines(pair),
+                       parse_ticker_dataframe(fetched['ticks'], '5m', fill_missing=True))
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 async def test__async_get_candle_history(default_conf, mocker, caplog, exchange_name):
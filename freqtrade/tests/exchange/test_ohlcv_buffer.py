@@ -0,0 +1,65 @@
+# pragma pylint: disable=missing-docstring, C0103, protected-access
+import numpy as np
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import parse_ticker_dataframe
+from freqtrade.exchange.ohlcv_buffer import MIN_OHLCV_BUFFER_SIZE, OHLCVBuffer
+
+INTERVAL_MS = 5 * 60 * 1000
+
+
+def _ticks(start, count):
+    return [[(start + i) * INTERVAL_MS, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0 + i]
+            for i in range(count)]
+
+
+def test_ohlcv_buffer_from_dataframe() -> None:
+    ticks = _ticks(1000, 20)
+    frame = parse_ticker_dataframe(ticks, '5m', fill_missing=True)
+    buffer = OHLCVBuffer.from_dataframe(frame, '5m')
+    assert buffer.capacity == MIN_OHLCV_BUFFER_SIZE
+    assert len(buffer) == 19
+    assert buffer.last_date_ms == ticks[-2][0]
+    assert buffer.next_date_ms == ticks[-1][0]
+    assert_frame_equal(buffer.to_dataframe(), frame)
+
+
+def test_ohlcv_buffer_extend() -> None:
+    ticks = _ticks(1000, 30)
+    buffer = OHLCVBuffer.from_dataframe(parse_ticker_dataframe(ticks[:10], '5m'), '5m')
+
+    # Overlapping result (exchange ignoring since) - only new candles are appended
+    assert buffer.extend(ticks[5:20])
+    assert_frame_equal(buffer.to_dataframe(), parse_ticker_dataframe(ticks[:20], '5m'))
+
+    # Only the open candle - nothing to append
+    assert buffer.extend(ticks[19:20])
+    assert len(buffer) == 19
+
+    # Gap between the buffer and the new candles
+    assert not buffer.extend(ticks[21:25])
+    # Gap within the new candles
+    assert not buffer.extend(ticks[19:21] + ticks[22:25])
+    assert len(buffer) == 19
+
+    assert buffer.extend(ticks[19:30])
+    assert_frame_equal(buffer.to_dataframe(), parse_ticker_dataframe(ticks, '5m'))
+
+
+def test_ohlcv_buffer_ring() -> None:
+    ticks = _ticks(1000, 1000)
+    buffer = OHLCVBuffer('5m', 10)
+    assert not buffer.extend(ticks[:5])
+
+    buffer._append(np.array(ticks[:8]))
+    assert len(buffer) == 8
+    # Wraps around the end of the array
+    assert buffer.extend(ticks[8:14])
+    assert len(buffer) == 10
+    assert buffer._start == 3
+    assert (buffer.to_array() == np.array(ticks[3:13])).all()
+    # More new candles than the buffer holds
+    assert buffer.extend(ticks[13:40])
+    assert buffer._start == 0
+    assert (buffer.to_array() == np.array(ticks[29:39])).all()
+    assert buffer.next_date_ms == ticks[39][0]
@@ -0,0 +1,247 @@
+# pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from pandas import DataFrame, date_range
+from pandas.testing import assert_frame_equal
+
+from freqtrade.optimize import get_timeframe
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade import OperationalException
+from freqtrade.optimize.vectorized import (ExitCandidates, consumed_steps, profit_abs,
+                                           profit_percent)
+from freqtrade.persistence import Trade
+from freqtrade.tests.conftest import patch_exchange
+from freqtrade.tests.optimize import _build_backtest_dataframe, tests_ticker_interval
+from freqtrade.tests.optimize.test_backtest_detail import TESTS
+
+
+def _random_walk_data(pairs, length, seed):
+    """
+    Build random OHLCV data with random buy / sell signals for the given pairs.
+    Pairs get different start dates, so not all pairs have a candle on every date.
+    """
+    rng = np.random.RandomState(seed)
+    data = {}
+    for num, pair in enumerate(pairs):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, length)))
+        open_ = np.concatenate([[100], close[:-1]])
+        spread = np.abs(rng.normal(0, 0.005, length))
+        frame = DataFrame({
+            'date': date_range('2018-10-03', periods=length, freq='5min', tz='UTC')[:length],
+            'open': open_,
+            'high': np.maximum(open_, close) * (1 + spread),
+            'low': np.minimum(open_, close) * (1 - spread),
+            'close': close,
+            'volume': rng.uniform(100, 1000, length),
+        })
+        frame = frame.iloc[num * 7:].reset_index(drop=True)
+        signals = DataFrame({
+            'buy': (rng.uniform(size=len(frame)) < 0.08).astype(int),
+            'sell': (rng.uniform(size=len(frame)) < 0.05).astype(int),
+        })
+        data[pair] = (frame, signals)
+    return data
+
+
+def _run_backtest(config, data, engine, max_open_trades, position_stacking, end_shift=0):
+    config['backtest_engine'] = engine
+    backtesting = Backtesting(config)
+    backtesting.advise_buy = lambda df, m: df.assign(buy=data[m['pair']][1]['buy'].values)
+    backtesting.advise_sell = lambda df, m: df.assign(sell=data[m['pair']][1]['sell'].values)
+    processed = {pair: frame.copy() for pair, (frame, _) in data.items()}
+    min_date, max_date = get_timeframe(processed)
+    return backtesting.backtest(
+        {
+            'stake_amount': config['stake_amount'],
+            'processed': processed,
+            'max_open_trades': max_open_trades,
+            'position_stacking': position_stacking,
+            'start_date': min_date,
+            'end_date': max_date.shift(minutes=end_shift),
+        }
+    )
+
+
+def _run_exit_candidates(config, data, roi_tables, stoplosses, position_stacking=True):
+    config['backtest_engine'] = 'vectorized'
+    backtesting = Backtesting(config)
+    backtesting.advise_buy = lambda df, m: df.assign(buy=data[m['pair']][1]['buy'].values)
+    backtesting.advise_sell = lambda df, m: df.assign(sell=data[m['pair']][1]['sell'].values)
+    processed = {pair: frame.copy() for pair, (frame, _) in data.items()}
+    min_date, max_date = get_timeframe(processed)
+    return backtesting.backtest_exit_candidates(
+        {
+            'stake_amount': config['stake_amount'],
+            'processed': processed,
+            'position_stacking': position_stacking,
+            'start_date': min_date,
+            'end_date': max_date,
+        }, roi_tables, stoplosses
+    )
+
+
+def test_profit_rounding_like_trade() -> None:
+    # A 5% loss with 0.25% fee is half of the 8th digit: -0.000054875 BTC
+    open_rate = np.array([95.46361694882553, 108.16075377489105, 0.1])
+    rate = open_rate * 0.95
+    trades = [Trade(open_rate=open_, stake_amount=0.001, amount=0.001 / open_,
+                    fee_open=0.0025, fee_close=0.0025) for open_ in open_rate]
+
+    assert profit_abs(rate, open_rate, 0.0025, 0.001).tolist() == [
+        trade.calc_profit(rate=close) for trade, close in zip(trades, rate)]
+    assert profit_percent(rate, open_rate, 0.0025).tolist() == [
+        trade.calc_profit_percent(rate=close) for trade, close in zip(trades, rate)]
+
+
+def test_consumed_steps() -> None:
+    interval = 5
+    start = 0
+    # Regular data - one row per step
+    assert list(consumed_steps(np.array([0, 5, 10, 15]), start, interval)) == [0, 1, 2, 3]
+    # Data starting later than the backtest start
+    assert list(consumed_steps(np.array([20, 25, 30]), start, interval)) == [3, 4, 5]
+    # Gap in the data - rows after the gap are only reached once the time-counter gets there
+    assert list(consumed_steps(np.array([0, 5, 30, 35]), start, interval)) == [0, 1, 5, 6]
+    assert list(consumed_steps(np.array([]), start, interval)) == []
+
+
+@pytest.mark.parametrize("data", TESTS)
+def test_backtest_vectorized_detail(default_conf, fee, mocker, data) -> None:
+    default_conf["stoploss"] = data.stop_loss
+    default_conf["minimal_roi"] = {"0": data.roi}
+    default_conf["ticker_interval"] = tests_ticker_interval
+    default_conf["trailing_stop"] = data.trailing_stop
+    mocker.patch("freqtrade.exchange.Exchange.get_fee", MagicMock(return_value=0.0))
+    patch_exchange(mocker)
+    frame = _build_backtest_dataframe(data.data)
+    pair = "UNITTEST/BTC"
+    signals = {pair: (frame[['date', 'open', 'high', 'low', 'close', 'volume']],
+                      frame[['buy', 'sell']])}
+
+    results_loop = _run_backtest(default_conf, signals, 'loop', 10, False)
+    results_vect = _run_backtest(default_conf, signals, 'vectorized', 10, False)
+
+    assert len(results_vect) == len(data.trades)
+    assert_frame_equal(results_loop, results_vect)
+
+
+@pytest.mark.parametrize("max_open_trades,position_stacking", [
+    (0, False),
+    (1, False),
+    (3, False),
+    (3, True),
+    (0, True),
+])
+@pytest.mark.parametrize("settings", [
+    {},
+    {'trailing_stop': True},
+    {'trailing_stop': True, 'trailing_stop_positive': 0.005},
+    {'trailing_stop': True, 'trailing_stop_positive': 0.005,
+     'trailing_stop_positive_offset': 0.01},
+    {'trailing_stop': True, 'trailing_stop_positive': 0.005,
+     'trailing_stop_positive_offset': 0.01, 'trailing_only_offset_is_reached': True},
+    {'experimental': {'use_sell_signal': True}},
+    {'experimental': {'use_sell_signal': True, 'sell_profit_only': True}},
+    {'experimental': {'use_sell_signal': True, 'ignore_roi_if_buy_signal': True}},
+])
+def test_backtest_vectorized_parity(default_conf, mocker, max_open_trades, position_stacking,
+                                    settings) -> None:
+    default_conf['ticker_interval'] = '5m'
+    default_conf['stoploss'] = -0.02
+    default_conf['minimal_roi'] = {'0': 0.03, '30': 0.015, '90': 0.005, '240': 0}
+    default_conf.update(settings)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.0025))
+    patch_exchange(mocker)
+    data = _random_walk_data(['ETH/BTC', 'LTC/BTC', 'XRP/BTC', 'NEO/BTC'], 600, seed=42)
+
+    results_loop = _run_backtest(default_conf, data, 'loop', max_open_trades,
+                                 position_stacking)
+    results_vect = _run_backtest(default_conf, data, 'vectorized', max_open_trades,
+                                 position_stacking)
+
+    assert len(results_loop) > 0
+    assert_frame_equal(results_loop, results_vect)
+
+
+def test_backtest_vectorized_long_trades(default_conf, mocker) -> None:
+    # Trades spanning more than one scan-window, and trades still open at the end
+    default_conf['ticker_interval'] = '5m'
+    default_conf['stoploss'] = -0.5
+    default_conf['minimal_roi'] = {'0': 10}
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.0025))
+    patch_exchange(mocker)
+    data = _random_walk_data(['ETH/BTC', 'LTC/BTC'], 1000, seed=7)
+
+    results_loop = _run_backtest(default_conf, data, 'loop', 2, False)
+    results_vect = _run_backtest(default_conf, data, 'vectorized', 2, False)
+
+    assert results_vect['open_at_end'].any()
+    assert_frame_equal(results_loop, results_vect)
+
+
+def test_backtest_vectorized_timerange(default_conf, mocker) -> None:
+    # Backtest end-date before the end of the data
+    default_conf['ticker_interval'] = '5m'
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.0025))
+    patch_exchange(mocker)
+    data = _random_walk_data(['ETH/BTC', 'LTC/BTC'], 400, seed=3)
+
+    results_loop = _run_backtest(default_conf, data, 'loop', 2, False, end_shift=-500)
+    results_vect = _run_backtest(default_conf, data, 'vectorized', 2, False, end_shift=-500)
+    assert_frame_equal(results_loop, results_vect)
+
+
+def test_exit_candidates_from_values() -> None:
+    candidates = ExitCandidates.from_values([{'0': 0.1, '30': 0.05}, {}], [-0.1, -0.2])
+    assert candidates.stoploss.tolist() == [-0.1, -0.2]
+    assert candidates.roi_durations.tolist() == [[0, 30], [np.inf, np.inf]]
+    assert candidates.roi_values.tolist() == [[0.1, 0.05], [np.inf, np.inf]]
+
+    with pytest.raises(ValueError, match=r'Number of roi tables and stoplosses does not match'):
+        ExitCandidates.from_values([{'0': 0.1}], [-0.1, -0.2])
+
+
+@pytest.mark.parametrize("settings", [
+    {},
+    {'trailing_stop': True},
+    {'trailing_stop': True, 'trailing_stop_positive': 0.005,
+     'trailing_stop_positive_offset': 0.01, 'trailing_only_offset_is_reached': True},
+    {'experimental': {'use_sell_signal': True, 'sell_profit_only': True}},
+    {'experimental': {'use_sell_signal': True, 'ignore_roi_if_buy_signal': True}},
+])
+def test_backtest_exit_candidates_parity(default_conf, mocker, settings) -> None:
+    default_conf['ticker_interval'] = '5m'
+    default_conf.update(settings)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.0025))
+    patch_exchange(mocker)
+    data = _random_walk_data(['ETH/BTC', 'LTC/BTC', 'XRP/BTC'], 600, seed=42)
+    roi_tables = [
+        {'0': 0.03, '30': 0.015, '90': 0.005, '240': 0},
+        {'0': 0.01},
+        {'0': 0.05, '120': 0.02},
+        # Trades longer than one scan-window, and trades still open at the end
+        {'0': 10},
+    ]
+    stoplosses = [-0.02, -0.05, -0.01, -0.5]
+
+    results = _run_exit_candidates(default_conf, data, roi_tables, stoplosses)
+
+    assert len(results) == len(roi_tables)
+    assert results[-1]['open_at_end'].any()
+    for roi_table, stoploss, result in zip(roi_tables, stoplosses, results):
+        default_conf['minimal_roi'] = roi_table
+        default_conf['stoploss'] = stoploss
+        results_vect = _run_backtest(default_conf, data, 'vectorized', 0, True)
+        assert len(results_vect) > 0
+        assert_frame_equal(result, results_vect)
+
+
+def test_backtest_exit_candidates_requires_stacking(default_conf, mocker) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.0025))
+    patch_exchange(mocker)
+    data = _random_walk_data(['ETH/BTC'], 100, seed=1)
+
+    with pytest.raises(OperationalException, match=r'requires position stacking'):
+        _run_exit_candidates(default_conf, data, [{'0': 0.01}], [-0.1], position_stacking=False)
@@ -3,6 +3,7 @@
 import json
 import math
 import random
+from pathlib import Path
 from typing import List
 from unittest.mock import MagicMock
 
@@ -23,7 +24,7 @@ from freqtrade.optimize.backtesting import (Backtesting, setup_configuration,
 from freqtrade.state import RunMode
 from freqtrade.strategy.default_strategy import DefaultStrategy
 from freqtrade.strategy.interface import SellType
-from freqtrade.tests.conftest import log_has, patch_exchange
+from freqtrade.tests.conftest import log_has, log_has_re, patch_exchange
 
 
 def get_args(args) -> List[str]:
@@ -105,7 +106,7 @@ def simple_backtest(config, contour, num_results, mocker) -> None:
 
 
 def mocked_load_data(datadir, pairs=[], ticker_interval='0m', refresh_pairs=False,
-                     timerange=None, exchange=None):
+                     timerange=None, exchange=None, workers=1):
     tickerdata = history.load_tickerdata_file(datadir, 'UNITTEST/BTC', '1m', timerange=timerange)
     pairdata = {'UNITTEST/BTC': parse_ticker_dataframe(tickerdata, '1m', fill_missing=True)}
     return pairdata
@@ -586,6 +587,40 @@ def test_backtest(default_conf, fee, mocker) -> None:
                 t["close_rate"], 6) < round(ln.iloc[0]["high"], 6))
 
 
+@pytest.mark.parametrize('engine', constants.BACKTEST_ENGINES)
+def test_backtest_reuse_ticker(default_conf, fee, mocker, engine) -> None:
+    default_conf['backtest_engine'] = engine
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    timerange = TimeRange(None, 'line', 0, -201)
+    data = history.load_data(datadir=None, ticker_interval='5m', pairs=['UNITTEST/BTC'],
+                             timerange=timerange)
+    data_processed = backtesting.strategy.tickerdata_to_dataframe(data)
+    min_date, max_date = get_timeframe(data_processed)
+    args = {
+        'stake_amount': default_conf['stake_amount'],
+        'processed': data_processed,
+        'max_open_trades': 10,
+        'position_stacking': False,
+        'start_date': min_date,
+        'end_date': max_date,
+    }
+    results = backtesting.backtest(args)
+
+    ticker = backtesting.get_ticker(data_processed)
+    advise_buy = mocker.patch.object(backtesting, 'advise_buy')
+    # Only the roi changes - signals are reused
+    backtesting.strategy.minimal_roi = {0: 0.5}
+    results_reused = backtesting.backtest({'ticker': ticker, **args})
+    backtesting.strategy.minimal_roi = default_conf['minimal_roi']
+    results_reused_again = backtesting.backtest({'ticker': ticker, **args})
+
+    assert not advise_buy.called
+    assert not results_reused.equals(results)
+    pd.testing.assert_frame_equal(results_reused_again, results)
+
+
 def test_backtest_1min_ticker_interval(default_conf, fee, mocker) -> None:
     mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
     patch_exchange(mocker)
@@ -928,3 +963,101 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog):
 
     for line in exists:
         assert log_has(line, caplog.record_tuples)
+
+
+@pytest.mark.parametrize('start_method', ['fork', 'spawn'])
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, caplog, start_method):
+    default_conf['exchange']['pair_whitelist'] = ['UNITTEST/BTC']
+
+    async def load_pairs(pair, timeframe, since):
+        return _load_pair_as_ticks(pair, timeframe)
+    api_mock = MagicMock()
+    api_mock.fetch_ohlcv = load_pairs
+
+    patch_exchange(mocker, api_mock)
+    mocker.patch('freqtrade.misc.multiprocessing.get_start_method',
+                 MagicMock(return_value=start_method))
+    # Results have to be picklable to be sent back from the workers
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.backtest', autospec=True,
+                 side_effect=lambda self, args: pd.DataFrame(
+                     {'strategy': [self.strategy.get_strategy_name()],
+                      'pairs': [len(args['processed'])],
+                      'open_at_end': [False]}))
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting._generate_text_table', MagicMock())
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting._generate_text_table_sell_reason',
+                 MagicMock())
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.generate_text_table_performance',
+                 MagicMock())
+    gen_strattable_mock = MagicMock()
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting._generate_text_table_strategy',
+                 gen_strattable_mock)
+    mocker.patch('freqtrade.configuration.open', mocker.mock_open(
+        read_data=json.dumps(default_conf)
+    ))
+
+    args = [
+        '--config', 'config.json',
+        '--datadir', 'freqtrade/tests/testdata',
+        'backtesting',
+        '--ticker-interval', '1m',
+        '--live',
+        '--timerange', '-100',
+        '--strategy-list',
+        'DefaultStrategy',
+        'TestStrategy',
+        '--strategy-workers', '2',
+    ]
+    start(get_args(args))
+    assert log_has('Parameter --strategy-workers detected: 2 ...', caplog.record_tuples)
+    parallel = start_method == 'fork'
+    assert bool(log_has('Backtesting 2 strategies using 2 worker processes ...',
+                        caplog.record_tuples)) is parallel
+    assert bool(log_has_re(r'Backtesting strategies in parallel needs the "fork" start method.*',
+                           caplog.record_tuples)) is not parallel
+
+    assert gen_strattable_mock.call_count == 1
+    all_results = gen_strattable_mock.call_args[0][0]
+    assert list(all_results) == ['DefaultStrategy', 'TestStrategy']
+    for strategy, results in all_results.items():
+        assert results['strategy'][0] == strategy
+        assert results['pairs'][0] == 1
+
+
+def test_backtest_start_indicator_cache(default_conf, mocker, caplog, tmpdir):
+    default_conf['exchange']['pair_whitelist'] = ['UNITTEST/BTC']
+    default_conf['exchange']['name'] = 'binance'
+    default_conf['indicator_cache_dir'] = str(tmpdir)
+
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.backtest', MagicMock())
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting._generate_text_table', MagicMock())
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting._generate_text_table_strategy',
+                 MagicMock())
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.generate_text_table_performance',
+                 MagicMock())
+    mocker.patch('freqtrade.configuration.open', mocker.mock_open(
+        read_data=json.dumps(default_conf)
+    ))
+    get_timeframe_mock = mocker.patch('freqtrade.optimize.get_timeframe',
+                                      MagicMock(wraps=get_timeframe))
+    advise_mock = mocker.patch('freqtrade.strategy.interface.IStrategy.advise_indicators',
+                               MagicMock(side_effect=lambda dataframe, metadata: dataframe))
+
+    args = [
+        '--config', 'config.json',
+        '--datadir', 'freqtrade/tests/testdata',
+        'backtesting',
+        '--ticker-interval', '8m',
+        '--indicator-cache',
+        '--strategy-list',
+        'DefaultStrategy',
+        'DefaultStrategy',
+    ]
+    start(get_args(args))
+    assert log_has('Parameter --indicator-cache detected ...', caplog.record_tuples)
+    assert log_has('Indicator cache: 0 hits, 1 misses', caplog.record_tuples)
+    assert log_has('Indicator cache: 1 hits, 1 misses', caplog.record_tuples)
+    assert advise_mock.call_count == 1
+    # Timeframe is only calculated once for all strategies
+    assert get_timeframe_mock.call_count == 1
+    assert len(list(Path(str(tmpdir)).glob('UNITTEST_BTC-8m-*.pkl'))) == 1
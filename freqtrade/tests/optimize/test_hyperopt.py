@@ -1,18 +1,26 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+import multiprocessing
 from datetime import datetime
-import os
+from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
+from skopt import Optimizer
+from skopt.space import Real
 
 from freqtrade.data.converter import parse_ticker_dataframe
 from freqtrade.data.history import load_tickerdata_file
-from freqtrade.optimize.hyperopt import Hyperopt, start
+from freqtrade.misc import uses_fork_start_method
+from freqtrade.optimize.hyperopt import (MAX_LOSS, Hyperopt, TICKERDATA_PICKLE,
+                                         load_processed, load_signals, start)
+from freqtrade.optimize.trial_store import TrialStore
 from freqtrade.optimize.default_hyperopt import DefaultHyperOpts
 from freqtrade.resolvers import StrategyResolver, HyperOptResolver
 from freqtrade.tests.conftest import log_has, patch_exchange
 from freqtrade.tests.optimize.test_backtesting import get_args
+from freqtrade.timings import ProcessTimings
 
 
 @pytest.fixture(scope='function')
@@ -22,21 +30,14 @@ def hyperopt(default_conf, mocker):
 
 
 # Functions for recurrent object patching
-def create_trials(mocker, hyperopt) -> None:
+def create_trial_store(hyperopt, tmpdir) -> TrialStore:
     """
-    When creating trials, mock the hyperopt Trials so that *by default*
-      - we don't create any pickle'd files in the filesystem
-      - we might have a pickle'd file so make sure that we return
-        false when looking for it
+    Keep the trials of the test in a temporary directory
     """
-    hyperopt.trials_file = os.path.join('freqtrade', 'tests', 'optimize', 'ut_trials.pickle')
-
-    mocker.patch('freqtrade.optimize.hyperopt.os.path.exists', return_value=False)
-    mocker.patch('freqtrade.optimize.hyperopt.os.path.getsize', return_value=1)
-    mocker.patch('freqtrade.optimize.hyperopt.os.remove', return_value=True)
-    mocker.patch('freqtrade.optimize.hyperopt.dump', return_value=None)
-
-    return [{'loss': 1, 'result': 'foo', 'params': {}}]
+    hyperopt.trials_file = Path(str(tmpdir), 'ut_trials.sqlite')
+    hyperopt.trial_store = TrialStore(hyperopt.trials_file)
+    hyperopt.space_id = hyperopt.get_space_id()
+    return hyperopt.trial_store
 
 
 def test_hyperoptresolver(mocker, default_conf, caplog) -> None:
@@ -163,31 +164,74 @@ def test_no_log_if_loss_does_not_improve(hyperopt, caplog) -> None:
     assert caplog.record_tuples == []
 
 
-def test_save_trials_saves_trials(mocker, hyperopt, caplog) -> None:
-    trials = create_trials(mocker, hyperopt)
-    mock_dump = mocker.patch('freqtrade.optimize.hyperopt.dump', return_value=None)
-    hyperopt.trials = trials
+def test_save_trials_saves_trials(hyperopt, tmpdir) -> None:
+    hyperopt.config['spaces'] = ['all']
+    trial_store = create_trial_store(hyperopt, tmpdir)
+    hyperopt.trials = [{'loss': 1, 'result': 'foo', 'params': {'stoploss': -0.1}}]
+    hyperopt.save_trials()
+    # Saved trials are not written again
     hyperopt.save_trials()
 
-    trials_file = os.path.join('freqtrade', 'tests', 'optimize', 'ut_trials.pickle')
-    assert log_has(
-        'Saving 1 evaluations to \'{}\''.format(trials_file),
-        caplog.record_tuples
-    )
-    mock_dump.assert_called_once()
+    assert hyperopt.trials == []
+    assert trial_store.trials(hyperopt.space_id) == [
+        {'loss': 1, 'result': 'foo', 'params': {'stoploss': -0.1}}
+    ]
 
 
-def test_read_trials_returns_trials_file(mocker, hyperopt, caplog) -> None:
-    trials = create_trials(mocker, hyperopt)
-    mock_load = mocker.patch('freqtrade.optimize.hyperopt.load', return_value=trials)
-    hyperopt_trial = hyperopt.read_trials()
-    trials_file = os.path.join('freqtrade', 'tests', 'optimize', 'ut_trials.pickle')
-    assert log_has(
-        'Reading Trials from \'{}\''.format(trials_file),
-        caplog.record_tuples
-    )
-    assert hyperopt_trial == trials
-    mock_load.assert_called_once()
+def test_load_previous_results(hyperopt, tmpdir, caplog) -> None:
+    hyperopt.config['spaces'] = ['all']
+    trial_store = create_trial_store(hyperopt, tmpdir)
+    dimensions = hyperopt.hyperopt_space()
+    points = [[dim.rvs(n_samples=1, random_state=seed)[0] for dim in dimensions]
+              for seed in range(3)]
+    trial_store.append([{'loss': loss, 'result': 'foo',
+                         'params': {dim.name: value for dim, value in zip(dimensions, point)}}
+                        for loss, point in zip([3, 1, 2], points)], hyperopt.space_id)
+    trial_store.append([{'loss': 0, 'result': 'other space', 'params': {}}], 'other')
+
+    opt = hyperopt.get_optimizer(1)
+    hyperopt.load_previous_results(opt)
+
+    assert opt.yi == [3, 1, 2]
+    assert len(hyperopt.results_cache) == 3
+    assert hyperopt.current_best_loss == 1
+    assert log_has('Loaded 3 previous evaluations from \'{}\'.'.format(hyperopt.trials_file),
+                   caplog.record_tuples)
+
+    # Trials of another timerange neither warm-start the optimizer nor fill the cache
+    hyperopt.results_cache = {}
+    hyperopt.config['timerange'] = '20180101-20180201'
+    hyperopt.space_id = hyperopt.get_space_id()
+    opt = hyperopt.get_optimizer(1)
+    hyperopt.load_previous_results(opt)
+
+    assert opt.yi == []
+    assert hyperopt.results_cache == {}
+
+
+def test_get_space_id(hyperopt) -> None:
+    hyperopt.config['spaces'] = ['all']
+    space_id = hyperopt.get_space_id()
+    assert hyperopt.get_space_id() == space_id
+
+    # The order of the whitelist doesn't matter
+    hyperopt.config['exchange']['pair_whitelist'].reverse()
+    assert hyperopt.get_space_id() == space_id
+
+    hyperopt.config['timerange'] = '20180101-20180201'
+    assert hyperopt.get_space_id() != space_id
+    del hyperopt.config['timerange']
+
+    hyperopt.config['exchange']['pair_whitelist'].append('XRP/BTC')
+    assert hyperopt.get_space_id() != space_id
+    hyperopt.config['exchange']['pair_whitelist'].pop()
+
+    hyperopt.ticker_interval = '1h'
+    assert hyperopt.get_space_id() != space_id
+    hyperopt.ticker_interval = hyperopt.config['ticker_interval']
+
+    hyperopt.config['spaces'] = ['roi']
+    assert hyperopt.get_space_id() != space_id
 
 
 def test_roi_table_generation(hyperopt) -> None:
@@ -203,7 +247,7 @@ def test_roi_table_generation(hyperopt) -> None:
     assert hyperopt.custom_hyperopt.generate_roi_table(params) == {0: 6, 15: 3, 25: 1, 30: 0}
 
 
-def test_start_calls_optimizer(mocker, default_conf, caplog) -> None:
+def test_start_calls_optimizer(mocker, default_conf, caplog, tmpdir) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
     mocker.patch('freqtrade.optimize.hyperopt.load_data', MagicMock())
     mocker.patch('freqtrade.optimize.hyperopt.multiprocessing.cpu_count', MagicMock(return_value=1))
@@ -219,6 +263,7 @@ def test_start_calls_optimizer(mocker, default_conf, caplog) -> None:
     default_conf.update({'spaces': 'all'})
 
     hyperopt = Hyperopt(default_conf)
+    hyperopt.trials_file = Path(str(tmpdir), 'ut_trials.sqlite')
     hyperopt.strategy.tickerdata_to_dataframe = MagicMock()
 
     hyperopt.start()
@@ -226,6 +271,402 @@ def test_start_calls_optimizer(mocker, default_conf, caplog) -> None:
 
     assert 'Best result:\nfoo result\nwith values:\n\n' in caplog.text
     assert dumper.called
+    assert [stats['stage'] for stats in hyperopt.timings.summary()] == \
+        ['load data', 'ask', 'evaluate', 'tell']
+    assert 'Time spent:' in caplog.text
+    assert hyperopt.processed_id is not None
+
+
+def test_start_batch_exit_candidates(mocker, default_conf, caplog, tmpdir) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.load_data', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.multiprocessing.cpu_count', MagicMock(return_value=2))
+    parallel = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
+                            MagicMock())
+    parallel_batch = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel_batch',
+        MagicMock(return_value=[{'loss': 1, 'result': 'foo result', 'params': {}}] * 6)
+    )
+    patch_exchange(mocker)
+
+    default_conf.update({'config': 'config.json.example'})
+    default_conf.update({'epochs': 6})
+    default_conf.update({'timerange': None})
+    default_conf.update({'spaces': ['roi', 'stoploss']})
+    default_conf.update({'hyperopt_batch_size': 3})
+
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.trials_file = Path(str(tmpdir), 'ut_trials.sqlite')
+    hyperopt.strategy.tickerdata_to_dataframe = MagicMock()
+
+    hyperopt.start()
+    assert not parallel.called
+    parallel_batch.assert_called_once()
+    assert len(parallel_batch.call_args[0][1]) == 6
+    assert parallel_batch.call_args[0][2] == 2
+    assert hyperopt.trial_store.count(hyperopt.space_id) == 6
+    assert log_has('Evaluating 3 roi / stoploss points per CPU core in one pass ...',
+                   caplog.record_tuples)
+
+
+def test_generate_optimizer_batch(mocker, default_conf) -> None:
+    default_conf.update({'config': 'config.json.example'})
+    default_conf.update({'timerange': None})
+    default_conf.update({'spaces': ['roi', 'stoploss']})
+    mocker.patch.dict('freqtrade.optimize.hyperopt._signal_cache', clear=True)
+    no_trades = pd.DataFrame(columns=['profit_percent', 'profit_abs', 'trade_duration'])
+    exit_candidates = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.backtest_exit_candidates',
+        MagicMock(return_value=[no_trades, no_trades])
+    )
+    get_ticker_arrays = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._get_ticker_arrays',
+                                     MagicMock(return_value={}))
+    mocker.patch(
+        'freqtrade.optimize.hyperopt.get_timeframe',
+        MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
+    )
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.optimize.hyperopt.load', MagicMock())
+
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.processed_id = 'run1'
+    points = [[60, 30, 20, 0.01, 0.01, 0.1, -0.4], [10, 20, 30, 0.02, 0.03, 0.04, -0.1]]
+    f_val = hyperopt.generate_optimizer_batch(points)
+    hyperopt.generate_optimizer_batch(points)
+
+    assert [result['params'] for result in f_val] == [hyperopt.get_args(p) for p in points]
+    assert [result['loss'] for result in f_val] == [MAX_LOSS, MAX_LOSS]
+    assert get_ticker_arrays.call_count == 1
+    args, roi_tables, stoplosses = exit_candidates.call_args[0]
+    assert 'ticker' in args
+    assert roi_tables == [hyperopt.custom_hyperopt.generate_roi_table(hyperopt.get_args(p))
+                          for p in points]
+    assert stoplosses == [-0.4, -0.1]
+
+
+def test_run_cached(hyperopt, caplog) -> None:
+    hyperopt.config['spaces'] = ['roi', 'stoploss']
+    point1 = [60, 30, 20, 0.01, 0.01, 0.1, -0.4]
+    point2 = [10, 20, 30, 0.02, 0.03, 0.04, -0.1]
+    evaluate = MagicMock(side_effect=lambda new: [{'loss': point[-1], 'result': 'foo',
+                                                   'params': hyperopt.get_args(point)}
+                                                  for point in new])
+
+    f_val = hyperopt.run_cached([point1, point2, point1], evaluate)
+    assert [result['loss'] for result in f_val] == [-0.4, -0.1, -0.4]
+    assert [result['result'] for result in f_val] == ['foo', 'foo', 'foo']
+    evaluate.assert_called_once_with([point1, point2])
+    # Only the loss and params are kept, and not pickled along with the instance
+    assert hyperopt.results_cache[hyperopt.params_key(hyperopt.get_args(point1))] == \
+        {'loss': -0.4, 'params': hyperopt.get_args(point1)}
+    assert hyperopt.__getstate__()['results_cache'] == {}
+    assert len(hyperopt.results_cache) == 2
+
+    # numpy values, as asked by skopt, hit the cache as well
+    f_val = hyperopt.run_cached([[np.float64(value) for value in point2]], evaluate)
+    assert [result['loss'] for result in f_val] == [-0.1]
+    assert evaluate.call_count == 1
+    assert len(hyperopt.trials) == 2
+
+    hyperopt.log_cache_stats()
+    assert log_has('Results cache: 2 of 4 points were evaluated before (50.0% hit rate).',
+                   caplog.record_tuples)
+
+
+def test_run_optimizer_parallel_batch(hyperopt, mocker) -> None:
+    batch = mocker.patch.object(hyperopt, 'generate_optimizer_batch',
+                                MagicMock(side_effect=lambda chunk: [{'loss': point[0]}
+                                                                     for point in chunk]))
+
+    def parallel(tasks):
+        return [func(*args, **kwargs) for func, args, kwargs in tasks]
+
+    asked = [[num] for num in range(7)]
+    f_val = hyperopt.run_optimizer_parallel_batch(parallel, asked, 3)
+    # Results in the order of the asked points
+    assert [result['loss'] for result in f_val] == list(range(7))
+    assert [len(call[0][0]) for call in batch.call_args_list] == [3, 3, 1]
+
+
+@pytest.mark.parametrize('spaces,stacking,possible', [
+    (['roi', 'stoploss'], None, True),
+    (['stoploss'], True, True),
+    (['roi', 'stoploss'], False, False),
+    (['buy', 'roi'], None, False),
+    (['all'], None, False),
+])
+def test_exit_candidates_possible(hyperopt, spaces, stacking, possible) -> None:
+    hyperopt.config['spaces'] = spaces
+    if stacking is not None:
+        hyperopt.config['position_stacking'] = stacking
+    assert bool(hyperopt.exit_candidates_possible()) is possible
+
+
+def test_start_halving(mocker, default_conf, caplog, tmpdir) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.load_data', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.multiprocessing.cpu_count', MagicMock(return_value=1))
+    # The first asked points have the lowest loss
+    parallel = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
+        MagicMock(side_effect=lambda parallel, asked, fidelity=1.0: [
+            {'loss': loss, 'result': 'foo result', 'params': {}} for loss in range(len(asked))
+        ])
+    )
+    patch_exchange(mocker)
+
+    default_conf.update({'config': 'config.json.example'})
+    default_conf.update({'epochs': 9})
+    default_conf.update({'timerange': None})
+    default_conf.update({'spaces': 'all'})
+    default_conf.update({'hyperopt_halving_rungs': 3})
+
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.trials_file = Path(str(tmpdir), 'ut_trials.sqlite')
+    hyperopt.strategy.tickerdata_to_dataframe = MagicMock()
+
+    hyperopt.start()
+    assert log_has('Successive halving: backtesting 9 points per step on 1/9 of the timerange, '
+                   'the best 1 of them on the whole timerange ...', caplog.record_tuples)
+    calls = parallel.call_args_list
+    assert [len(call[0][1]) for call in calls] == [9, 3, 1]
+    assert calls[0][0][2] == pytest.approx(1 / 9)
+    assert calls[1][0][2] == pytest.approx(1 / 3)
+    assert len(calls[2][0]) == 2
+    # Promoted are the best points of the previous rung
+    assert calls[1][0][1] == calls[0][0][1][:3]
+    assert calls[2][0][1] == calls[0][0][1][:1]
+    # Only backtests of the whole timerange are stored
+    assert hyperopt.trial_store.count(hyperopt.space_id) == 1
+
+
+def test_get_backtest_args_fidelity(mocker, hyperopt) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt.load_processed', MagicMock(return_value={}))
+    mocker.patch(
+        'freqtrade.optimize.hyperopt.get_timeframe',
+        MagicMock(return_value=(datetime(2017, 12, 1), datetime(2017, 12, 10)))
+    )
+    backtest_args = hyperopt._get_backtest_args(1 / 3)
+    assert backtest_args['start_date'] == datetime(2017, 12, 1)
+    assert backtest_args['end_date'] == datetime(2017, 12, 4)
+    assert hyperopt.max_date == datetime(2017, 12, 4)
+
+    assert hyperopt._get_backtest_args()['end_date'] == datetime(2017, 12, 10)
+
+
+@pytest.mark.skipif(not uses_fork_start_method(),
+                    reason='workers are forked')
+def test_run_optimizer_distributed(mocker, default_conf, tmpdir) -> None:
+    default_conf.update({'spaces': ['roi', 'stoploss']})
+    # Patched before forking, so the workers use the mocks as well
+    mocker.patch('freqtrade.optimize.hyperopt.DISTRIBUTED_POLL_INTERVAL', 0.01)
+    mocker.patch('freqtrade.optimize.hyperopt.DISTRIBUTED_IDLE_TIMEOUT', 2)
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+                 MagicMock(side_effect=lambda point: {'loss': point[-1], 'result': 'foo',
+                                                      'params': {'stoploss': point[-1]}}))
+    patch_exchange(mocker)
+    coordinator = Hyperopt(default_conf)
+    coordinator.total_tries = 6
+    trial_store = create_trial_store(coordinator, tmpdir)
+    worker = Hyperopt(default_conf)
+    create_trial_store(worker, tmpdir)
+
+    # Several worker processes on a single host, attached to the same store
+    workers = multiprocessing.get_context('fork').Process(target=worker.run_workers, args=(2, ))
+    workers.start()
+    try:
+        opt = coordinator.get_optimizer(1)
+        coordinator.run_optimizer_distributed(opt, 2)
+    finally:
+        workers.join(30)
+
+    assert workers.exitcode == 0
+    assert len(opt.yi) == 6
+    # Results are stored by the workers
+    stored = trial_store.trials(coordinator.space_id)
+    assert len(stored) == 6
+    assert sorted(opt.yi) == sorted(trial['loss'] for trial in stored)
+    assert len(coordinator.results_cache) == 6
+
+
+def test_start_worker(mocker, default_conf, tmpdir) -> None:
+    dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.load_data', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.multiprocessing.cpu_count', MagicMock(return_value=3))
+    mocker.patch.dict('freqtrade.optimize.hyperopt._processed_cache', clear=True)
+    run_workers = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.run_workers', MagicMock())
+    get_optimizer = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.get_optimizer',
+                                 MagicMock())
+    patch_exchange(mocker)
+
+    default_conf.update({'config': 'config.json.example'})
+    default_conf.update({'timerange': None})
+    default_conf.update({'spaces': 'all'})
+    default_conf.update({'hyperopt_worker': True})
+    default_conf.update({'hyperopt_trials_file': str(Path(str(tmpdir), 'ut_trials.sqlite'))})
+
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.strategy.tickerdata_to_dataframe = MagicMock(return_value={'UNITTEST/BTC': None})
+
+    hyperopt.start()
+    run_workers.assert_called_once_with(3)
+    assert not get_optimizer.called
+    # Processed data is inherited by the forked workers instead of dumped to a shared file
+    assert not dumper.called
+    assert load_processed(hyperopt.processed_id) == {'UNITTEST/BTC': None}
+    assert hyperopt.trial_store.filename == Path(str(tmpdir), 'ut_trials.sqlite')
+
+
+def test_start_async_scheduler(mocker, default_conf, caplog, tmpdir) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.load_data', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt.multiprocessing.cpu_count', MagicMock(return_value=2))
+    parallel = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
+                            MagicMock())
+    # Patched before forking, so the workers use the mock as well
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+                 MagicMock(return_value={'loss': 1, 'result': 'foo result', 'params': {}}))
+    patch_exchange(mocker)
+
+    default_conf.update({'config': 'config.json.example'})
+    default_conf.update({'epochs': 5})
+    default_conf.update({'timerange': None})
+    default_conf.update({'spaces': 'all'})
+    default_conf.update({'hyperopt_scheduler': 'async'})
+
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.trials_file = Path(str(tmpdir), 'ut_trials.sqlite')
+    hyperopt.strategy.tickerdata_to_dataframe = MagicMock()
+
+    hyperopt.start()
+    assert not parallel.called
+    # Exactly --epochs evaluations, not a multiple of the cpu count
+    assert hyperopt.trial_store.count(hyperopt.space_id) == 5
+    assert 'Best result:\nfoo result\nwith values:\n\n' in caplog.text
+
+
+def test_trim_history(hyperopt) -> None:
+    opt = Optimizer([Real(0, 1)], base_estimator='ET', n_initial_points=2)
+    points = [[0.1], [0.2], [0.3], [0.4], [0.5], [0.6]]
+    opt.tell(points, [5, 1, 4, 2, 6, 3])
+
+    hyperopt.trim_history(opt)
+    assert len(opt.yi) == 6
+
+    hyperopt.config['hyperopt_optimizer_history'] = 4
+    hyperopt.trim_history(opt)
+    # The best two points and the two most recent ones
+    assert opt.Xi == [[0.2], [0.4], [0.5], [0.6]]
+    assert opt.yi == [1, 2, 6, 3]
+    assert len(opt.models) == 1
+
+    hyperopt.tell(opt, [0.7], 0)
+    assert opt.yi == [1, 2, 6, 3, 0]
+
+
+def test_log_timings(hyperopt, caplog) -> None:
+    hyperopt.log_timings()
+    assert caplog.record_tuples == []
+
+    # Samples which dropped out of the window count as well
+    hyperopt.timings = ProcessTimings(window=1)
+    hyperopt.timings.record('ask', 2.0)
+    hyperopt.timings.record('evaluate', 1.5)
+    hyperopt.timings.record('tell', 0.5)
+    hyperopt.timings.record('tell', 0.5)
+    hyperopt.log_timings()
+    assert '      tell:       1.00 s in      2 calls,      500.0 ms per call' in caplog.text
+    assert log_has('Asking and telling the optimizer took longer than evaluating the points '
+                   '(3.0 s vs 1.5 s). Consider limiting its history with --optimizer-history.',
+                   caplog.record_tuples)
+
+
+def test_ask_pending() -> None:
+    opt = Optimizer([Real(0, 1)], base_estimator='ET', n_initial_points=2)
+    opt.tell([[0.1], [0.9]], [1, 0])
+    point = opt.ask()
+
+    assert Hyperopt.ask_pending(opt, []) == point
+    assert Hyperopt.ask_pending(opt, [point]) != point
+    # The pending point is only told to a copy
+    assert len(opt.yi) == 2
+
+
+def test_load_processed(mocker) -> None:
+    loader = mocker.patch('freqtrade.optimize.hyperopt.load', MagicMock(return_value={'a': 1}))
+    mocker.patch.dict('freqtrade.optimize.hyperopt._processed_cache', clear=True)
+
+    # Loaded once per run id
+    assert load_processed('run1') == {'a': 1}
+    assert load_processed('run1') == {'a': 1}
+    assert loader.call_count == 1
+    assert loader.call_args[0][0] == TICKERDATA_PICKLE
+
+    # A new dump gets a new run id
+    loader.return_value = {'b': 2}
+    assert load_processed('run2') == {'b': 2}
+    assert loader.call_count == 2
+
+    # No run id - always loaded from disk
+    load_processed(None)
+    load_processed(None)
+    assert loader.call_count == 4
+
+
+def test_load_signals(mocker) -> None:
+    mocker.patch.dict('freqtrade.optimize.hyperopt._signal_cache', clear=True)
+    populate = MagicMock(return_value={'a': 1})
+
+    assert load_signals('run1', populate) == {'a': 1}
+    assert load_signals('run1', populate) == {'a': 1}
+    assert populate.call_count == 1
+
+    load_signals('run2', populate)
+    assert populate.call_count == 2
+
+    load_signals(None, populate)
+    load_signals(None, populate)
+    assert populate.call_count == 4
+
+    # Formats are cached separately
+    load_signals('run3', populate)
+    load_signals('run3', populate, kind='arrays')
+    load_signals('run3', populate, kind='arrays')
+    assert populate.call_count == 6
+
+
+@pytest.mark.parametrize('spaces,reused', [
+    (['roi', 'stoploss'], True),
+    (['buy', 'roi'], False),
+    (['all'], False),
+])
+def test_generate_optimizer_reuses_signals(mocker, default_conf, spaces, reused) -> None:
+    default_conf.update({'config': 'config.json.example'})
+    default_conf.update({'timerange': None})
+    default_conf.update({'spaces': spaces})
+    mocker.patch.dict('freqtrade.optimize.hyperopt._signal_cache', clear=True)
+    backtest = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.backtest',
+                            MagicMock(return_value=pd.DataFrame(
+                                columns=['profit_percent', 'profit_abs', 'trade_duration'])))
+    get_ticker = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.get_ticker',
+                              MagicMock(return_value={'UNITTEST/BTC': []}))
+    mocker.patch(
+        'freqtrade.optimize.hyperopt.get_timeframe',
+        MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
+    )
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.optimize.hyperopt.load', MagicMock())
+
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.processed_id = 'run1'
+    point = [dim.low if hasattr(dim, 'low') else dim.categories[0]
+             for dim in hyperopt.hyperopt_space()]
+    hyperopt.generate_optimizer(point)
+    hyperopt.generate_optimizer(point)
+
+    assert get_ticker.call_count == (1 if reused else 0)
+    assert backtest.call_count == 2
+    assert ('ticker' in backtest.call_args[0][0]) is reused
 
 
 def test_format_results(hyperopt):
@@ -0,0 +1,117 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pandas import read_pickle
+from pandas.testing import assert_frame_equal
+
+from freqtrade.optimize.indicator_cache import (IndicatorCache, class_attributes,
+                                                data_fingerprint, strategy_hash)
+from freqtrade.strategy.default_strategy import DefaultStrategy
+from freqtrade.tests.conftest import log_has
+
+
+class InheritingStrategy(DefaultStrategy):
+    minimal_roi = {"0": 0.5}
+
+
+class OverridingStrategy(DefaultStrategy):
+
+    def populate_indicators(self, dataframe, metadata):
+        dataframe['sma'] = dataframe['close'].rolling(3).mean()
+        return dataframe
+
+
+def test_strategy_hash(default_conf) -> None:
+    default_hash = strategy_hash(DefaultStrategy(default_conf))
+    assert default_hash == strategy_hash(DefaultStrategy(default_conf))
+    assert default_hash != strategy_hash(InheritingStrategy(default_conf))
+    assert default_hash != strategy_hash(OverridingStrategy(default_conf))
+
+    # Class attributes populate_indicators() may read are part of the hash
+    inheriting_hash = strategy_hash(InheritingStrategy(default_conf))
+    changed_strategy = type('InheritingStrategy', (DefaultStrategy, ), {'minimal_roi': {"0": 1}})
+    assert inheriting_hash != strategy_hash(changed_strategy(default_conf))
+
+
+def test_class_attributes() -> None:
+    attributes = dict(class_attributes(InheritingStrategy))
+    assert attributes['minimal_roi'] == {"0": 0.5}
+    assert attributes['ticker_interval'] == DefaultStrategy.ticker_interval
+    assert 'populate_indicators' not in attributes
+    # Defaults of IStrategy itself are the same for all strategies
+    assert 'process_only_new_candles' not in attributes
+
+
+def test_data_fingerprint(ticker_history) -> None:
+    fingerprint = data_fingerprint(ticker_history)
+    populated = ticker_history.copy()
+    populated['rsi'] = 50
+    assert data_fingerprint(populated) == fingerprint
+
+    changed = ticker_history.copy()
+    changed.loc[0, 'close'] = changed.loc[0, 'close'] * 2
+    assert data_fingerprint(changed) != fingerprint
+
+
+def test_indicator_cache(default_conf, ticker_history, tmpdir, caplog, mocker) -> None:
+    cache_dir = Path(str(tmpdir)) / 'cache'
+    strategy = OverridingStrategy(default_conf)
+    strategy.populate_indicators = MagicMock(side_effect=strategy.populate_indicators)
+    tickerdata = {'UNITTEST/BTC': ticker_history}
+    raw_columns = list(ticker_history.columns)
+
+    cache = IndicatorCache(cache_dir)
+    result = cache.tickerdata_to_dataframe(strategy, tickerdata)
+    assert strategy.populate_indicators.call_count == 1
+    assert 'sma' in result['UNITTEST/BTC']
+    # Input data is not modified
+    assert list(ticker_history.columns) == raw_columns
+    assert len(list(cache_dir.glob('UNITTEST_BTC-5m-*.pkl'))) == 1
+    assert log_has('Indicator cache: 0 hits, 1 misses', caplog.record_tuples)
+
+    # Strategies sharing populate_indicators use the in-memory result
+    result['UNITTEST/BTC']['buy'] = 1
+    again = cache.tickerdata_to_dataframe(strategy, tickerdata)
+    assert strategy.populate_indicators.call_count == 1
+    assert 'buy' not in again['UNITTEST/BTC']
+    assert cache.hits == 1
+
+    # Released dataframes are read from the file again
+    cache.release(strategy)
+    assert cache._frames == {}
+    read_mock = mocker.patch('freqtrade.optimize.indicator_cache.read_pickle',
+                             MagicMock(wraps=read_pickle))
+    released = cache.tickerdata_to_dataframe(strategy, tickerdata)
+    assert read_mock.call_count == 1
+    assert strategy.populate_indicators.call_count == 1
+    assert cache.hits == 2
+    assert_frame_equal(released['UNITTEST/BTC'], again['UNITTEST/BTC'])
+
+    # A new run loads the file
+    cache = IndicatorCache(cache_dir)
+    loaded = cache.tickerdata_to_dataframe(strategy, tickerdata)
+    assert strategy.populate_indicators.call_count == 1
+    assert cache.hits == 1
+    assert_frame_equal(loaded['UNITTEST/BTC'], again['UNITTEST/BTC'])
+
+    # Changed data is recalculated
+    changed = ticker_history.copy()
+    changed.loc[0, 'close'] = changed.loc[0, 'close'] * 2
+    cache.tickerdata_to_dataframe(strategy, {'UNITTEST/BTC': changed})
+    assert strategy.populate_indicators.call_count == 2
+    assert len(list(cache_dir.glob('UNITTEST_BTC-5m-*.pkl'))) == 2
+
+
+def test_indicator_cache_corrupt_file(default_conf, ticker_history, tmpdir, caplog) -> None:
+    cache_dir = Path(str(tmpdir))
+    strategy = OverridingStrategy(default_conf)
+    cache = IndicatorCache(cache_dir)
+    cache_file = cache.cache_file(strategy, 'UNITTEST/BTC', ticker_history)
+    cache_file.write_text('no pickle')
+
+    result = cache.advise_indicators(strategy, ticker_history, 'UNITTEST/BTC')
+    assert 'sma' in result
+    assert cache.misses == 1
+    assert any('Could not read indicator cache' in message
+               for _, _, message in caplog.record_tuples)
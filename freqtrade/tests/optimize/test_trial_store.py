@@ -0,0 +1,66 @@
+# pragma pylint: disable=missing-docstring,W0212,C0103
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+from freqtrade.optimize.trial_store import TrialStore
+
+
+def test_trial_store_append(tmpdir) -> None:
+    trial_store = TrialStore(Path(str(tmpdir), 'trials.sqlite'))
+    trial_store.append([
+        {'loss': 2.0, 'result': 'first', 'params': {'stoploss': np.float64(-0.1)}},
+        {'loss': 1.0, 'result': 'second', 'params': {'roi_t1': np.int64(10)}},
+        {'loss': None, 'result': 'failed', 'params': {}},
+    ], 'space1')
+    trial_store.append([{'loss': 0.5, 'result': 'other', 'params': {}}], 'space2')
+
+    assert trial_store.count() == 4
+    assert trial_store.count('space1') == 3
+    assert [trial['result'] for trial in trial_store.trials('space1')] == \
+        ['first', 'second', 'failed']
+    assert trial_store.trials('space1')[1]['params'] == {'roi_t1': 10}
+    assert trial_store.best('space1') == [{'loss': 1.0, 'result': 'second',
+                                           'params': {'roi_t1': 10}}]
+    assert [trial['loss'] for trial in trial_store.best('space1', limit=5)] == [1.0, 2.0]
+    assert trial_store.best('unknown') == []
+
+
+def test_trial_store_shared(tmpdir) -> None:
+    filename = Path(str(tmpdir), 'user_data', 'trials.sqlite')
+    trial_store = TrialStore(filename)
+    # A copy, like the one of a joblib worker, writes to the same file
+    pickle.loads(pickle.dumps(trial_store)).append(
+        [{'loss': 1.0, 'result': 'foo', 'params': {}}], 'space')
+    # Reopening the file keeps the trials
+    assert TrialStore(filename).count('space') == 1
+
+
+def test_trial_store_queue(tmpdir) -> None:
+    trial_store = TrialStore(Path(str(tmpdir), 'trials.sqlite'))
+    queue_ids = trial_store.enqueue([[1, 0.1], [2, 0.2], [3, 0.3]], 'space', 'run1')
+    assert trial_store.queued('run1') == 3
+
+    # Points are only claimed by workers of the same search space, oldest first
+    assert trial_store.claim('other', 'worker1') is None
+    queue_id, point = trial_store.claim('space', 'worker1')
+    assert (queue_id, point) == (queue_ids[0], [1, 0.1])
+    assert trial_store.queued('run1') == 2
+    assert trial_store.finished(queue_ids) == {}
+
+    trial_store.complete(queue_id, {'loss': 1.0, 'result': 'foo', 'params': {'x': 1}}, 'space')
+    assert trial_store.finished(queue_ids) == {
+        queue_id: {'loss': 1.0, 'result': 'foo', 'params': {'x': 1}}
+    }
+    assert trial_store.count('space') == 1
+
+    # A worker dies while evaluating its point
+    assert trial_store.claim('space', 'worker2')[0] == queue_ids[1]
+    assert trial_store.requeue_stale('run1', 3600) == 0
+    assert trial_store.requeue_stale('run1', -1) == 1
+    assert trial_store.queued('run1') == 2
+
+    trial_store.cancel('run1')
+    assert trial_store.queued('run1') == 0
+    assert trial_store.claim('space', 'worker1') is None
@@ -1,7 +1,7 @@
 # pragma pylint: disable=missing-docstring, C0103
 # pragma pylint: disable=invalid-sequence-index, invalid-name, too-many-arguments
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import ANY, MagicMock, PropertyMock
 
 import pytest
@@ -10,7 +10,7 @@ from numpy import isnan
 from freqtrade import DependencyException, TemporaryError
 from freqtrade.edge import PairInfo
 from freqtrade.freqtradebot import FreqtradeBot
-from freqtrade.persistence import Trade
+from freqtrade.persistence import Trade, archive_closed_trades, init
 from freqtrade.rpc import RPC, RPCException
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
 from freqtrade.state import State
@@ -176,6 +176,31 @@ def test_rpc_daily_profit(default_conf, update, ticker, fee,
         rpc._rpc_daily_profit(0, stake_currency, fiat_display_currency)
 
 
+@pytest.mark.parametrize('archive', [False, True])
+def test_rpc_daily_profit_grouped(default_conf, archive) -> None:
+    init(default_conf)
+    now = datetime.utcnow()
+    # Trades closed today, two days ago and outside of the timescale
+    for days_ago, close_rate in [(0, 0.2), (0, 0.3), (2, 0.05), (10, 0.2)]:
+        Trade.session.add(Trade(pair='ETH/BTC', stake_amount=0.01, amount=0.1, fee_open=0.0,
+                                fee_close=0.0, open_rate=0.1, close_rate=close_rate,
+                                exchange='bittrex', is_open=False,
+                                open_date=now - timedelta(days=days_ago + 1),
+                                close_date=now - timedelta(days=days_ago)))
+    # Open trades are not counted
+    Trade.session.add(Trade(pair='ETH/BTC', stake_amount=0.01, amount=0.1, fee_open=0.0,
+                            fee_close=0.0, open_rate=0.1, exchange='bittrex', is_open=True))
+    if archive:
+        # Days of archived trades are read from their rollups
+        assert archive_closed_trades(now - timedelta(days=1)) == 2
+
+    rpc = RPC(MagicMock())
+    days = rpc._rpc_daily_profit(3, 'BTC', 'USD')
+    assert [day[0] for day in days] == [now.date() - timedelta(days=day) for day in range(3)]
+    assert [day[1] for day in days] == ['0.03000000 BTC', '0.00000000 BTC', '-0.00500000 BTC']
+    assert [day[3] for day in days] == ['2 trades', '0 trade', '1 trade']
+
+
 def test_rpc_trade_statistics(default_conf, ticker, ticker_sell_up, fee,
                               limit_buy_order, limit_sell_order, markets, mocker) -> None:
     mocker.patch.multiple(
@@ -718,6 +743,22 @@ def test_rpc_edge_disabled(mocker, default_conf) -> None:
         rpc._rpc_edge()
 
 
+def test_rpc_perf(mocker, default_conf) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.rpc.telegram.Telegram', MagicMock())
+    freqtradebot = FreqtradeBot(default_conf)
+    rpc = RPC(freqtradebot)
+    with pytest.raises(RPCException, match=r'no process iteration recorded yet'):
+        rpc._rpc_perf()
+
+    with freqtradebot.timings.iteration():
+        with freqtradebot.timings.stage('sell'):
+            pass
+    ret = rpc._rpc_perf()
+    assert [stats['stage'] for stats in ret] == ['sell', 'total']
+    assert ret[1]['count'] == 1
+
+
 def test_rpc_edge_enabled(mocker, edge_conf) -> None:
     patch_exchange(mocker)
     mocker.patch('freqtrade.rpc.telegram.Telegram', MagicMock())
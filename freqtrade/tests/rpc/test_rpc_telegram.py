@@ -75,7 +75,8 @@ def test_init(default_conf, mocker, caplog) -> None:
     message_str = "rpc.telegram is listening for following commands: [['status'], ['profit'], " \
                   "['balance'], ['start'], ['stop'], ['forcesell'], ['forcebuy'], " \
                   "['performance'], ['daily'], ['count'], ['reload_conf'], " \
-                  "['stopbuy'], ['whitelist'], ['blacklist'], ['edge'], ['help'], ['version']]"
+                  "['stopbuy'], ['whitelist'], ['blacklist'], ['edge'], ['perf'], ['help'], " \
+                  "['version']]"
 
     assert log_has(message_str, caplog.record_tuples)
 
@@ -1167,6 +1168,43 @@ def test_edge_enabled(edge_conf, update, mocker) -> None:
     assert 'Pair      Winrate    Expectancy    Stoploss' in msg_mock.call_args_list[0][0][0]
 
 
+def test_perf_handle(default_conf, update, mocker) -> None:
+    msg_mock = MagicMock()
+    mocker.patch.multiple(
+        'freqtrade.rpc.telegram.Telegram',
+        _init=MagicMock(),
+        _send_msg=msg_mock
+    )
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf)
+    telegram = Telegram(freqtradebot)
+
+    telegram._perf(bot=MagicMock(), update=update)
+    assert msg_mock.call_count == 1
+    assert 'no process iteration recorded yet' in msg_mock.call_args_list[0][0][0]
+
+    msg_mock.reset_mock()
+    freqtradebot.timings.record('refresh_data', 0.25)
+    freqtradebot.timings.record('total', 0.3)
+    freqtradebot.timings.iterations = 1
+    telegram._perf(bot=MagicMock(), update=update)
+    assert msg_mock.call_count == 1
+    assert '<b>Process timings (ms):</b>\n<pre>' in msg_mock.call_args_list[0][0][0]
+    assert 'Stage' in msg_mock.call_args_list[0][0][0]
+    assert '250' in msg_mock.call_args_list[0][0][0]
+
+
+def test_send_msg_perf_notification(default_conf, mocker) -> None:
+    msg_mock = MagicMock()
+    mocker.patch.multiple(
+        'freqtrade.rpc.telegram.Telegram',
+        _init=MagicMock(),
+        _send_msg=msg_mock
+    )
+    telegram = Telegram(get_patched_freqtradebot(mocker, default_conf))
+    telegram.send_msg({'type': RPCMessageType.PERF_NOTIFICATION, 'iterations': 10})
+    assert msg_mock.call_count == 0
+
+
 def test_help_handle(default_conf, update, mocker) -> None:
     msg_mock = MagicMock()
     mocker.patch.multiple(
@@ -29,6 +29,11 @@ def get_webhook_dict() -> dict:
               "value1": "Status: {status}",
               "value2": "",
               "value3": ""
+          },
+          "webhookperf": {
+              "value1": "Iterations: {iterations}",
+              "value2": "total p90: {total_p90:.3f}",
+              "value3": ""
           }
       }
 
@@ -106,6 +111,19 @@ def test_send_msg(default_conf, mocker):
     assert (msg_mock.call_args[0][0]["value3"] ==
             default_conf["webhook"]["webhookstatus"]["value3"].format(**msg))
 
+    # Test process timings
+    msg = {
+        'type': RPCMessageType.PERF_NOTIFICATION,
+        'iterations': 20,
+        'total_p90': 1.23456,
+    }
+    msg_mock = MagicMock()
+    mocker.patch("freqtrade.rpc.webhook.Webhook._send_msg", msg_mock)
+    webhook.send_msg(msg)
+    assert msg_mock.call_count == 1
+    assert msg_mock.call_args[0][0]["value1"] == "Iterations: 20"
+    assert msg_mock.call_args[0][0]["value2"] == "total p90: 1.235"
+
 
 def test_exception_send_msg(default_conf, mocker, caplog):
     default_conf["webhook"] = get_webhook_dict()
@@ -4,7 +4,9 @@ import logging
 from unittest.mock import MagicMock
 
 import arrow
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, date_range
+from pandas.testing import assert_frame_equal
 
 from freqtrade.arguments import TimeRange
 from freqtrade.data.converter import parse_ticker_dataframe
@@ -259,3 +261,78 @@ def test_analyze_ticker_skip_analyze(ticker_history, mocker, caplog) -> None:
     assert not log_has('TA Analysis Launched', caplog.record_tuples)
     assert log_has('Skipping TA Analysis for already analyzed candle',
                    caplog.record_tuples)
+
+
+def _sma_strategy(incremental: bool) -> DefaultStrategy:
+    strategy = DefaultStrategy({})
+    strategy.incremental_analysis = incremental
+    strategy.startup_candle_count = 4
+    strategy.analyzed_lengths = []
+
+    def advise_indicators(dataframe, metadata):
+        strategy.analyzed_lengths.append(len(dataframe))
+        dataframe['sma'] = dataframe['close'].rolling(5).mean()
+        return dataframe
+
+    strategy.advise_indicators = advise_indicators
+    strategy.advise_buy = lambda df, m: df.assign(buy=(df['close'] > df['sma']).astype(int))
+    strategy.advise_sell = lambda df, m: df.assign(sell=(df['close'] < df['sma']).astype(int))
+    return strategy
+
+
+def _random_ticker(length: int) -> DataFrame:
+    rng = np.random.RandomState(12)
+    close = 100 + np.cumsum(rng.normal(size=length))
+    return DataFrame({
+        'date': date_range('2019-01-01', periods=length, freq='5min', tz='UTC'),
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+        'volume': rng.uniform(size=length),
+    })
+
+
+def test_analyze_ticker_incremental(caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    ticker = _random_ticker(200)
+    full = _sma_strategy(incremental=False)
+    incremental = _sma_strategy(incremental=True)
+
+    # Window of 50 candles moving forward by 0, 1 or 3 candles per loop
+    end = 50
+    for step in [0, 1, 1, 3, 0, 1, 3, 3, 1]:
+        end += step
+        window = ticker.iloc[end - 50:end].reset_index(drop=True)
+        expected = full.analyze_ticker(window.copy(), {'pair': 'ETH/BTC'})
+        result = incremental.analyze_ticker(window.copy(), {'pair': 'ETH/BTC'})
+        assert len(result) == 50
+        # The first startup candles differ: incremental analysis still knows older candles
+        assert_frame_equal(result.iloc[4:], expected.iloc[4:])
+
+    assert log_has('Full TA Analysis for pair ETH/BTC', caplog.record_tuples)
+    assert log_has('Incremental TA Analysis for pair ETH/BTC (3 new candles)',
+                   caplog.record_tuples)
+    # First loop analyzes all candles, then only new candles + startup candles
+    assert incremental.analyzed_lengths == [50, 5, 5, 7, 5, 7, 7, 5]
+
+    # Gap in the data - full analysis again
+    caplog.clear()
+    window = ticker.iloc[150:200].reset_index(drop=True)
+    result = incremental.analyze_ticker(window.copy(), {'pair': 'ETH/BTC'})
+    assert_frame_equal(result, full.analyze_ticker(window.copy(), {'pair': 'ETH/BTC'}))
+    assert log_has('Full TA Analysis for pair ETH/BTC', caplog.record_tuples)
+    assert incremental.analyzed_lengths[-1] == 50
+
+    # Other pairs are analyzed independently
+    caplog.clear()
+    incremental.analyze_ticker(window.copy(), {'pair': 'XRP/BTC'})
+    assert log_has('Full TA Analysis for pair XRP/BTC', caplog.record_tuples)
+
+
+def test_analyze_ticker_incremental_longer_dataframe() -> None:
+    ticker = _random_ticker(100)
+    strategy = _sma_strategy(incremental=True)
+    strategy.analyze_ticker(ticker.iloc[50:80].reset_index(drop=True), {'pair': 'ETH/BTC'})
+    # Dataframe starts before the analyzed candles - needs a full analysis
+    result = strategy.analyze_ticker(ticker.iloc[40:81].reset_index(drop=True),
+                                     {'pair': 'ETH/BTC'})
+    assert len(result) == 41
+    assert strategy.analyzed_lengths == [30, 41]
@@ -235,6 +235,26 @@ def test_strategy_override_process_only_new_candles(caplog):
             ) in caplog.record_tuples
 
 
+def test_strategy_incremental_analysis_without_startup_candles(caplog):
+    config = {
+        'strategy': 'DefaultStrategy',
+        'incremental_analysis': True
+    }
+    StrategyResolver(config)
+    assert log_has_re(r'Strategy uses incremental_analysis without startup_candle_count.*',
+                      caplog.record_tuples)
+
+    caplog.clear()
+    config = {
+        'strategy': 'DefaultStrategy',
+        'incremental_analysis': True,
+        'startup_candle_count': 20
+    }
+    StrategyResolver(config)
+    assert not log_has_re(r'Strategy uses incremental_analysis without startup_candle_count.*',
+                          caplog.record_tuples)
+
+
 def test_strategy_override_order_types(caplog):
     caplog.set_level(logging.INFO)
 
@@ -4,7 +4,7 @@ import argparse
 
 import pytest
 
-from freqtrade.arguments import Arguments, TimeRange
+from freqtrade.arguments import Arguments, TimeRange, check_int_positive
 
 
 # Parse common command-line-arguments. Used for all tools
@@ -153,6 +153,68 @@ def test_parse_args_backtesting_custom() -> None:
     assert call_args.refresh_pairs is True
     assert type(call_args.strategy_list) is list
     assert len(call_args.strategy_list) == 2
+    assert call_args.backtest_engine is None
+    assert call_args.indicator_cache is False
+
+
+def test_parse_args_backtest_engine() -> None:
+    args = ['backtesting', '--backtest-engine', 'vectorized']
+    call_args = Arguments(args, '').get_parsed_arg()
+    assert call_args.backtest_engine == 'vectorized'
+
+    args = ['hyperopt', '--backtest-engine', 'vectorized']
+    call_args = Arguments(args, '').get_parsed_arg()
+    assert call_args.backtest_engine == 'vectorized'
+
+    with pytest.raises(SystemExit, match=r'2'):
+        Arguments(['backtesting', '--backtest-engine', 'abc'], '').get_parsed_arg()
+
+
+def test_parse_args_indicator_cache() -> None:
+    call_args = Arguments(['backtesting', '--indicator-cache'], '').get_parsed_arg()
+    assert call_args.indicator_cache is True
+
+
+def test_parse_args_strategy_workers() -> None:
+    call_args = Arguments(['backtesting', '--strategy-workers', '8'], '').get_parsed_arg()
+    assert call_args.strategy_workers == 8
+
+    call_args = Arguments(['backtesting'], '').get_parsed_arg()
+    assert call_args.strategy_workers is None
+
+    with pytest.raises(SystemExit, match=r'2'):
+        Arguments(['backtesting', '--strategy-workers', '0'], '').get_parsed_arg()
+
+
+def test_parse_args_data_load_workers() -> None:
+    for subcommand in ['backtesting', 'hyperopt', 'edge']:
+        call_args = Arguments([subcommand, '--data-load-workers', '4'], '').get_parsed_arg()
+        assert call_args.data_load_workers == 4
+
+    call_args = Arguments(['backtesting'], '').get_parsed_arg()
+    assert call_args.data_load_workers is None
+
+    with pytest.raises(SystemExit, match=r'2'):
+        Arguments(['backtesting', '--data-load-workers', '0'], '').get_parsed_arg()
+
+
+def test_parse_args_ticker_data_cache() -> None:
+    for subcommand in ['backtesting', 'hyperopt', 'edge']:
+        call_args = Arguments([subcommand, '--ticker-data-cache'], '').get_parsed_arg()
+        assert call_args.ticker_data_cache is True
+
+    call_args = Arguments(['backtesting'], '').get_parsed_arg()
+    assert call_args.ticker_data_cache is False
+
+
+def test_check_int_positive() -> None:
+    assert check_int_positive('3') == 3
+    with pytest.raises(argparse.ArgumentTypeError):
+        check_int_positive('0')
+    with pytest.raises(argparse.ArgumentTypeError):
+        check_int_positive('-2')
+    with pytest.raises(argparse.ArgumentTypeError):
+        check_int_positive('3.5')
 
 
 def test_parse_args_hyperopt_custom() -> None:
@@ -169,6 +231,40 @@ def test_parse_args_hyperopt_custom() -> None:
     assert call_args.subparser == 'hyperopt'
     assert call_args.spaces == ['buy']
     assert call_args.func is not None
+    assert call_args.hyperopt_scheduler is None
+
+
+def test_parse_args_hyperopt_scheduler() -> None:
+    call_args = Arguments(['hyperopt', '--scheduler', 'async'], '').get_parsed_arg()
+    assert call_args.hyperopt_scheduler == 'async'
+
+    with pytest.raises(SystemExit, match=r'2'):
+        Arguments(['hyperopt', '--scheduler', 'abc'], '').get_parsed_arg()
+
+
+def test_parse_args_hyperopt_halving_rungs() -> None:
+    call_args = Arguments(['hyperopt', '--halving-rungs', '3'], '').get_parsed_arg()
+    assert call_args.hyperopt_halving_rungs == 3
+
+    with pytest.raises(SystemExit, match=r'2'):
+        Arguments(['hyperopt', '--halving-rungs', '0'], '').get_parsed_arg()
+
+
+def test_parse_args_hyperopt_distributed() -> None:
+    call_args = Arguments(['hyperopt', '--scheduler', 'distributed',
+                           '--trials-file', '/shared/trials.sqlite'], '').get_parsed_arg()
+    assert call_args.hyperopt_scheduler == 'distributed'
+    assert call_args.hyperopt_trials_file == '/shared/trials.sqlite'
+    assert not call_args.hyperopt_worker
+
+    call_args = Arguments(['hyperopt', '--worker'], '').get_parsed_arg()
+    assert call_args.hyperopt_worker
+
+
+def test_parse_args_hyperopt_optimizer_history() -> None:
+    call_args = Arguments(['hyperopt', '--optimizer-history', '500'], '').get_parsed_arg()
+    assert call_args.hyperopt_optimizer_history == 500
+    assert Arguments(['hyperopt'], '').get_parsed_arg().hyperopt_optimizer_history is None
 
 
 def test_testdata_dl_options() -> None:
@@ -382,6 +382,42 @@ def test_setup_configuration_with_arguments(mocker, default_conf, caplog) -> Non
     )
 
 
+def test_setup_configuration_backtest_engine(mocker, default_conf, caplog) -> None:
+    default_conf['backtest_engine'] = 'vectorized'
+    mocker.patch('freqtrade.configuration.open', mocker.mock_open(
+        read_data=json.dumps(default_conf)
+    ))
+
+    args = Arguments(['--config', 'config.json', 'backtesting'], '').get_parsed_arg()
+    config = Configuration(args).get_config()
+    assert config['backtest_engine'] == 'vectorized'
+    assert not log_has('Parameter --backtest-engine detected: vectorized ...',
+                       caplog.record_tuples)
+
+    # The default engine given on the command line overrides the configuration as well
+    args = Arguments(['--config', 'config.json', 'backtesting', '--backtest-engine', 'loop'],
+                     '').get_parsed_arg()
+    config = Configuration(args).get_config()
+    assert config['backtest_engine'] == 'loop'
+    assert log_has('Parameter --backtest-engine detected: loop ...', caplog.record_tuples)
+
+
+def test_setup_configuration_ticker_data_cache(mocker, default_conf, caplog) -> None:
+    mocker.patch('freqtrade.configuration.open', mocker.mock_open(
+        read_data=json.dumps(default_conf)
+    ))
+
+    args = Arguments(['--config', 'config.json', 'backtesting'], '').get_parsed_arg()
+    config = Configuration(args).get_config()
+    assert 'ticker_data_cache' not in config
+
+    args = Arguments(['--config', 'config.json', 'backtesting', '--ticker-data-cache'],
+                     '').get_parsed_arg()
+    config = Configuration(args).get_config()
+    assert config['ticker_data_cache'] is True
+    assert log_has('Parameter --ticker-data-cache detected ...', caplog.record_tuples)
+
+
 def test_setup_configuration_with_stratlist(mocker, default_conf, caplog) -> None:
     """
     Test setup_configuration() function
@@ -464,6 +500,24 @@ def test_hyperopt_with_arguments(mocker, default_conf, caplog) -> None:
     assert config['runmode'] == RunMode.HYPEROPT
 
 
+def test_hyperopt_scheduler_argument(mocker, default_conf, caplog) -> None:
+    default_conf['hyperopt_scheduler'] = 'async'
+    mocker.patch('freqtrade.configuration.open', mocker.mock_open(
+        read_data=json.dumps(default_conf)
+    ))
+
+    args = Arguments(['hyperopt'], '').get_parsed_arg()
+    config = Configuration(args, RunMode.HYPEROPT).get_config()
+    assert config['hyperopt_scheduler'] == 'async'
+    assert not log_has('Parameter --scheduler detected: async ...', caplog.record_tuples)
+
+    # The default scheduler given on the command line overrides the configuration as well
+    args = Arguments(['hyperopt', '--scheduler', 'batch'], '').get_parsed_arg()
+    config = Configuration(args, RunMode.HYPEROPT).get_config()
+    assert config['hyperopt_scheduler'] == 'batch'
+    assert log_has('Parameter --scheduler detected: batch ...', caplog.record_tuples)
+
+
 def test_check_exchange(default_conf, caplog) -> None:
     configuration = Configuration(Namespace())
 
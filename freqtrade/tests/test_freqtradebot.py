@@ -5,6 +5,8 @@ import logging
 import re
 import time
 from copy import deepcopy
+from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
 import arrow
@@ -525,6 +527,45 @@ def test_create_trade(default_conf, ticker, limit_buy_order, fee, markets, mocke
     assert whitelist == default_conf['exchange']['pair_whitelist']
 
 
+@pytest.mark.parametrize('signal_workers', [1, 4])
+def test_create_trade_signal_order(default_conf, ticker, limit_buy_order, fee, markets,
+                                   mocker, signal_workers) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        get_ticker=ticker,
+        buy=MagicMock(return_value={'id': limit_buy_order['id']}),
+        get_fee=fee,
+        markets=PropertyMock(return_value=markets)
+    )
+    default_conf['signal_workers'] = signal_workers
+    freqtrade = FreqtradeBot(default_conf)
+    patch_get_signal(freqtrade)
+
+    analyzed = []
+
+    def get_signal(pair, interval, dataframe):
+        # Pairs later in the whitelist finish their analysis first
+        time.sleep(0.01 * (4 - default_conf['exchange']['pair_whitelist'].index(pair)))
+        analyzed.append(pair)
+        return pair in ('XRP/BTC', 'NEO/BTC'), False
+
+    freqtrade.strategy.get_signal = get_signal
+    assert freqtrade.create_trade()
+
+    # First pair of the whitelist with a buy signal is bought
+    trade = Trade.query.first()
+    assert trade.pair == 'XRP/BTC'
+    if signal_workers > 1:
+        assert sorted(analyzed) == sorted(default_conf['exchange']['pair_whitelist'])
+        assert analyzed[0] == 'NEO/BTC'
+    else:
+        # Serial analysis stops at the first buy signal
+        assert analyzed == ['ETH/BTC', 'LTC/BTC', 'XRP/BTC']
+    freqtrade.cleanup()
+
+
 def test_create_trade_no_stake_amount(default_conf, ticker, limit_buy_order,
                                       fee, markets, mocker) -> None:
     patch_RPCManager(mocker)
@@ -705,6 +746,87 @@ def test_process_trade_creation(default_conf, ticker, limit_buy_order,
     )
 
 
+def test_process_timings(default_conf, ticker, markets, mocker, tmpdir) -> None:
+    rpc_mock = patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        get_ticker=ticker,
+        markets=PropertyMock(return_value=markets),
+    )
+    dump_file = Path(str(tmpdir)) / 'timings.json'
+    default_conf['internals'] = {'perf_report_every': 2, 'perf_dump_file': str(dump_file)}
+    default_conf['unfilledtimeout'] = {'buy': 10, 'sell': 30}
+    freqtrade = FreqtradeBot(default_conf)
+    patch_get_signal(freqtrade, value=(False, False))
+
+    freqtrade.process()
+    assert freqtrade.timings.iterations == 1
+    assert [stats['stage'] for stats in freqtrade.timings.summary()] == [
+        'reload_markets', 'refresh_pairlist', 'refresh_data', 'sell', 'buy', 'check_timedout',
+        'total']
+    assert dump_file.is_file()
+    assert rpc_mock.call_count == 0
+
+    freqtrade.process()
+    assert rpc_mock.call_count == 1
+    msg = rpc_mock.call_args[0][0]
+    assert msg['type'] == RPCMessageType.PERF_NOTIFICATION
+    assert msg['iterations'] == 2
+    assert msg['total_count'] == 2
+    assert 'buy_p90' in msg
+
+
+def test_process_batch_commit(default_conf, ticker, markets, mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        get_ticker=ticker,
+        markets=PropertyMock(return_value=markets),
+    )
+    transaction_mock = mocker.patch('freqtrade.freqtradebot.persistence.transaction')
+    freqtrade = FreqtradeBot(default_conf)
+    patch_get_signal(freqtrade, value=(False, False))
+
+    freqtrade.process()
+    assert transaction_mock.call_count == 0
+
+    default_conf['internals'] = {'db_batch_commit': True}
+    freqtrade = FreqtradeBot(default_conf)
+    patch_get_signal(freqtrade, value=(False, False))
+    freqtrade.process()
+    assert transaction_mock.call_count == 1
+    assert transaction_mock.return_value.__exit__.call_count == 1
+
+
+def test_process_archive(default_conf, ticker, markets, mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        get_ticker=ticker,
+        markets=PropertyMock(return_value=markets),
+    )
+    archive_mock = mocker.patch('freqtrade.freqtradebot.persistence.archive_closed_trades',
+                                return_value=3)
+    default_conf['internals'] = {'archive_after_days': 30}
+    freqtrade = FreqtradeBot(default_conf)
+    patch_get_signal(freqtrade, value=(False, False))
+
+    # Once a day
+    freqtrade.process()
+    freqtrade.process()
+    assert archive_mock.call_count == 1
+    closed_before = archive_mock.call_args[0][0]
+    assert closed_before < datetime.utcnow() - timedelta(days=29)
+    assert 'archive' in [stats['stage'] for stats in freqtrade.timings.summary()]
+
+    freqtrade._next_archive = datetime.utcnow()
+    freqtrade.process()
+    assert archive_mock.call_count == 2
+
+
 def test_process_exchange_failures(default_conf, ticker, markets, mocker) -> None:
     patch_RPCManager(mocker)
     patch_exchange(mocker)
@@ -3105,6 +3227,38 @@ def test_get_sell_rate(default_conf, mocker, ticker, order_book_l2) -> None:
     assert rate == 0.043936
 
 
+def test_get_sell_rates(default_conf, mocker, ticker, tickers) -> None:
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        get_ticker=ticker,
+        get_tickers=tickers,
+    )
+    ft = get_patched_freqtradebot(mocker, default_conf)
+
+    # One request for all tickers, pairs missing there are fetched one by one
+    rates = ft.get_sell_rates(['ETH/BTC', 'LTC/BTC', 'XRP/BTC', 'ETH/BTC'])
+    assert rates == {'ETH/BTC': 0.061588, 'LTC/BTC': 0.015954, 'XRP/BTC': 0.00001098}
+    assert tickers.call_count == 1
+    assert ticker.call_count == 1
+
+    # A single pair does not need all tickers
+    tickers.reset_mock()
+    assert ft.get_sell_rates(['ETH/BTC']) == {'ETH/BTC': 0.00001098}
+    assert tickers.call_count == 0
+
+    # Exchanges without fetch_tickers
+    tickers.side_effect = OperationalException
+    ticker.reset_mock()
+    rates = ft.get_sell_rates(['ETH/BTC', 'LTC/BTC'])
+    assert rates == {'ETH/BTC': 0.00001098, 'LTC/BTC': 0.00001098}
+    assert ticker.call_count == 2
+
+    # Pairs without rate are left out
+    mocker.patch('freqtrade.freqtradebot.FreqtradeBot.get_sell_rate',
+                 side_effect=DependencyException)
+    assert ft.get_sell_rates(['ETH/BTC', 'LTC/BTC']) == {}
+
+
 def test_startup_messages(default_conf, mocker):
     default_conf['pairlist'] = {'method': 'VolumePairList',
                                 'config': {'number_assets': 20}
@@ -5,7 +5,8 @@ from unittest.mock import MagicMock
 
 from freqtrade.data.converter import parse_ticker_dataframe
 from freqtrade.misc import (common_datearray, datesarray_to_datetimearray,
-                            file_dump_json, file_load_json, format_ms_time, shorten_date)
+                            file_dump_json, file_load_json, format_ms_time, shorten_date,
+                            uses_fork_start_method)
 from freqtrade.data.history import load_tickerdata_file, make_testdata_path
 from freqtrade.strategy.default_strategy import DefaultStrategy
 
@@ -81,3 +82,22 @@ def test_format_ms_time() -> None:
     # Date 2017-12-13 08:02:01
     date_in_epoch_ms = 1513152121000
     assert format_ms_time(date_in_epoch_ms) == res.astimezone(None).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def test_uses_fork_start_method(mocker) -> None:
+    get_start_method = mocker.patch('freqtrade.misc.multiprocessing.get_start_method',
+                                    MagicMock(return_value='spawn'))
+    assert not uses_fork_start_method()
+    get_start_method.assert_called_once_with(allow_none=True)
+
+    get_start_method.return_value = 'fork'
+    assert uses_fork_start_method()
+
+    # Without a start method set yet, the platform default is used
+    get_start_method.return_value = None
+    mocker.patch('freqtrade.misc.multiprocessing.get_all_start_methods',
+                 MagicMock(return_value=['spawn', 'fork', 'forkserver']))
+    assert not uses_fork_start_method()
+    mocker.patch('freqtrade.misc.multiprocessing.get_all_start_methods',
+                 MagicMock(return_value=['fork', 'spawn', 'forkserver']))
+    assert uses_fork_start_method()
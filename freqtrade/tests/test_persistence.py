@@ -1,12 +1,14 @@
 # pragma pylint: disable=missing-docstring, C0103
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 import logging
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 
 from freqtrade import OperationalException, constants
-from freqtrade.persistence import Trade, clean_dry_run_db, init
+from freqtrade.persistence import (ArchivedTrade, Trade, TradeRollup, _stats_cache,
+                                   archive_closed_trades, clean_dry_run_db, init, transaction)
 from freqtrade.tests.conftest import log_has
 
 
@@ -309,6 +311,230 @@ def test_calc_profit(limit_buy_order, limit_sell_order, fee):
     assert trade.calc_profit(fee=0.003) == 0.00006163
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_profit_expression(limit_buy_order, limit_sell_order, fee):
+    trade = Trade(
+        pair='ETH/BTC',
+        stake_amount=0.001,
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        exchange='bittrex',
+    )
+    trade.open_order_id = 'profit_expression'
+    trade.update(limit_buy_order)
+    trade.update(limit_sell_order)
+    Trade.session.add(trade)
+
+    profit = Trade.query.with_entities(Trade.profit_expression()).scalar()
+    assert profit == trade.calc_profit() == 0.00006217
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_closed_stats(limit_buy_order, limit_sell_order, fee):
+    assert Trade.get_performance() == []
+    stats = Trade.get_closed_stats()
+    assert stats['trade_count'] == 0
+    assert stats['closed_count'] == 0
+    assert stats['first_open_date'] is None
+
+    trade = Trade(
+        pair='ETH/BTC',
+        stake_amount=0.001,
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        exchange='bittrex',
+    )
+    trade.open_order_id = 'closed_stats'
+    Trade.session.add(trade)
+    trade.update(limit_buy_order)
+    # Opening a trade invalidates the cached statistics
+    assert _stats_cache == {}
+    stats = Trade.get_closed_stats()
+    assert stats['trade_count'] == 1
+    assert stats['closed_count'] == 0
+    assert stats['first_open_date'] == stats['latest_open_date'] == trade.open_date
+
+    # Memoised until the trade is closed
+    assert Trade.get_closed_stats() is stats
+    trade.update(limit_sell_order)
+    assert _stats_cache == {}
+
+    stats = Trade.get_closed_stats()
+    assert stats['closed_count'] == 1
+    assert stats['profit_sum'] == trade.calc_profit()
+    assert stats['profit_percent_sum'] == trade.calc_profit_percent()
+    assert stats['duration_count'] == 1
+    assert round(stats['duration_sum']) == round(
+        (trade.close_date - trade.open_date).total_seconds())
+    assert Trade.get_performance() == [('ETH/BTC', trade.close_profit, 1)]
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_closed_stats_transaction(fee):
+    assert Trade.get_closed_stats()['trade_count'] == 0
+    assert Trade.get_closed_stats() is _stats_cache['closed']
+
+    # Statistics computed from changes which are rolled back are not kept
+    Trade.session.begin()
+    Trade.session.add(Trade(pair='ETH/BTC', stake_amount=0.001, amount=123.0,
+                            fee_open=fee.return_value, fee_close=fee.return_value,
+                            open_rate=0.123, exchange='bittrex'))
+    assert Trade.get_closed_stats()['trade_count'] == 1
+    Trade.session.rollback()
+    assert _stats_cache == {}
+    assert Trade.get_closed_stats()['trade_count'] == 0
+
+    # Nor statistics computed before a commit
+    with transaction():
+        assert Trade.get_closed_stats()['trade_count'] == 0
+    assert _stats_cache == {}
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_archive_closed_trades(fee):
+    now = datetime.utcnow()
+    for pair, days_ago, close_rate in [('ETH/BTC', 3, 0.2), ('ETH/BTC', 3, 0.05),
+                                       ('ETC/BTC', 2, 0.12), ('ETC/BTC', 0, 0.15)]:
+        Trade.session.add(Trade(pair=pair, stake_amount=0.01, amount=0.1,
+                                fee_open=fee.return_value, fee_close=fee.return_value,
+                                open_rate=0.1, close_rate=close_rate,
+                                close_profit=close_rate / 0.1 - 1, exchange='bittrex',
+                                is_open=False, open_date=now - timedelta(days=days_ago + 1),
+                                close_date=now - timedelta(days=days_ago)))
+    Trade.session.add(Trade(pair='ETH/BTC', stake_amount=0.01, amount=0.1, fee_open=0.0,
+                            fee_close=0.0, open_rate=0.1, exchange='bittrex', is_open=True,
+                            open_date=now - timedelta(days=10)))
+    stats = Trade.get_closed_stats()
+    performance = Trade.get_performance()
+    archived_trades = Trade.query.filter(Trade.close_date < now - timedelta(days=1)).all()
+
+    assert archive_closed_trades(now - timedelta(days=5)) == 0
+    assert archive_closed_trades(now - timedelta(days=1)) == 3
+    assert Trade.query.count() == 2
+    assert Trade.session.query(ArchivedTrade).count() == 3
+    assert {(rollup.pair, rollup.trade_count) for rollup
+            in Trade.session.query(TradeRollup)} == {('ETH/BTC', 2), ('ETC/BTC', 1)}
+
+    assert sorted(archived.calc_profit() for archived in Trade.session.query(ArchivedTrade)) \
+        == sorted(trade.calc_profit() for trade in archived_trades)
+
+    # Archived trades are still part of the statistics
+    assert _stats_cache == {}
+    archived_stats = Trade.get_closed_stats()
+    assert archived_stats.keys() == stats.keys()
+    for key in stats:
+        if isinstance(stats[key], float):
+            assert archived_stats[key] == pytest.approx(stats[key])
+        else:
+            assert archived_stats[key] == stats[key]
+    assert [(pair, round(profit, 8), count) for pair, profit, count
+            in Trade.get_performance()] == [(pair, round(profit, 8), count)
+                                            for pair, profit, count in performance]
+
+    # Trades closed on an already archived day are added to its rollup
+    trade = Trade.query.filter(Trade.is_open.is_(False)).one()
+    trade.close_date = now - timedelta(days=2)
+    assert archive_closed_trades(now) == 1
+    assert Trade.session.query(TradeRollup).get(
+        ((now - timedelta(days=2)).date(), 'ETC/BTC')).trade_count == 2
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_archive_closed_trades_reused_id(fee):
+    now = datetime.utcnow()
+
+    def add_closed_trade(**kwargs):
+        trade = Trade(pair='ETH/BTC', stake_amount=0.01, amount=0.1,
+                      fee_open=fee.return_value, fee_close=fee.return_value,
+                      open_rate=0.1, close_rate=0.12, close_profit=0.2, exchange='bittrex',
+                      is_open=False, open_date=now - timedelta(days=3),
+                      close_date=now - timedelta(days=2), **kwargs)
+        Trade.session.add(trade)
+        Trade.session.flush()
+        return trade
+
+    first_id = add_closed_trade().id
+    assert archive_closed_trades(now) == 1
+    assert add_closed_trade().id > first_id
+    archive_closed_trades(now)
+
+    # As sqlite does in trades tables created without AUTOINCREMENT
+    add_closed_trade(id=first_id)
+    assert archive_closed_trades(now) == 1
+
+    assert Trade.query.count() == 0
+    assert [archived.trade_id for archived
+            in Trade.session.query(ArchivedTrade)] == [first_id, first_id + 1, first_id]
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_archive_closed_trades_error(mocker, fee):
+    now = datetime.utcnow()
+    for pair in ('ETH/BTC', 'ETC/BTC'):
+        Trade.session.add(Trade(pair=pair, stake_amount=0.01, amount=0.1,
+                                fee_open=fee.return_value, fee_close=fee.return_value,
+                                open_rate=0.1, close_rate=0.12, close_profit=0.2,
+                                exchange='bittrex', is_open=False,
+                                open_date=now - timedelta(days=3),
+                                close_date=now - timedelta(days=2)))
+    Trade.session.flush()
+    from_trade = ArchivedTrade.from_trade
+    mocker.patch('freqtrade.persistence.ArchivedTrade.from_trade',
+                 side_effect=[from_trade(trade) for trade in Trade.query.limit(1)]
+                 + [ValueError()])
+
+    with pytest.raises(ValueError):
+        archive_closed_trades(now)
+    # Nothing is moved if any of the trades fails
+    assert Trade.query.count() == 2
+    assert Trade.session.query(ArchivedTrade).count() == 0
+    assert Trade.session.query(TradeRollup).count() == 0
+
+
+def test_init_batch_commit_wal(default_conf, tmpdir):
+    default_conf['db_url'] = f"sqlite:///{tmpdir}/tradesv3.sqlite"
+    init(default_conf)
+    assert Trade.session.execute('PRAGMA journal_mode').scalar() != 'wal'
+
+    default_conf['db_url'] = f"sqlite:///{tmpdir}/tradesv3.batch.sqlite"
+    default_conf['internals'] = {'db_batch_commit': True}
+    init(default_conf)
+    assert Trade.session.execute('PRAGMA journal_mode').scalar() == 'wal'
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_transaction(fee):
+    commits = MagicMock()
+    event.listen(Trade.session, 'after_commit', commits)
+
+    def add_trade(pair):
+        Trade.session.add(Trade(pair=pair, stake_amount=0.001, amount=123.0,
+                                fee_open=fee.return_value, fee_close=fee.return_value,
+                                open_rate=0.123, exchange='bittrex'))
+        Trade.session.flush()
+
+    add_trade('ETH/BTC')
+    add_trade('ETC/BTC')
+    assert commits.call_count == 2
+
+    commits.reset_mock()
+    with transaction():
+        add_trade('ETH/BTC')
+        add_trade('ETC/BTC')
+        assert commits.call_count == 0
+    assert commits.call_count == 1
+    assert Trade.query.count() == 4
+
+    # Changes made before an exception are kept
+    commits.reset_mock()
+    with pytest.raises(ValueError):
+        with transaction():
+            add_trade('LTC/BTC')
+            raise ValueError()
+    assert commits.call_count == 1
+    assert Trade.query.filter(Trade.pair == 'LTC/BTC').count() == 1
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_calc_profit_percent(limit_buy_order, limit_sell_order, fee):
     trade = Trade(
@@ -524,6 +750,20 @@ def test_migrate_new(mocker, default_conf, fee, caplog):
                    caplog.record_tuples)
 
 
+def test_migrate_missing_index(mocker, default_conf, caplog):
+    caplog.set_level(logging.DEBUG)
+    engine = create_engine('sqlite://')
+    mocker.patch('freqtrade.persistence.create_engine', lambda *args, **kwargs: engine)
+    init(default_conf)
+    # Database created before the index on close_date was added
+    engine.execute("drop index ix_trades_close_date")
+
+    init(default_conf)
+    assert 'ix_trades_close_date' in [index['name']
+                                      for index in inspect(engine).get_indexes('trades')]
+    assert log_has('Creating index ix_trades_close_date', caplog.record_tuples)
+
+
 def test_migrate_mid_state(mocker, default_conf, fee, caplog):
     """
     Test Database migration (starting with new pairformat)
@@ -0,0 +1,71 @@
+# pragma pylint: disable=missing-docstring,C0103
+import json
+from pathlib import Path
+
+import pytest
+
+from freqtrade.timings import ProcessTimings
+
+
+def test_process_timings_stages() -> None:
+    timings = ProcessTimings(window=5)
+    with timings.iteration():
+        with timings.stage('refresh_data'):
+            pass
+        with timings.stage('buy'):
+            pass
+    assert timings.iterations == 1
+    summary = timings.summary()
+    assert [stats['stage'] for stats in summary] == ['refresh_data', 'buy', 'total']
+    assert set(summary[0].keys()) == {'stage', 'count', 'last', 'mean', 'max',
+                                      'p50', 'p90', 'p99'}
+    assert summary[2]['last'] >= summary[0]['last'] + summary[1]['last']
+
+
+def test_process_timings_records_on_exception() -> None:
+    timings = ProcessTimings(window=5)
+    with pytest.raises(ValueError):
+        with timings.iteration():
+            with timings.stage('sell'):
+                raise ValueError('failure')
+    assert timings.iterations == 1
+    assert [stats['stage'] for stats in timings.summary()] == ['sell', 'total']
+
+
+def test_process_timings_rolling_window() -> None:
+    timings = ProcessTimings(window=4)
+    for duration in [10, 1, 2, 3, 4]:
+        timings.record('buy', duration)
+    stats = timings.summary()[0]
+    # The first sample dropped out of the window
+    assert stats['count'] == 4
+    assert stats['max'] == 4
+    assert stats['last'] == 4
+    assert stats['mean'] == 2.5
+    assert stats['p50'] == 2.5
+    assert stats['p90'] == pytest.approx(3.7)
+
+    # Totals cover all samples
+    assert timings.totals() == {'buy': (5, 20.0)}
+
+    flat = timings.flat_summary()
+    assert flat['buy_p50'] == 2.5
+    assert flat['buy_count'] == 4
+    assert 'buy_stage' not in flat
+
+
+def test_process_timings_dump(tmpdir, caplog) -> None:
+    timings = ProcessTimings(window=4)
+    with timings.iteration():
+        pass
+    datadir = Path(str(tmpdir))
+    filename = datadir / 'timings.json'
+    timings.dump(filename)
+    content = json.loads(filename.read_text())
+    assert content['iterations'] == 1
+    assert content['window'] == 4
+    assert content['stages'][0]['stage'] == 'total'
+    assert not (datadir / 'timings.json.tmp').exists()
+
+    timings.dump(datadir / 'missing' / 'timings.json')
+    assert any('Could not write process timings to' in msg for _, _, msg in caplog.record_tuples)
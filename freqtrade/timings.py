@@ -0,0 +1,120 @@
+"""
+Wall time measurement of the stages of FreqtradeBot.process() and of hyperopt runs
+"""
+import json
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Name of the stage covering the whole iteration
+TOTAL_STAGE = 'total'
+
+PERCENTILES = (50, 90, 99)
+
+
+class ProcessTimings(object):
+    """
+    Keeps the wall time of the last `window` runs of every stage of the process loop,
+    and the number and total wall time of all runs of every stage
+    """
+
+    def __init__(self, window: int) -> None:
+        """
+        :param window: number of iterations the percentiles are calculated on
+        """
+        self.window = window
+        self.iterations = 0
+        self._samples: Dict[str, Deque[float]] = OrderedDict()
+        self._totals: Dict[str, Tuple[int, float]] = OrderedDict()
+
+    def record(self, name: str, duration: float) -> None:
+        """
+        Store the duration (in seconds) of one run of the given stage
+        """
+        if name not in self._samples:
+            self._samples[name] = deque(maxlen=self.window)
+        self._samples[name].append(duration)
+        count, total = self._totals.get(name, (0, 0.0))
+        self._totals[name] = (count + 1, total + duration)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure the wall time of the enclosed block as stage `name`.
+        The time is recorded even if the block raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    @contextmanager
+    def iteration(self) -> Iterator[None]:
+        """
+        Measure one complete iteration of the process loop
+        """
+        try:
+            with self.stage(TOTAL_STAGE):
+                yield
+        finally:
+            self.iterations += 1
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Rolling statistics per stage, in the order the stages were first seen.
+        All durations are in seconds.
+        :return: list of dicts with stage, count, last, mean, max and p<percentile> keys
+        """
+        result = []
+        for name, samples in self._samples.items():
+            values = np.array(samples)
+            stats: Dict[str, Any] = {
+                'stage': name,
+                'count': len(values),
+                'last': float(values[-1]),
+                'mean': float(values.mean()),
+                'max': float(values.max()),
+            }
+            for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                stats[f'p{percentile}'] = float(value)
+            result.append(stats)
+        return result
+
+    def totals(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Number of runs and their summed wall time (in seconds) per stage since the start,
+        not limited to the window, in the order the stages were first seen
+        """
+        return OrderedDict(self._totals)
+
+    def flat_summary(self) -> Dict[str, float]:
+        """
+        summary() as one flat dict with `<stage>_<statistic>` keys,
+        as used for the webhook payload
+        """
+        return {f"{stats['stage']}_{key}": value
+                for stats in self.summary()
+                for key, value in stats.items() if key != 'stage'}
+
+    def dump(self, filename: Path) -> None:
+        """
+        Write the current statistics as json to the given file.
+        The file is replaced atomically, so readers never see a partial file.
+        """
+        tmp_file = filename.with_name(filename.name + '.tmp')
+        try:
+            with tmp_file.open('w') as file:
+                json.dump({'iterations': self.iterations, 'window': self.window,
+                           'updated': time.time(), 'stages': self.summary()}, file)
+            os.replace(str(tmp_file), str(filename))
+        except OSError as error:
+            logger.warning('Could not write process timings to %s: %s', filename, error)
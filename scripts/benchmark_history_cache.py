@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Compare load times of the json ticker files against the binary (.npy) ticker cache.
+
+Usage:
+    python3 scripts/benchmark_history_cache.py --datadir user_data/data/binance -i 5m
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from freqtrade.data import history
+from freqtrade.data.converter import parse_ticker_dataframe
+
+
+def find_pairs(datadir: Path, ticker_interval: str) -> List[str]:
+    """
+    Find all pairs with json ticker files for the given ticker interval
+    """
+    pairs = set()
+    for pattern in (f'*-{ticker_interval}.json', f'*-{ticker_interval}.json.gz'):
+        for file in datadir.glob(pattern):
+            pairs.add(file.name.split(f'-{ticker_interval}.json')[0].replace('_', '/', 1))
+    return sorted(pairs)
+
+
+def load_json(datadir: Path, pair: str, ticker_interval: str) -> None:
+    tickerlist = history.load_tickerdata_file(datadir, pair, ticker_interval)
+    parse_ticker_dataframe(tickerlist, ticker_interval)
+
+
+def load_cache(datadir: Path, pair: str, ticker_interval: str) -> None:
+    history.load_pair_history(pair, ticker_interval, datadir, cache=True)
+
+
+def measure(func: Callable, datadir: Path, pairs: List[str],
+            ticker_interval: str, runs: int) -> float:
+    """
+    :return: best total load time for all pairs over all runs, in seconds
+    """
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        for pair in pairs:
+            func(datadir, pair, ticker_interval)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--datadir', help='Path to the ticker data files.',
+                        type=Path, default=history.make_testdata_path(None))
+    parser.add_argument('-i', '--ticker-interval', help='Ticker interval (default: %(default)s).',
+                        default='5m', dest='ticker_interval')
+    parser.add_argument('-p', '--pairs', help='Pairs to load (default: all pairs in datadir).',
+                        nargs='+')
+    parser.add_argument('--runs', help='Number of runs per format (default: %(default)d).',
+                        type=int, default=3)
+    parsed = parser.parse_args(args)
+
+    pairs = parsed.pairs or find_pairs(parsed.datadir, parsed.ticker_interval)
+    if not pairs:
+        print(f'No {parsed.ticker_interval} data found in {parsed.datadir}')
+        sys.exit(1)
+
+    # Make sure all caches exist and are up to date before measuring
+    for pair in pairs:
+        history.load_cached_tickerdata(parsed.datadir, pair, parsed.ticker_interval)
+
+    json_time = measure(load_json, parsed.datadir, pairs, parsed.ticker_interval, parsed.runs)
+    cache_time = measure(load_cache, parsed.datadir, pairs, parsed.ticker_interval, parsed.runs)
+
+    print(f'Pairs: {len(pairs)}, ticker interval: {parsed.ticker_interval}')
+    print(f'json:   {json_time:.3f}s')
+    print(f'cache:  {cache_time:.3f}s')
+    print(f'speedup: {json_time / cache_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
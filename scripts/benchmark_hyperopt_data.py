@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure the per-epoch cost of providing the processed ticker data to hyperopt workers:
+unpickling the data on every epoch against loading it once per worker process
+(freqtrade.optimize.hyperopt.load_processed).
+
+Usage:
+    python3 scripts/benchmark_hyperopt_data.py --pairs 40 --candles 50000 --epochs 64
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+from joblib import Parallel, delayed, dump, load
+from pandas import DataFrame, date_range
+
+from freqtrade.optimize.hyperopt import load_processed
+
+
+def build_processed(pairs: int, candles: int, indicators: int) -> Dict[str, DataFrame]:
+    """
+    Build random ticker data with the given number of indicator columns
+    """
+    rng = np.random.RandomState(42)
+    processed = {}
+    for num in range(pairs):
+        frame = DataFrame(rng.normal(size=(candles, 5 + indicators)),
+                          columns=['open', 'high', 'low', 'close', 'volume'] +
+                                  [f'indicator_{i}' for i in range(indicators)])
+        frame.insert(0, 'date', date_range('2018-01-01', periods=candles, freq='5min', tz='UTC'))
+        processed[f'PAIR{num}/BTC'] = frame
+    return processed
+
+
+def epoch_per_epoch_load(filename: str) -> int:
+    return len(load(filename))
+
+
+def epoch_cached_load(filename: str, run_id: Optional[str]) -> int:
+    return len(load_processed(run_id, filename))
+
+
+def run(parallel: Parallel, epochs: int, func, *args) -> float:
+    start = time.perf_counter()
+    parallel(delayed(func)(*args) for _ in range(epochs))
+    return (time.perf_counter() - start) / epochs
+
+
+def main(args: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pairs', type=int, default=20,
+                        help='Number of pairs (default: %(default)d).')
+    parser.add_argument('--candles', type=int, default=20000,
+                        help='Candles per pair (default: %(default)d).')
+    parser.add_argument('--indicators', type=int, default=30,
+                        help='Indicator columns per pair (default: %(default)d).')
+    parser.add_argument('--epochs', type=int, default=32,
+                        help='Number of epochs (default: %(default)d).')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help='Number of worker processes (default: %(default)d).')
+    parsed = parser.parse_args(args)
+
+    processed = build_processed(parsed.pairs, parsed.candles, parsed.indicators)
+    size_mb = sum(frame.memory_usage().sum() for frame in processed.values()) / 2**20
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'hyperopt_tickerdata.pkl')
+        dump(processed, filename)
+
+        with Parallel(n_jobs=parsed.jobs) as parallel:
+            # Start the worker processes (and import freqtrade there) before measuring
+            parallel(delayed(epoch_cached_load)(filename, None) for _ in range(parsed.jobs))
+            before = run(parallel, parsed.epochs, epoch_per_epoch_load, filename)
+            after = run(parallel, parsed.epochs, epoch_cached_load, filename, 'benchmark')
+
+    print(f'Processed data: {parsed.pairs} pairs, {size_mb:.1f} MB, {parsed.jobs} workers')
+    print(f'load per epoch:      {before * 1000:8.2f} ms / epoch')
+    print(f'load once per worker: {after * 1000:8.2f} ms / epoch')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Measure the RPC statistics queries against a database seeded with closed trades:
+/daily with one query per day (loading every trade) against one grouped query
+(freqtrade.rpc.RPC._rpc_daily_profit), and /profit loading every trade against
+the aggregates calculated in the database (freqtrade.rpc.RPC._rpc_trade_statistics),
+without and with their memoised result.
+
+Usage:
+    python3 scripts/benchmark_rpc_stats.py --trades 100000 --days 365
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from freqtrade.persistence import Trade, _clear_stats_cache, init
+from freqtrade.rpc import RPC
+
+
+class BenchmarkBot:
+    """
+    The parts of FreqtradeBot used by the measured RPC methods. All trades are closed,
+    so no rates are needed.
+    """
+    config = {'stake_currency': 'BTC'}
+
+    def get_sell_rates(self, pairs: Iterable[str]) -> Dict[str, float]:
+        return {}
+
+
+class BenchmarkRPC(RPC):
+    """
+    RPC handler without messages, to call the RPC backend methods
+    """
+    def cleanup(self) -> None:
+        pass
+
+    def send_msg(self, msg: Dict[str, str]) -> None:
+        pass
+
+
+def seed_trades(trades: int, days: int) -> None:
+    """
+    Insert closed trades with random rates, closed within the last `days` days
+    """
+    rng = np.random.RandomState(42)
+    now = datetime.utcnow()
+    close_dates = [now - timedelta(seconds=int(seconds))
+                   for seconds in rng.randint(0, days * 86400, size=trades)]
+    open_rates = rng.uniform(0.0001, 0.1, size=trades)
+    close_rates = open_rates * rng.uniform(0.9, 1.1, size=trades)
+    rows = [{
+        'exchange': 'binance',
+        'pair': f'PAIR{num % 50}/BTC',
+        'is_open': False,
+        'fee_open': 0.001,
+        'fee_close': 0.001,
+        'open_rate': float(open_rate),
+        'close_rate': float(close_rate),
+        'close_profit': float(close_rate * 0.999 / (open_rate * 1.001) - 1),
+        'stake_amount': 0.01,
+        'amount': float(0.01 / open_rate),
+        'open_date': close_date - timedelta(hours=1),
+        'close_date': close_date,
+    } for num, (open_rate, close_rate, close_date)
+        in enumerate(zip(open_rates, close_rates, close_dates))]
+    Trade.session.execute(Trade.__table__.insert(), rows)
+
+
+def daily_profit_per_day_queries(timescale: int) -> List:
+    """
+    /daily as implemented before the grouped query
+    """
+    today = datetime.utcnow().date()
+    profit_days = []
+    for day in range(0, timescale):
+        profitday = today - timedelta(days=day)
+        trades = Trade.query \
+            .filter(Trade.is_open.is_(False)) \
+            .filter(Trade.close_date >= profitday)\
+            .filter(Trade.close_date < (profitday + timedelta(days=1)))\
+            .order_by(Trade.close_date)\
+            .all()
+        profit_days.append((profitday, sum(trade.calc_profit() for trade in trades),
+                            len(trades)))
+    return profit_days
+
+
+def trade_statistics_all_trades() -> Tuple[float, float, float]:
+    """
+    The closed trade aggregates of /profit as calculated before the database did it
+    """
+    trades = Trade.query.order_by(Trade.id).all()
+    profit_closed_coin = [trade.calc_profit() for trade in trades if not trade.is_open]
+    profit_closed_percent = [trade.calc_profit_percent() for trade in trades
+                             if not trade.is_open]
+    durations = [(trade.close_date - trade.open_date).total_seconds() for trade in trades
+                 if trade.close_date]
+    return sum(profit_closed_coin), np.mean(profit_closed_percent), sum(durations)
+
+
+def measure(func: Callable, repeat: int, cached: bool = False) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+        # Don't measure the identity map of the session
+        Trade.session.expunge_all()
+        if not cached:
+            _clear_stats_cache()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(args: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trades', type=int, default=100000,
+                        help='Number of closed trades (default: %(default)d).')
+    parser.add_argument('--days', type=int, default=365,
+                        help='Days the trades are spread over, and /daily timescale '
+                             '(default: %(default)d).')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement (default: %(default)d).')
+    parsed = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        init({'db_url': f"sqlite:///{os.path.join(tmpdir, 'tradesv3.sqlite')}"})
+        seed_trades(parsed.trades, parsed.days)
+        rpc = BenchmarkRPC(BenchmarkBot())
+
+        before = measure(lambda: daily_profit_per_day_queries(parsed.days), parsed.repeat)
+        after = measure(lambda: rpc._rpc_daily_profit(parsed.days, 'BTC', 'USD'),
+                        parsed.repeat)
+
+        profit_before = measure(trade_statistics_all_trades, parsed.repeat)
+        profit_after = measure(lambda: rpc._rpc_trade_statistics('BTC', 'USD'),
+                               parsed.repeat)
+        profit_cached = measure(lambda: rpc._rpc_trade_statistics('BTC', 'USD'),
+                                parsed.repeat, cached=True)
+
+    print(f'/daily {parsed.days} on {parsed.trades} closed trades')
+    print(f'one query per day: {before * 1000:10.1f} ms')
+    print(f'grouped query:     {after * 1000:10.1f} ms')
+    print(f'/profit on {parsed.trades} closed trades')
+    print(f'all trades loaded: {profit_before * 1000:10.1f} ms')
+    print(f'database:          {profit_after * 1000:10.1f} ms')
+    print(f'memoised:          {profit_cached * 1000:10.1f} ms')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
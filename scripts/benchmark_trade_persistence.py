@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Measure the database time of bot loop iterations with open trades in a SQLite file,
+with one transaction per flush (default) against one transaction per iteration
+(internals.db_batch_commit, using WAL journaling).
+
+Every iteration replays the database access of FreqtradeBot.process(): load the open
+trades, move their min/max rates and trailing stoploss, query the open stakes for the
+buy stage and flush the timed out order check.
+
+Usage:
+    python3 scripts/benchmark_trade_persistence.py --trades 50 --iterations 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Any, ContextManager, List
+
+import numpy as np
+
+from freqtrade.persistence import Trade, init, transaction
+
+
+def seed_trades(trades: int) -> None:
+    """
+    Insert open trades with random rates
+    """
+    rng = np.random.RandomState(42)
+    for num, open_rate in enumerate(rng.uniform(0.0001, 0.1, size=trades)):
+        trade = Trade(
+            exchange='binance',
+            pair=f'PAIR{num}/BTC',
+            is_open=True,
+            fee_open=0.001,
+            fee_close=0.001,
+            open_rate=float(open_rate),
+            stake_amount=0.01,
+            amount=float(0.01 / open_rate),
+            open_date=datetime.utcnow(),
+        )
+        trade.adjust_min_max_rates(trade.open_rate)
+        trade.adjust_stop_loss(trade.open_rate, -0.1, initial=True)
+        Trade.session.add(trade)
+    Trade.session.flush()
+
+
+def process_iteration(rng: np.random.RandomState) -> None:
+    # refresh_data / sell
+    for trade in Trade.get_open_trades():
+        current_rate = trade.open_rate * rng.uniform(0.95, 1.05)
+        trade.adjust_min_max_rates(current_rate)
+        trade.adjust_stop_loss(current_rate, -0.1)
+        # Writes the trade, as a sell stage querying the database would
+        Trade.session.flush()
+    # buy
+    Trade.total_open_trades_stakes()
+    # check_timedout
+    Trade.query.filter(Trade.open_order_id.isnot(None)).all()
+    Trade.session.flush()
+
+
+def measure(db_url: str, trades: int, iterations: int, batch_commit: bool) -> float:
+    """
+    :return: mean time of one iteration in seconds
+    """
+    init({'db_url': db_url, 'internals': {'db_batch_commit': batch_commit}})
+    seed_trades(trades)
+    rng = np.random.RandomState(7)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        context: ContextManager[Any]
+        if batch_commit:
+            context = transaction()
+        else:
+            context = ExitStack()
+        with context:
+            process_iteration(rng)
+    return (time.perf_counter() - start) / iterations
+
+
+def main(args: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trades', type=int, default=50,
+                        help='Number of open trades (default: %(default)d).')
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='Bot loop iterations per measurement (default: %(default)d).')
+    parsed = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = {}
+        for batch_commit in (False, True):
+            db_file = os.path.join(tmpdir, f'tradesv3.{batch_commit}.sqlite')
+            results[batch_commit] = measure(f'sqlite:///{db_file}', parsed.trades,
+                                            parsed.iterations, batch_commit)
+
+    print(f'{parsed.iterations} iterations with {parsed.trades} open trades')
+    print(f'transaction per flush:     {results[False] * 1000:8.2f} ms per iteration')
+    print(f'transaction per iteration: {results[True] * 1000:8.2f} ms per iteration')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -42,7 +42,7 @@ from freqtrade.data import history
 from freqtrade.data.btanalysis import BT_DATA_COLUMNS, load_backtest_data
 from freqtrade.exchange import Exchange
 from freqtrade.optimize.backtesting import setup_configuration
-from freqtrade.persistence import Trade
+from freqtrade.persistence import ArchivedTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 
 logger = logging.getLogger(__name__)
@@ -61,13 +61,16 @@ def load_trades(args: Namespace, pair: str, timerange: TimeRange) -> pd.DataFram
         for x in Trade.query.all():
             print("date: {}".format(x.open_date))
 
+        # Trades moved out of the trades table by internals.archive_after_days come first
+        db_trades = (Trade.session.query(ArchivedTrade).filter(ArchivedTrade.pair.is_(pair)).all()
+                     + Trade.query.filter(Trade.pair.is_(pair)).all())
         trades = pd.DataFrame([(t.pair, t.calc_profit(),
                                 t.open_date.replace(tzinfo=timeZone),
                                 t.close_date.replace(tzinfo=timeZone) if t.close_date else None,
                                 t.open_rate, t.close_rate,
                                 t.close_date.timestamp() - t.open_date.timestamp()
                                 if t.close_date else None)
-                               for t in Trade.query.filter(Trade.pair.is_(pair)).all()],
+                               for t in db_trades],
                               columns=columns)
 
     elif args.exportfilename:
@@ -151,7 +154,8 @@ def get_tickers_data(strategy, exchange, pairs: List[str], args):
             ticker_interval=ticker_interval,
             refresh_pairs=_CONF.get('refresh_pairs', False),
             timerange=timerange,
-            exchange=Exchange(_CONF)
+            exchange=Exchange(_CONF),
+            workers=_CONF.get('data_load_workers', 1)
         )
 
     # No ticker found, impossible to download, len mismatch
@@ -124,7 +124,8 @@ def plot_profit(args: Namespace) -> None:
         pairs=pairs,
         ticker_interval=ticker_interval,
         refresh_pairs=False,
-        timerange=timerange
+        timerange=timerange,
+        workers=config.get('data_load_workers', 1)
     )
     dataframes = strategy.tickerdata_to_dataframe(tickers)
 
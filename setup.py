@@ -38,8 +38,7 @@ setup(name='freqtrade',
           'cachetools',
           'coinmarketcap',
           'scikit-optimize',
-          'python-rapidjson',
-          'py_find_1st'
+          'python-rapidjson'
       ],
       include_package_data=True,
       zip_safe=False,
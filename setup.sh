@@ -30,7 +30,7 @@ function updateenv() {
     echo "-------------------------"
     source .env/bin/activate
     echo "pip3 install in-progress. Please wait..."
-    # Install numpy first to have py_find_1st install clean
+    # Install numpy first to have TA-Lib install clean
     pip3 install --upgrade pip numpy
     pip3 install --upgrade -r requirements.txt
 